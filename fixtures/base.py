@@ -3,14 +3,54 @@
 import pytest
 from bs4 import BeautifulSoup
 
-__all__ = ['selenium', 'chrome_options', 'firefox_options']
+from utils.browser import DriverPool
+
+__all__ = ['browser_pool', 'selenium', 'chrome_options', 'firefox_options']
+
+# browser pool summaries sent back by xdist workers
+POOL_SUMMARIES = []
+
+
+def _reuse_browser(config):
+    """Return True if warm browsers are reused between tests."""
+    return bool(config.getoption('--reuse-browser') or
+                config.getini('reuse_browser'))
+
+
+@pytest.fixture(scope='session')
+def browser_pool(pytestconfig):
+    """Keep warm browsers for reuse by the tests in this process."""
+    pool = DriverPool(limit=pytestconfig.getoption('--browser-recycle'))
+    yield pool
+    pool.close()
+    summary = pool.summary()
+    if hasattr(pytestconfig, 'workeroutput'):
+        pytestconfig.workeroutput['browser_pool'] = summary
+    else:
+        POOL_SUMMARIES.append(summary)
 
 
 # https://docs.pytest.org/en/latest/example/simple.html
 # #making-test-result-information-available-in-fixtures
 @pytest.fixture
-def selenium(request, selenium, pytestconfig):
-    """Set default information for webdriver instances."""
+def selenium(request, pytestconfig):
+    """Set default information for webdriver instances.
+
+    With ``--reuse-browser`` the driver comes from the browser pool and is
+    reset, rather than quit, when the test is finished.
+
+    """
+    if _reuse_browser(pytestconfig):
+        pool = request.getfixturevalue('browser_pool')
+        driver_class = request.getfixturevalue('driver_class')
+        selenium = pool.acquire(
+            driver_class,
+            lambda: driver_class(**request.getfixturevalue('driver_kwargs')))
+        # used by pytest-selenium for failure screenshots and logs
+        request.node._driver = selenium
+        request.addfinalizer(lambda: pool.release(driver_class, selenium))
+    else:
+        selenium = request.getfixturevalue('driver')
     selenium.implicitly_wait(0)
     selenium.set_window_size(width=1024, height=768)
     yield selenium
@@ -75,3 +115,24 @@ def firefox_options(firefox_options, pytestconfig):
     firefox_options.add_argument(f'--user-agent="{firefox}"')
 
     return firefox_options
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the browser pool summary from an xdist worker."""
+    summary = getattr(node, 'workeroutput', {}).get('browser_pool')
+    if summary:
+        POOL_SUMMARIES.append(summary)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the setup time saved by reusing browsers."""
+    if not POOL_SUMMARIES:
+        return
+    total = {key: sum(summary[key] for summary in POOL_SUMMARIES)
+             for key in POOL_SUMMARIES[0]}
+    terminalreporter.write_sep('-', 'browser pool')
+    terminalreporter.write_line(
+        f'{total["started"]} browsers started, {total["reused"]} reused, '
+        f'{total["recycled"]} recycled, {total["crashed"]} crashed; '
+        f'about {total["saved"]:.1f}s of browser setup saved')
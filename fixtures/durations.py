@@ -0,0 +1,50 @@
+"""Record test durations and schedule xdist workers longest-first."""
+
+import pytest
+
+from utils.durations import DurationScheduling, DurationStore
+
+
+def _schedule_by_duration(config):
+    """Return True if xdist work is ordered by the recorded durations."""
+    return bool(config.getoption('--schedule-by-duration') or
+                config.getini('schedule_by_duration'))
+
+
+def pytest_configure(config):
+    """Load the recorded durations when the pytest cache is available."""
+    if getattr(config, 'cache', None) is not None:
+        DurationStore.active = DurationStore.load(config.cache)
+
+
+def pytest_unconfigure(config):
+    """Release the duration store."""
+    DurationStore.active = None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Hand out the longest test groups first when requested."""
+    if DurationStore.active is None or not _schedule_by_duration(config):
+        return None
+    return DurationScheduling(config, log, DurationStore.active)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the durations recorded by an xdist worker."""
+    recorded = getattr(node, 'workeroutput', {}).get('durations')
+    if recorded and DurationStore.active is not None:
+        DurationStore.active.recorded.update(recorded)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Send worker durations to the controller or save them."""
+    store = DurationStore.active
+    if store is None:
+        return
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['durations'] = store.recorded
+    else:
+        store.save(config.cache)
@@ -0,0 +1,62 @@
+"""Local mail sink fixtures."""
+
+import pytest
+
+from utils.email import RestMail
+from utils.mailsink import MailSink
+
+__all__ = ['mail_sink']
+
+# the sink started for the whole run by --mail-sink
+SESSION = {}
+
+
+def pytest_configure(config):
+    """Point RestMail at a configured or a local mail sink.
+
+    With xdist the controller runs the sink and the workers read it over
+    HTTP.
+    """
+    url = config.getoption('--restmail-url', None)
+    worker = getattr(config, 'workerinput', None)
+    if worker is not None:
+        url = worker.get('restmail_url', url)
+    elif config.getoption('--mail-sink', False) or config.getini('mail_sink'):
+        sink = MailSink(smtp_port=config.getoption('--mail-sink-port'))
+        SESSION['sink'] = sink.start()
+        url = sink.url
+    if url:
+        SESSION['url'] = RestMail.MAIL_URL
+        RestMail.configure(url)
+
+
+def pytest_unconfigure(config):
+    """Stop the run's mail sink and restore the RestMail URL."""
+    sink = SESSION.pop('sink', None)
+    if sink is not None:
+        sink.stop()
+    if 'url' in SESSION:
+        RestMail.configure(SESSION.pop('url'))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the controller's mail sink with an xdist worker."""
+    if 'sink' in SESSION:
+        node.workerinput['restmail_url'] = SESSION['sink'].url
+
+
+def pytest_report_header(config):
+    """Show where the local mail sink is listening."""
+    sink = SESSION.get('sink')
+    if sink is not None:
+        return (f'mail sink: smtp://{sink.host}:{sink.smtp_port} '
+                f'{sink.url}')
+
+
+@pytest.fixture
+def mail_sink(monkeypatch):
+    """Receive mail locally and point RestMail at it for one test."""
+    with MailSink() as sink:
+        monkeypatch.setattr(RestMail, 'MAIL_URL', sink.url)
+        yield sink
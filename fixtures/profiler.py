@@ -0,0 +1,80 @@
+"""Profile the WebDriver commands issued by each test's page objects."""
+
+import os
+
+import pytest
+
+from utils.profiler import WebDriverProfiler, report_path
+
+
+def _profile_dir(config):
+    """Return the report directory when profiling is requested."""
+    if not (config.getoption('--profile-webdriver', False) or
+            config.getini('profile_webdriver')):
+        return None
+    return config.getoption('--profile-dir')
+
+
+def pytest_configure(config):
+    """Wrap the WebDriver commands when profiling is requested."""
+    if _profile_dir(config):
+        WebDriverProfiler().install()
+
+
+def pytest_unconfigure(config):
+    """Restore the WebDriver commands."""
+    if WebDriverProfiler.active is not None:
+        WebDriverProfiler.active.uninstall()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Charge the commands of a test's setup, call and teardown to it."""
+    profiler = WebDriverProfiler.active
+    if profiler is None:
+        yield
+        return
+    profiler.start(item.nodeid)
+    try:
+        yield
+    finally:
+        profile = profiler.finish()
+        if profile is not None and profile.calls:
+            profile.write(report_path(_profile_dir(item.config), item.nodeid))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the session profile recorded by an xdist worker."""
+    recorded = getattr(node, 'workeroutput', {}).get('webdriver_profile')
+    if recorded and WebDriverProfiler.active is not None:
+        WebDriverProfiler.active.session.merge(recorded)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Send the worker profile to the controller or write the report."""
+    profiler = WebDriverProfiler.active
+    if profiler is None:
+        return
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['webdriver_profile'] = profiler.session.to_dict()
+    elif profiler.session.calls:
+        profiler.session.write(
+            os.path.join(_profile_dir(config), 'session'))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show the page object methods spending the most WebDriver time."""
+    profiler = WebDriverProfiler.active
+    if profiler is None or not profiler.session.calls:
+        return
+    report = profiler.session.report()
+    terminalreporter.write_sep(
+        '-', f'webdriver profile: {report["count"]} commands in '
+             f'{report["seconds"]:.2f}s')
+    for row in report['methods'][:10]:
+        terminalreporter.write_line(
+            f'{row["seconds"]:9.3f}s {row["count"]:7d}  {row["method"]}')
+    terminalreporter.write_line(
+        f'reports: {os.path.abspath(_profile_dir(config))}')
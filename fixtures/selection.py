@@ -0,0 +1,209 @@
+"""Select the collected tests using precomputed marker bitsets.
+
+Each collected item is reduced to one integer with a bit for every marker
+the runtime options filter on. The smoke, TestRail, system, headless and
+Flake8 options then become one required mask and one excluded mask, so
+selecting an item is two bitwise operations. The bitsets are kept in the
+pytest cache until one of the collected test files changes.
+
+"""
+
+import os
+from hashlib import sha256
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+import pytest
+
+SYSTEMS = ('accounts', 'biglearn', 'exercises',
+           'payments', 'support', 'tutor', 'web')
+MARKERS = ('smoke_test', 'testrail', 'skip_if_headless', 'social') + SYSTEMS
+# the TestRail case decorator imported into the test modules is collected as
+# a test function named test_case
+GENERIC = 'test_case'
+FLAKE8 = 'flake8'
+BITS = {name: 1 << position
+        for position, name in enumerate(MARKERS + (GENERIC, FLAKE8))}
+
+# collection timing for the terminal report
+TIMING = {}
+
+
+class MarkerIndex(object):
+    """Marker bitsets for the collected items, cached by file mtimes."""
+
+    CACHE_KEY = 'os-automation/markers'
+    # bump when the bit layout changes
+    VERSION = 1
+
+    def __init__(self, cache=None, root: str = '') -> None:
+        """Set the cache used between runs.
+
+        :param cache: (optional) the pytest cache
+        :type cache: :py:class:`~_pytest.cacheprovider.Cache`
+        :param str root: (optional) the directory test node IDs start from
+        :return: None
+
+        """
+        self.cache = cache
+        self.root = root
+        self.cached = False
+
+    def masks(self, items) -> List[int]:
+        """Return the marker bitset for each item.
+
+        :param items: the collected test items
+        :type items: list(:py:class:`~_pytest.nodes.Item`)
+        :return: the bitsets in item order
+        :rtype: list(int)
+
+        """
+        key = self.key(items)
+        stored = (self.cache.get(self.CACHE_KEY, {})
+                  if self.cache is not None else {})
+        known: Dict[str, int] = {}
+        if stored.get('key') == key:
+            known = stored.get('masks', {})
+        self.cached = bool(known)
+        masks = []
+        for item in items:
+            mask = known.get(item.nodeid)
+            if mask is None:
+                self.cached = False
+                mask = self.mask(item)
+            masks.append(mask)
+        if self.cache is not None and not self.cached:
+            self.cache.set(self.CACHE_KEY, {
+                'key': key,
+                'masks': {item.nodeid: mask
+                          for item, mask in zip(items, masks)}})
+        return masks
+
+    def key(self, items) -> str:
+        """Return a digest of the collected files and their mtimes.
+
+        :param items: the collected test items
+        :type items: list(:py:class:`~_pytest.nodes.Item`)
+        :return: the cache key
+        :rtype: str
+
+        """
+        files = {item.nodeid.split('::')[0] for item in items}
+        files.update(('tests/conftest.py', 'tests/markers.py'))
+        digest = sha256(str(self.VERSION).encode('utf-8'))
+        for name in sorted(files):
+            try:
+                mtime = os.stat(os.path.join(self.root, name)).st_mtime_ns
+            except OSError:
+                mtime = 0
+            digest.update(f'{name}\0{mtime}\0'.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def mask(item) -> int:
+        """Return the marker bitset for one item.
+
+        :param item: a collected test item
+        :type item: :py:class:`~_pytest.nodes.Item`
+        :return: the item's marker bits
+        :rtype: int
+
+        """
+        keywords = item.keywords
+        mask = 0
+        for name in MARKERS:
+            if name in keywords:
+                mask |= BITS[name]
+        kind = type(item).__name__
+        if kind == 'Function' and item.name.startswith(GENERIC):
+            mask |= BITS[GENERIC]
+        elif kind == 'Flake8Item':
+            mask |= BITS[FLAKE8]
+        return mask
+
+
+def selection_masks(config) -> Tuple[int, int]:
+    """Return the required and excluded marker bits for the run options.
+
+    :param config: the pytest configuration
+    :type config: :py:class:`~_pytest.config.Config`
+    :return: the bits every selected item must have and the bits no
+        selected item may have
+    :rtype: tuple(int, int)
+
+    """
+    required = 0
+    if config.getoption('--smoke-test') or config.getini('smoke_test'):
+        required |= BITS['smoke_test']
+    if config.getoption('--testrail') or config.getini('testrail'):
+        required |= BITS['testrail']
+
+    excluded = BITS[GENERIC]
+    if config.getoption('--strip-flake') or config.getini('strip_flake8'):
+        excluded |= BITS[FLAKE8]
+    run_systems = config.getoption('--systems') or config.getini('systems')
+    if run_systems:
+        for system in SYSTEMS:
+            if system not in run_systems:
+                excluded |= BITS[system]
+    if config.getoption('--headless') or config.getini('headless_browsing'):
+        excluded |= BITS['skip_if_headless']
+    return required, excluded
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection(session):
+    """Start the collection timer."""
+    TIMING['start'] = perf_counter()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Runtime test options."""
+    start = perf_counter()
+    root = str(getattr(config, 'rootpath', None) or config.rootdir)
+    index = MarkerIndex(getattr(config, 'cache', None), root)
+    required, excluded = selection_masks(config)
+
+    run_social = config.getoption('--run-social')
+    mark_run_social = pytest.mark.skip(reason='Skipping non-social tests.')
+    skip_social = config.getoption('--skip-social')
+    mark_skip_social = pytest.mark.skip(reason='Skipping social login tests.')
+    social = BITS['social']
+
+    deselected = []
+    remaining = []
+    for item, mask in zip(items, index.masks(items)):
+        if mask & required != required or mask & excluded:
+            deselected.append(item)
+            continue
+        remaining.append(item)
+
+        # Apply runtime markers
+        if skip_social and mask & social:
+            item.add_marker(mark_skip_social)
+        if run_social and not mask & social:
+            item.add_marker(mark_run_social)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = remaining
+
+    # If requested, shuffle the test list
+    if config.getoption('--randomize') or config.getini('randomize'):
+        from random import shuffle
+        shuffle(items)
+
+    TIMING.update(selection=perf_counter() - start, cached=index.cached,
+                  total=len(remaining) + len(deselected),
+                  selected=len(remaining))
+
+
+def pytest_report_collectionfinish(config, items):
+    """Report the collection and selection time."""
+    if 'selection' not in TIMING:
+        return None
+    collection = perf_counter() - TIMING.get('start', perf_counter())
+    return (f'selected {TIMING["selected"]} of {TIMING["total"]} items in '
+            f'{TIMING["selection"]:.3f}s '
+            f'({"cached" if TIMING["cached"] else "new"} marker index); '
+            f'collection took {collection:.2f}s')
@@ -1,43 +1,257 @@
-"""Execusion JSON test snapshots."""
+"""Execusion JSON test snapshots.
 
+Snapshots are read once per session and compared in memory. A snapshot
+seen for the first time is buffered and written when the session ends,
+under a file lock shared by the xdist workers, so a new snapshot is never
+half written or written twice. With ``--snapshot-archive`` the snapshots
+are kept in one compressed archive instead of a file per snapshot. The
+terminal summary lists the snapshots that did not match and counts the
+stored snapshots no test compared.
+
+"""
+
+from __future__ import annotations
+
+import gzip
 import json
 import os
+from typing import Any, Dict, List, Optional, Set
 
 import pytest
+from filelock import FileLock
 
 __all__ = ['snapshot']
 
 SNAPSHOT_BASE_DIR = os.path.join(os.path.realpath(os.path.dirname(__file__)),
                                  '../snapshots')
 
+# a stored snapshot that was looked for and not found
+MISSING = object()
 
-class Snapshot(object):
+
+class SnapshotStore(object):
     """JSON snapshots for test failures."""
 
-    def __init__(self, base_dir):
-        """Set the base directory."""
+    ARCHIVE = 'snapshots.json.gz'
+    LOCK = '.snapshots.lock'
+    LOCK_TIMEOUT = 60.0
+
+    active: Optional[SnapshotStore] = None
+
+    def __init__(self, base_dir: str, archive: bool = False) -> None:
+        """Set the base directory and storage format.
+
+        :param str base_dir: the snapshot directory
+        :param bool archive: (optional) keep the snapshots in a single
+            compressed archive instead of a file per snapshot
+        :return: None
+
+        """
         self.base_dir = base_dir
+        self.archive = archive
+        self.buffered: Dict[str, Any] = {}
+        self.used: Set[str] = set()
+        self.stale: Set[str] = set()
+        self.written = 0
+        self._stored: Dict[str, Any] = {}
+        self._archive: Optional[Dict[str, Any]] = None
+
+    def assert_match(self, value, name: str) -> None:
+        """Compare a value with its snapshot or buffer a new snapshot.
+
+        :param value: a JSON serializable value
+        :param str name: the snapshot path below the base directory
+        :return: None
 
-    def assert_match(self, value, name):
-        """Return True if the snapshots match."""
-        snapshot_path = os.path.join(self.base_dir, name)
-        snapshot_dir = os.path.dirname(snapshot_path)
-
-        if not os.path.isdir(snapshot_dir):
-            os.makedirs(snapshot_dir, 0o755)
-
-        with open(snapshot_path, 'a+') as snapshot_file:
-            snapshot_file.seek(0)
-            snapshot = snapshot_file.read()
-            if snapshot:
-                assert value == json.loads(snapshot), (
-                    'Value did not match snapshot.\n\n' +
-                    f'Value:\n\n{value}\n\nSnapshot:\n\n{snapshot}')
+        :raises AssertionError: if the value does not match the snapshot
+
+        """
+        self.used.add(name)
+        snapshot = self.get(name)
+        if snapshot is MISSING:
+            self.buffered[name] = json.loads(json.dumps(value))
+            return
+        if value != snapshot:
+            self.stale.add(name)
+            raise AssertionError(
+                'Value did not match snapshot.\n\n' +
+                f'Value:\n\n{value}\n\nSnapshot:\n\n{json.dumps(snapshot)}')
+
+    def get(self, name: str) -> Any:
+        """Return a stored or buffered snapshot.
+
+        The archive is read on the first request and a snapshot file on the
+        first request for that name.
+
+        :param str name: the snapshot path below the base directory
+        :return: the decoded snapshot or :py:data:`MISSING`
+        :rtype: Any
+
+        """
+        if name in self.buffered:
+            return self.buffered[name]
+        if self.archive:
+            archived = self._load_archive().get(name, MISSING)
+            if archived is not MISSING:
+                return archived
+        if name not in self._stored:
+            self._stored[name] = self._read_file(name)
+        return self._stored[name]
+
+    def flush(self) -> int:
+        """Write the buffered snapshots.
+
+        Snapshots written by another worker since they were read are kept.
+
+        :return: the number of snapshots written
+        :rtype: int
+
+        """
+        if not self.buffered:
+            return 0
+        os.makedirs(self.base_dir, 0o755, exist_ok=True)
+        written = 0
+        with FileLock(os.path.join(self.base_dir, self.LOCK),
+                      timeout=self.LOCK_TIMEOUT):
+            if self.archive:
+                archived = self._read_archive()
+                new = {name: value for name, value in self.buffered.items()
+                       if name not in archived}
+                if new:
+                    archived.update(new)
+                    self._replace(
+                        self.ARCHIVE,
+                        gzip.compress(json.dumps(
+                            archived, sort_keys=True,
+                            separators=(',', ':')).encode('utf-8')))
+                self._archive = archived
+                written = len(new)
             else:
-                snapshot_file.write(json.dumps(value))
+                for name, value in self.buffered.items():
+                    if os.path.exists(os.path.join(self.base_dir, name)):
+                        continue
+                    self._replace(name, json.dumps(value).encode('utf-8'))
+                    self._stored[name] = value
+                    written += 1
+        self.buffered = {}
+        self.written += written
+        return written
+
+    def stored_names(self) -> Set[str]:
+        """Return the names of the snapshots on disk.
+
+        :return: the snapshot names
+        :rtype: set(str)
+
+        """
+        names = set(self._load_archive()) if self.archive else set()
+        for directory, _, files in os.walk(self.base_dir):
+            for filename in files:
+                if (filename in (self.ARCHIVE, self.LOCK) or
+                        filename.endswith('.tmp')):
+                    continue
+                names.add(os.path.relpath(os.path.join(directory, filename),
+                                          self.base_dir))
+        return names
+
+    def unused(self) -> List[str]:
+        """Return the stored snapshots no test compared.
+
+        :return: the unused snapshot names
+        :rtype: list(str)
+
+        """
+        return sorted(self.stored_names() - self.used)
+
+    def _load_archive(self) -> Dict[str, Any]:
+        """Return the archive, reading it on the first request."""
+        if self._archive is None:
+            self._archive = self._read_archive()
+        return self._archive
+
+    def _read_archive(self) -> Dict[str, Any]:
+        """Read the archive from disk."""
+        try:
+            with gzip.open(os.path.join(self.base_dir, self.ARCHIVE)) \
+                    as archive:
+                return json.load(archive)
+        except FileNotFoundError:
+            return {}
+
+    def _read_file(self, name: str) -> Any:
+        """Read one snapshot file from disk."""
+        try:
+            with open(os.path.join(self.base_dir, name)) as snapshot_file:
+                snapshot = snapshot_file.read()
+        except FileNotFoundError:
+            return MISSING
+        return json.loads(snapshot) if snapshot else MISSING
+
+    def _replace(self, name: str, data: bytes) -> None:
+        """Write a file atomically."""
+        path = os.path.join(self.base_dir, name)
+        os.makedirs(os.path.dirname(path), 0o755, exist_ok=True)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as snapshot_file:
+            snapshot_file.write(data)
+        os.replace(temporary, path)
+
+
+def pytest_configure(config):
+    """Start the session snapshot store."""
+    SnapshotStore.active = SnapshotStore(
+        SNAPSHOT_BASE_DIR,
+        archive=bool(config.getoption('--snapshot-archive', False) or
+                     config.getini('snapshot_archive')))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the snapshots compared by an xdist worker."""
+    output = getattr(node, 'workeroutput', {}).get('snapshots')
+    store = SnapshotStore.active
+    if output and store is not None:
+        store.used.update(output['used'])
+        store.stale.update(output['stale'])
+        store.written += output['written']
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the new snapshots and send the worker results."""
+    store = SnapshotStore.active
+    if store is None:
+        return
+    store.flush()
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['snapshots'] = {
+            'used': sorted(store.used), 'stale': sorted(store.stale),
+            'written': store.written}
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the stale and unused snapshots."""
+    store = SnapshotStore.active
+    if store is None or not (store.used or store.written):
+        return
+    unused = store.unused()
+    terminalreporter.write_sep('-', 'snapshots')
+    terminalreporter.write_line(
+        f'{len(store.used)} compared, {store.written} written, '
+        f'{len(store.stale)} stale, {len(unused)} unused')
+    for name in sorted(store.stale):
+        terminalreporter.write_line(f'stale: {name}')
+    if config.getoption('verbose') > 0:
+        for name in unused:
+            terminalreporter.write_line(f'unused: {name}')
+
+
+def pytest_unconfigure(config):
+    """Release the snapshot store."""
+    SnapshotStore.active = None
 
 
 @pytest.fixture(scope='session')
 def snapshot(request):
     """Return an object that can save and compare snapshots."""
-    return Snapshot(SNAPSHOT_BASE_DIR)
+    return SnapshotStore.active or SnapshotStore(SNAPSHOT_BASE_DIR)
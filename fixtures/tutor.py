@@ -2,7 +2,9 @@
 
 import pytest
 
-__all__ = ['tutor_base_url']
+from utils.tutorapi import HTTPTransport, TutorFactory
+
+__all__ = ['tutor_base_url', 'tutor_factory', 'tutor_course']
 SPLIT = 'tutor'
 
 
@@ -22,3 +24,22 @@ def tutor_base_url(request):
         return '{0}{2}{3}{1}'.format(*segments, SPLIT, insert)
     if base_url is not None:
         return base_url
+
+
+@pytest.fixture
+def tutor_factory(request, tutor_base_url, selenium, teacher):
+    """Return a Tutor data factory using the teacher's logged in session."""
+    from pages.tutor.home import TutorHome
+    TutorHome(selenium, tutor_base_url).open().log_in(*teacher)
+    config = request.config
+    instance = (config.getoption('instance') or
+                config.getini('instance')).lower()
+    return TutorFactory(HTTPTransport.from_driver(selenium, tutor_base_url),
+                        instance=instance,
+                        cache=getattr(config, 'cache', None))
+
+
+@pytest.fixture
+def tutor_course(tutor_factory):
+    """Return the default seeded Tutor course for the instance."""
+    return tutor_factory.seed()
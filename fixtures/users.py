@@ -2,6 +2,8 @@
 
 import pytest
 
+from utils.sessions import SessionCache
+
 __all__ = ['student', 'teacher', 'admin', 'content',
            'salesforce',
            'facebook', 'facebook_signup',
@@ -29,6 +31,21 @@ PROD = ['prod', 'production']
 UNIQUE = 'unique'
 
 
+def pytest_configure(config):
+    """Activate the shared log in session cache when requested."""
+    if not (config.getoption('--cache-logins', False) or
+            config.getini('cache_logins')):
+        return
+    SessionCache.active = SessionCache(
+        config.cache.makedir('sessions'),
+        ttl=config.getoption('--login-ttl'))
+
+
+def pytest_unconfigure(config):
+    """Deactivate the log in session cache."""
+    SessionCache.active = None
+
+
 @pytest.fixture(scope='module')
 def student(request):
     """Set the student user information."""
@@ -2,13 +2,97 @@
 
 from datetime import datetime
 from time import sleep
+from typing import List, NamedTuple, Tuple
 
 from pypom import Region
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as expect
 
 from pages.accounts.admin.base import AccountsAdmin
 from pages.accounts.base import AccountsBase
 from utils.utilities import Utility, go_to_
+from utils.wait import Wait
+
+# -------------------------------------------------------- #
+# Javascript page requests
+# -------------------------------------------------------- #
+
+# read every search result summary row and its details row
+USER_ROWS = (
+    'var last = function (node) {'
+    '  return node ? node.innerHTML.split(">").pop().trim() : ""; };'
+    'var value = function (node) {'
+    '  return node ? node.textContent.split(":").pop().trim() : ""; };'
+    'var text = function (row, selector) {'
+    '  var node = row.querySelector(selector);'
+    '  return node ? node.textContent.trim() : ""; };'
+    'var rows = [], summaries = document.querySelectorAll("tr");'
+    'for (var index = 1; index < summaries.length; index += 2) {'
+    '  var row = summaries[index], details = row.nextElementSibling;'
+    '  if (!details || !details.classList.contains("details")) {'
+    '    details = document.createElement("tr"); }'
+    '  rows.push({'
+    '    id: text(row, "[href$=edit]"),'
+    '    first_name: text(row, "td:nth-child(3)"),'
+    '    last_name: text(row, "td:nth-child(4)"),'
+    '    username: text(row, "td:nth-child(5)"),'
+    '    faculty: text(row, "td:nth-child(6)"),'
+    '    role: text(row, "td:nth-child(7)"),'
+    '    school_type: text(row, "td:nth-child(8)"),'
+    '    created_on: last(details.querySelector(".created")),'
+    '    updated_on: last(details.querySelector(".updated")),'
+    '    full_name: text(details, ".full-name"),'
+    '    state: value(details.querySelector(".state")),'
+    '    uuid: value(details.querySelector(".uuid")),'
+    '    support_id: value(details.querySelector(".support_identifier")),'
+    '    emails: Array.prototype.map.call('
+    '      details.querySelectorAll(".email"), function (email) {'
+    '        var address = email.querySelector("a");'
+    '        return [address ? address.textContent.trim() : "",'
+    '                last(email) == "(confirmed)"]; })'
+    '  });'
+    '}'
+    'return rows;')
+
+
+class UserRecord(NamedTuple):
+    """An account from the admin user search results."""
+
+    id: str
+    first_name: str
+    last_name: str
+    username: str
+    faculty: str
+    role: str
+    school_type: str
+    created_on: datetime
+    updated_on: datetime
+    full_name: str
+    state: str
+    uuid: str
+    support_id: str
+    emails: Tuple[Tuple[str, bool], ...]
+
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S %z'
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from the values read from a result row pair."""
+        fields = dict(row)
+        for field in ('created_on', 'updated_on'):
+            fields[field] = (datetime.strptime(fields[field], cls.DATE_FORMAT)
+                             if fields.get(field) else None)
+        fields['emails'] = tuple((address, bool(confirmed))
+                                 for address, confirmed
+                                 in fields.get('emails', []))
+        return cls(**{field: fields.get(field, '')
+                      for field in cls._fields})
+
+    @property
+    def confirmed_emails(self):
+        """Return the confirmed email addresses."""
+        return [address for address, confirmed in self.emails if confirmed]
 
 
 class SearchHelp(AccountsBase):
@@ -33,6 +117,7 @@ class Search(AccountsAdmin):
     _search_help_locator = (By.CSS_SELECTOR, '.user-search-help a')
 
     _row_locator = (By.CSS_SELECTOR, 'tr')
+    _next_page_locator = (By.CSS_SELECTOR, '.pagination a[rel=next]')
 
     def search_for(self, **terms):
         """Enter the search terms or name.
@@ -102,33 +187,89 @@ class Search(AccountsAdmin):
         return go_to_(SearchHelp(self.driver))
 
     def submit_search(self):
-        """Click the search button."""
+        """Click the search button and wait for the results to update."""
         search = self.find_element(*self._search_button_locator)
-        Utility.click_option(self.driver, element=search)
+        self._await_results(lambda: Utility.click_option(
+            self.driver, element=search))
         return self
 
     def find(self, terms, ordering=None):
         """Search for a set of terms and order the results."""
         self.search_for(**terms)
-        sleep(0.5)
         if ordering:
             self.order_by(**ordering)
-            sleep(0.5)
         self.submit_search()
-        sleep(1.0)
         self.wait_for_page_to_load()
         return self
 
     @property
     def users(self):
         """Access the search results."""
-        results = []
-        for index, row in enumerate(self.find_elements(*self._row_locator)):
-            if index == 0:
-                continue
-            if index % 2 == 1:
-                results.append(self.Result(self, row, index + 2))
-        return results
+        rows = self.find_elements(*self._row_locator)
+        records = self.records
+        return [self.Result(self, rows[position], position + 2, record)
+                for position, record in zip(range(1, len(rows), 2), records)]
+
+    @property
+    def records(self) -> List[UserRecord]:
+        """Return the current page of search results as user records.
+
+        The summary and details rows are read with a single script call.
+
+        :return: the user records in display order
+        :rtype: list(:py:class:`~pages.accounts.admin.users.UserRecord`)
+
+        """
+        return [UserRecord.from_row(row)
+                for row in self.driver.execute_script(USER_ROWS)]
+
+    @property
+    def has_next_page(self):
+        """Return True if the results continue on another page."""
+        return bool(self.find_elements(*self._next_page_locator))
+
+    def next_page(self):
+        """Display the next page of search results."""
+        link = self.find_element(*self._next_page_locator)
+        self._await_results(lambda: Utility.click_option(
+            self.driver, element=link))
+        self.wait_for_page_to_load()
+        return self
+
+    def iter_records(self, pages=None):
+        """Yield the user records page by page.
+
+        The next results page is only requested once the records on the
+        current page are consumed.
+
+        :param int pages: (optional) the maximum number of result pages to
+            read; defaults to every page
+        :return: the user records across the result pages
+        :rtype: iterator(:py:class:`~pages.accounts.admin.users.UserRecord`)
+
+        """
+        page = 0
+        while True:
+            yield from self.records
+            page += 1
+            if (pages is not None and page >= pages) or \
+                    not self.has_next_page:
+                return
+            self.next_page()
+
+    def _await_results(self, action):
+        """Run an action then wait until the result rows are replaced."""
+        rows = self.find_elements(*self._row_locator)
+        action()
+        if not rows:
+            Wait.for_settled(self.driver)
+            return
+        try:
+            self.wait.until(expect.staleness_of(rows[0]))
+        except TimeoutException:
+            # identical results may be left in place
+            pass
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
 
     class Result(Region):
         """A pair of rows containing account information."""
@@ -146,13 +287,19 @@ class Search(AccountsAdmin):
 
         DETAILS = 'tr.details:nth-child({index}) '
 
-        def __init__(self, page, root, pos):
-            """Override the initialization to include a position number."""
+        def __init__(self, page, root, pos, record=None):
+            """Override the initialization to include a position number.
+
+            When a user record is given, the account fields are read from it
+            instead of the table.
+            """
             super(Region, self).__init__(page.driver, page.timeout, pm=page.pm)
             self._root = root
             self.page = page
-            self.wait_for_region_to_load()
+            self.record = record
             self._index = pos
+            if record is None:
+                self.wait_for_region_to_load()
             self._created_on_locator = (
                 self.DETAILS.format(index=pos) + '.created')
             self._updated_on_locator = (
@@ -183,36 +330,50 @@ class Search(AccountsAdmin):
         @property
         def id(self):
             """Return the Account ID."""
+            if self.record:
+                return self.record.id
             return self.find_element(*self._user_id_locator).text
 
         @property
         def first_name(self):
             """Return the user's first name."""
+            if self.record:
+                return self.record.first_name
             return self.find_element(*self._first_name_locator).text
 
         @property
         def last_name(self):
             """Return the user's last name."""
+            if self.record:
+                return self.record.last_name
             return self.find_element(*self._last_name_locator).text
 
         @property
         def username(self):
             """Return the account username."""
+            if self.record:
+                return self.record.username
             return self.find_element(*self._username_locator).text
 
         @property
         def faculty(self):
             """Return the faculty status for the account."""
+            if self.record:
+                return self.record.faculty
             return self.find_element(*self._faculty_status_locator).text
 
         @property
         def role(self):
             """Return the user's self-reported role."""
+            if self.record:
+                return self.record.role
             return self.find_element(*self._role_locator).text
 
         @property
         def school_type(self):
             """Return the account's associated school type."""
+            if self.record:
+                return self.record.school_type
             return self.find_element(*self._school_type_locator).text
 
         def impersonate(self):
@@ -230,6 +391,8 @@ class Search(AccountsAdmin):
         @property
         def created_on(self):
             """Return the account creation date and time."""
+            if self.record:
+                return self.record.created_on
             return self._get_date_time(
                 self._get_from_details(self._created_on_locator)
                 .get_attribute('innerHTML'))
@@ -237,6 +400,8 @@ class Search(AccountsAdmin):
         @property
         def updated_on(self):
             """Return the most recent update date and time."""
+            if self.record:
+                return self.record.updated_on
             return self._get_date_time(
                 self._get_from_details(self._updated_on_locator)
                 .get_attribute('innerHTML'))
@@ -244,6 +409,8 @@ class Search(AccountsAdmin):
         @property
         def full_name(self):
             """Return the account user's full name."""
+            if self.record:
+                return self.record.full_name
             return self._get_from_details(self._full_name_locator).text
 
         def view_security_log(self):
@@ -256,24 +423,33 @@ class Search(AccountsAdmin):
         @property
         def state(self):
             """Return the account state."""
+            if self.record:
+                return self.record.state
             return self._get_field_value(
                 self._get_from_details(self._state_locator).text)
 
         @property
         def uuid(self):
             """Return the account UUID."""
+            if self.record:
+                return self.record.uuid
             return self._get_field_value(
                 self._get_from_details(self._uuid_locator).text)
 
         @property
         def support_id(self):
             """Return the account support identification number."""
+            if self.record:
+                return self.record.support_id
             return self._get_field_value(
                 self._get_from_details(self._support_identifier_locator).text)
 
         @property
         def emails(self):
             """Return the emails associated with the account."""
+            if self.record:
+                return [self.Email(self, record=email)
+                        for email in self.record.emails]
             return [self.Email(self, el)
                     for el in self._get_from_details(self._emails_locator,
                                                      True)]
@@ -283,14 +459,27 @@ class Search(AccountsAdmin):
 
             _address_locator = (By.TAG_NAME, 'a')
 
+            def __init__(self, page, root=None, record=None):
+                """Hold onto the address and confirmation from the record.
+
+                When a record is given, the email fields are read from it
+                instead of the table.
+                """
+                super().__init__(page, root)
+                self.record = record
+
             @property
             def email(self):
                 """Return the email address."""
+                if self.record:
+                    return self.record[0]
                 return self.find_element(*self._address_locator).text
 
             @property
             def is_confirmed(self):
                 """Return True if the email has been confirmed."""
+                if self.record:
+                    return self.record[1]
                 status = (self.root.get_attribute('innerHTML')
                           .split('>')[-1].strip())
                 return status == '(confirmed)'
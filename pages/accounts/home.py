@@ -14,6 +14,7 @@ from regions.accounts.fields import ERROR_SELECTOR
 from regions.accounts.social import SocialLogins
 from utils.accounts import AccountsException
 from utils.email import RestMail
+from utils.sessions import SessionCache
 from utils.utilities import Utility, go_to_
 
 
@@ -36,9 +37,19 @@ class AccountsHome(AccountsBase):
         :rtype: :py:class:`~pypom.Page`
 
         """
-        self.content.email = username
-        self.content.password = password
-        return self.content._continue(destination, base_url, **kwargs)
+        def log_in():
+            self.content.email = username
+            self.content.password = password
+            return self.content._continue(destination, base_url, **kwargs)
+
+        def resume():
+            if destination:
+                return go_to_(destination(self.driver, base_url, **kwargs))
+            return go_to_(Profile(self.driver, self.base_url))
+
+        return SessionCache.resume_or_log_in(
+            self.driver, username, password, base_url or self.base_url,
+            log_in, resume)
 
     def service_log_in(self, user: str, password: str,
                        destination: Page = None, url: str = None, **kwargs) \
@@ -10,11 +10,11 @@ Add/Edit/Delete Reading
 from __future__ import annotations
 
 from datetime import datetime
-from time import sleep
 from typing import Dict, List, Tuple, Union
 
 from pypom import Region
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    NoSuchElementException, WebDriverException)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
@@ -25,8 +25,10 @@ from pages.tutor.preview import StudentPreview
 from pages.tutor.reference import ReferenceBook
 from pages.tutor.settings import CourseSettings
 from regions.tutor.assessment import Assessment
-from utils.tutor import Tutor, TutorException, get_date_times
+from utils.tutor import (
+    AssignmentTimes, Tutor, TutorException, get_date_times)
 from utils.utilities import Actions, Utility, go_to_
+from utils.wait import Wait
 
 Selector = Tuple[By, str]
 
@@ -40,6 +42,22 @@ DISPLAYED = 'return getComputedStyle(arguments[0]).display != "none";'
 GET_ROOT = 'return document.querySelector("[role={0}]");'
 # wait until the loading animation (bouncing books) is gone
 ANIMATION = 'return document.querySelector(".loading-animation");'
+# set input values through the native setter so React sees the change; each
+# field is [input, native time/date value, text input value]
+SET_INPUTS = (
+    'var setter = Object.getOwnPropertyDescriptor('
+    '  HTMLInputElement.prototype, "value").set;'
+    'arguments[0].forEach(function (field) {'
+    '  var input = field[0];'
+    '  input.focus();'
+    '  setter.call(input, input.type == "text" ? field[2] : field[1]);'
+    '  input.dispatchEvent(new Event("input", {bubbles: true}));'
+    '  input.dispatchEvent(new Event("change", {bubbles: true}));'
+    '  input.blur();'
+    '});')
+# return the current value of each input
+GET_VALUES = ('return arguments[0].map('
+              '  function (input) { return input.value; });')
 
 
 # -------------------------------------------------------- #
@@ -106,7 +124,7 @@ class CancelConfirm(Region):
             else self._close_x_locator
         button = self.find_element(*locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.page
 
     @property
@@ -201,7 +219,7 @@ class DeleteConfirmation(Region):
         """
         button = self.find_element(*self._delete_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_settled(self.driver)
         return go_to_(Calendar(self.driver, self.page.base_url))
 
 
@@ -330,14 +348,49 @@ class OpenToClose(Region):
         :return: None
 
         """
-        self._set_field('due_date', self._due_date_locator, due_on)
-        self._set_field('due_time', self._due_time_locator, due_at)
-        self._set_field('open_date', self._open_date_locator, open_on)
-        self._set_field('open_time', self._open_time_locator, open_at)
+        times = AssignmentTimes(open_on, open_at, due_on, due_at)
+        for field in self._set_inputs(times):
+            self._set_field(field, getattr(self, f'_{field}_locator'),
+                            times.field(field))
+
+    def _set_inputs(self, times: AssignmentTimes) -> List[str]:
+        """Write the dates and times directly into the form inputs.
+
+        Every value is set by one script that fires the input and change
+        events; the rendered values are then read back once.
+
+        :param times: the open and due dates and times
+        :type times: :py:class:`~utils.tutor.AssignmentTimes`
+        :return: the fields that did not take the new value and need the
+            keystroke setter
+        :rtype: list(str)
+
+        """
+        values = times.inputs()
+        if not values:
+            return []
+        inputs = [self.find_element(*getattr(self, f'_{field}_locator'))
+                  for field in values]
+        try:
+            self.driver.execute_script(
+                SET_INPUTS,
+                [[element, native, text]
+                 for element, (native, text) in zip(inputs, values.values())])
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
+            rendered = self.driver.execute_script(GET_VALUES, inputs)
+        except WebDriverException:
+            return list(values)
+        unset = []
+        for field, value in zip(values, rendered):
+            shown = AssignmentTimes.rendered(field, value)
+            if shown is None or \
+                    shown != AssignmentTimes.rendered(field, values[field][0]):
+                unset.append(field)
+        return unset
 
     def _set_field(self, send_field: str, selector: Selector, value: str) \
             -> None:
-        r"""Set the requested form field to the new value.
+        r"""Set the requested form field to the new value using keystrokes.
 
         :param str send_field: the form field to modify
         :param str value: the new field value
@@ -364,7 +417,6 @@ class OpenToClose(Region):
             ampm = self.INCREASE \
                 if target_ampm.lower() != current_ampm.lower() else []
 
-            sleep(0.25)
             # set hour
             time_set = self.SHIFT_LEFT * 2
             for _ in range(min(hour, 0), max(hour, 0), 1):
@@ -377,7 +429,7 @@ class OpenToClose(Region):
             time_set += self.SHIFT_RIGHT + ampm
 
         Utility.click_option(self.driver, element=self.find_element(*selector))
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
 
         if 'time' in send_field:
             if 'firefox' in self.driver.capabilities.get('browserName') \
@@ -391,7 +443,7 @@ class OpenToClose(Region):
                     .send_keys(target_ampm[0]) \
                     .send_keys(self.NEXT_FIELD) \
                     .perform()
-                sleep(0.5)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             else:
                 time = self.find_element(*selector)
                 for ch in time_set:
@@ -408,12 +460,12 @@ class OpenToClose(Region):
                 Utility.click_option(self.driver, element=self.find_element(*(
                     self._previous_month_arrow_locator if x < 0 else
                     self._next_month_arrow_locator)))
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             Utility.click_option(self.driver, element=self.find_element(
                 By.CSS_SELECTOR,
                 self._calendar_day_selector.format(day=target.day)))
 
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
 
 
 class SectionSelector(Region):
@@ -438,7 +490,7 @@ class SectionSelector(Region):
         :rtype: bool
 
         """
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.driver.execute_script(ANIMATION) is None
 
     @property
@@ -460,7 +512,7 @@ class SectionSelector(Region):
         """
         button = self.find_element(*self._close_x_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.page
 
     @property
@@ -497,7 +549,7 @@ class SectionSelector(Region):
         button = self.find_element(*self._add_readings_button_locator)
         destination = button.text
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_settled(self.driver)
         if 'Reading' in destination:
             return self.page
         selector_root = self.driver.execute_script(
@@ -516,7 +568,7 @@ class SectionSelector(Region):
         """
         button = self.find_element(*self._cancel_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.page
 
     class Chapter(Region):
@@ -537,7 +589,7 @@ class SectionSelector(Region):
 
             """
             Utility.click_option(self.driver, element=self.root)
-            sleep(0.75)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.page
 
         @property
@@ -559,7 +611,7 @@ class SectionSelector(Region):
             """
             checkbox = self.find_element(*self._section_checkbox_locator)
             Utility.click_option(self.driver, element=checkbox)
-            sleep(0.75)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.page
 
         @property
@@ -636,10 +688,10 @@ class SectionSelector(Region):
                 if 'show' not in visibility:
                     chapter_bar = self.root.find_element(By.XPATH, './../..')
                     Utility.click_option(self.driver, element=chapter_bar)
-                    sleep(0.4)
+                    Wait.for_dom_quiet(self.driver, quiet=0.1)
                 checkbox = self.find_element(*self._section_checkbox_locator)
                 Utility.click_option(self.driver, element=checkbox)
-                sleep(0.75)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
                 # if viewing the section of a chapter, return the chapter's
                 # parent page
                 if isinstance(self.page, Region):
@@ -722,7 +774,7 @@ class ExerciseSelector(Region):
         :rtype: bool
 
         """
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.driver.execute_script(ANIMATION) is None
 
     @property
@@ -896,7 +948,7 @@ class ExerciseSelector(Region):
             """
             button = self.find_element(*self._add_more_sections_button_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(1)
+            Wait.for_settled(self.driver)
             selection_root = self.find_element(
                 *self._exercise_selection_root_locator)
             return SectionSelector(self.page.page, selection_root)
@@ -910,7 +962,7 @@ class ExerciseSelector(Region):
             """
             button = self.find_element(*self._next_button_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(0.3)
+            Wait.for_settled(self.driver)
             return self.page.page
 
         def cancel(self) -> Homework:
@@ -922,7 +974,7 @@ class ExerciseSelector(Region):
             """
             button = self.find_element(*self._cancel_button_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(0.3)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.page.page
 
         class Section(Region):
@@ -1025,7 +1077,7 @@ class ExerciseTableReview(Region):
         :rtype: bool
 
         """
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self.execute_script(ANIMATION) is None
 
     @property
@@ -1073,7 +1125,7 @@ class ExerciseTableReview(Region):
             raise TutorException(
                 "Cannot have fewer than zero (0) Tutor-selected assessments")
         Utility.click_option(self.driver, element=arrow_down)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self
 
     def more_tutor_selections(self) -> ExerciseTableReview:
@@ -1090,7 +1142,7 @@ class ExerciseTableReview(Region):
             raise TutorException(
                 "Cannot have more than four (4) Tutor-selected assessments")
         Utility.click_option(self.driver, element=arrow_up)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self
 
     def what_are_these(self) -> HomeworkTutorSelectionsTooltip:
@@ -1102,7 +1154,7 @@ class ExerciseTableReview(Region):
         """
         link = self.find_element(*self._what_are_these_link_locator)
         Utility.click_option(self.driver, element=link)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return HomeworkTutorSelectionsTooltip(self)
 
     def add_more_sections(self) -> SectionSelector:
@@ -1114,7 +1166,7 @@ class ExerciseTableReview(Region):
         """
         button = self.find_element(*self._add_more_sections_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return SectionSelector(self.page)
 
     @property
@@ -1243,7 +1295,7 @@ class ExerciseTableReview(Region):
             try:
                 button = self.find_element(*self._move_up_arrow_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             except NoSuchElementException:
                 pass
             return self.page
@@ -1263,7 +1315,7 @@ class ExerciseTableReview(Region):
             try:
                 button = self.find_element(*self._move_down_arrow_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             except NoSuchElementException:
                 pass
             return self.page
@@ -1277,7 +1329,7 @@ class ExerciseTableReview(Region):
             """
             button = self.find_element(*self._remove_exercise_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(0.5)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.page
 
         @property
@@ -1361,7 +1413,6 @@ class ExerciseTableReview(Region):
             """
             button = self.find_element(*self._assessment_details_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(0.25)
             raise NotImplementedError()
 
         class Question(Region):
@@ -1558,12 +1609,12 @@ class Assignment(TutorBase):
         """
         button = self.find_element(*self._close_x_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         confirm = self.driver.execute_script(GET_ROOT.format('dialog'))
         if confirm:
             unsaved_changes = CancelConfirm(self, confirm)
             unsaved_changes.yes()
-            sleep(0.25)
+            Wait.for_settled(self.driver)
         return go_to_(Calendar(self.driver, base_url=self.base_url))
 
     # ---------------------------------------------------- #
@@ -1679,7 +1730,7 @@ class Assignment(TutorBase):
         radio_option = self.find_element(
             *self._all_sections_radio_button_locator)
         Utility.click_option(self.driver, element=radio_option)
-        sleep(0.5)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self
 
     def individual_sections(self) -> Assignment:
@@ -1692,7 +1743,7 @@ class Assignment(TutorBase):
         radio_option = self.find_element(
             *self._individual_sections_radio_button_locator)
         Utility.click_option(self.driver, element=radio_option)
-        sleep(0.5)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return self
 
     @property
@@ -1786,7 +1837,7 @@ class Assignment(TutorBase):
         """
         button = self.find_element(*self._publish_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_settled(self.driver)
         if self.errors:
             raise TutorException(f'Assignment error(s): {self.errors}')
         calendar = go_to_(Calendar(self.driver, self.base_url))
@@ -1806,13 +1857,17 @@ class Assignment(TutorBase):
         name = self.name
         button = self.find_element(*self._save_as_draft_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.5)
+        Wait.for_settled(self.driver)
         if self.errors:
             raise(TutorException(f'Assignment error(s): {self.errors}'))
         calendar = go_to_(Calendar(self.driver, self.base_url))
-        calendar.wait.until(
-            lambda _: (name in calendar.assignments(by_name=True) and
-                       calendar.assignment(name).is_draft))
+
+        def draft_shown(_):
+            calendar.invalidate_snapshots()
+            return any(plan.title == name and plan.is_draft
+                       for plan in calendar.snapshot().plans)
+
+        calendar.wait.until(draft_shown)
         return calendar
 
     def cancel(self) -> Calendar:
@@ -1837,7 +1892,7 @@ class Assignment(TutorBase):
         """
         button = self.find_element(*self._delete_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         dialog = DeleteConfirmation(self)
         return dialog.delete() if confirm else dialog
 
@@ -1871,7 +1926,7 @@ class Assignment(TutorBase):
             """
             checkbox = self.find_element(*self._section_checkbox_locator)
             Utility.click_option(self.driver, element=checkbox)
-            sleep(0.25)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.page
 
         @property
@@ -1937,9 +1992,8 @@ class External(Assignment):
         url_input = self.find_element(*self._assignment_url_locator)
         if self.assignment_url:
             Utility.clear_field(self.driver, field=url_input)
-            sleep(0.25)
         url_input.send_keys(url)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
 
     @property
     def url_error(self) -> str:
@@ -1985,7 +2039,7 @@ class Homework(Assignment):
         """
         button = self.find_element(*self._select_problems_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(1)
+        Wait.for_settled(self.driver)
         selector_root = self.find_element(*self._homework_plan_root_locator)
         return SectionSelector(self, selector_root)
 
@@ -2035,7 +2089,7 @@ class Homework(Assignment):
                 raise TutorException(
                     f"{'Chapter' if chapters else 'Section'} " +
                     f'"{selection}" not a valid option')
-            sleep(0.3)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
         return selector.show_problems()
 
     @property
@@ -2109,7 +2163,7 @@ class Reading(Assignment):
         """
         button = self.find_element(*self._add_readings_button_locator)
         Utility.click_option(self.driver, element=button)
-        sleep(1)
+        Wait.for_settled(self.driver)
         selector_root = self.find_element(*self._reading_plan_root_locator)
         return SectionSelector(self, selector_root)
 
@@ -2159,7 +2213,7 @@ class Reading(Assignment):
                 raise TutorException(
                     f"{'Chapter' if chapters else 'Section'} " +
                     f'"{selection}" not a valid option')
-            sleep(0.3)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
         selector.add_readings()
         return [str(option) for option in selections]
 
@@ -2196,7 +2250,7 @@ class Reading(Assignment):
         """
         link = self.find_element(*self._see_questions_tooltip_locator)
         Utility.click_option(self.driver, element=link)
-        sleep(0.25)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         return ReadingQuestionTooltip(self)
 
     def what_do_students_see(self) -> StudentPreview:
@@ -2256,7 +2310,7 @@ class Reading(Assignment):
             try:
                 button = self.find_element(*self._move_up_arrow_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             except NoSuchElementException:
                 pass
             return self
@@ -2271,7 +2325,7 @@ class Reading(Assignment):
             try:
                 button = self.find_element(*self._move_down_arrow_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             except NoSuchElementException:
                 pass
             return self
@@ -2285,5 +2339,5 @@ class Reading(Assignment):
             """
             button = self.find_element(*self._delete_section_locator)
             Utility.click_option(self.driver, element=button)
-            sleep(0.5)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self
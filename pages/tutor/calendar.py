@@ -2,22 +2,226 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from time import sleep
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, NamedTuple, Tuple, Union
 
 from pypom import Region
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
 from pages.tutor.base import TutorBase
 from regions.tutor.notification import Notifications
 from regions.tutor.tooltip import Float
 from utils.tutor import Tutor, TutorException
 from utils.utilities import Utility, go_to_
+from utils.wait import Wait
 
 DateTime = Tuple[Union[str, datetime], str]
 Timeframe = Dict[str, Tuple[DateTime, DateTime]]
 
+# Javascript page requests
+MONTH_GRID = (
+    'var root = arguments[0], selectors = arguments[1];'
+    'var label = root.querySelector(selectors.label);'
+    'var grid = {label: label ? label.textContent.trim() : "", days: [],'
+    '  busy: !!document.querySelector(selectors.busy)};'
+    'var days = root.querySelectorAll(selectors.day);'
+    'for (var i = 0; i < days.length; i++) {'
+    '  var day = days[i], plans = [];'
+    '  var events = day.querySelectorAll(selectors.event);'
+    '  for (var j = 0; j < events.length; j++) {'
+    '    var plan = events[j].querySelector(selectors.plan) || events[j];'
+    '    var title = events[j].querySelector(selectors.title);'
+    '    plans.push({element: events[j], event: events[j].className,'
+    '      plan: plan.className,'
+    '      id: plan.getAttribute("data-plan-id"),'
+    '      type: plan.getAttribute("data-assignment-type"),'
+    '      title: title ? (title.innerText || title.textContent).trim() : "",'
+    '      opens: title ? title.getAttribute("data-opens-at") : null,'
+    '      flagged: !!events[j].querySelector(selectors.flagged)});'
+    '  }'
+    '  grid.days.push({element: day, date: day.getAttribute("data-date"),'
+    '    classes: day.className, plans: plans});'
+    '}'
+    'return grid;')
+# the calendar route accepts the month to display
+COURSE_ROUTE = re.compile(r'^(?P<course>.*?/course/\d+)')
+MONTH_ROUTE = '{course}/t/month/{month:%Y-%m-%d}'
+
+
+def _class_value(classes: str, prefix: str, default: str = '') -> str:
+    """Return the value of a prefixed class name like ``type-event``."""
+    if prefix not in classes:
+        return default
+    return classes.split(prefix)[-1].split()[0]
+
+
+def _term(classes: str) -> str:
+    """Return the course term status found in a day's class names."""
+    if Tutor.BEFORE_TERM in classes:
+        return Tutor.BEFORE_TERM
+    elif Tutor.IN_TERM in classes:
+        return Tutor.IN_TERM
+    elif Tutor.AFTER_TERM in classes:
+        return Tutor.AFTER_TERM
+    raise TutorException('No term-status listed in "{0}"'
+                         .format(classes.split()))
+
+
+def _tense(classes: str) -> str:
+    """Return the past, today or upcoming status in a day's class names."""
+    if Tutor.IN_PAST in classes:
+        return Tutor.IN_PAST
+    elif Tutor.IN_FUTURE in classes:
+        return Tutor.IN_FUTURE
+    return Tutor.TODAY
+
+
+def _month(date: datetime) -> datetime:
+    """Return the first day of the date's month."""
+    return datetime(date.year, date.month, 1)
+
+
+class PlanSnapshot(NamedTuple):
+    """An assignment plan ribbon read from the month grid."""
+
+    element: WebElement
+    date: datetime
+    plan_id: str
+    assignment_type: str
+    title: str
+    style: str
+    span: int
+    is_published: bool
+    is_draft: bool
+    is_open: bool
+    opens_on: str
+    flagged: bool
+
+    @classmethod
+    def from_grid(cls, date: datetime, plan: Dict) -> PlanSnapshot:
+        """Return the plan from a month grid script result.
+
+        :param date: the calendar day the ribbon starts on
+        :param dict plan: the plan values read by the script
+        :type date: :py:class:`~datetime.datetime`
+        :return: the plan snapshot
+        :rtype: :py:class:`~pages.tutor.calendar.PlanSnapshot`
+
+        """
+        event = plan.get('event') or ''
+        state = plan.get('plan') or ''
+        return cls(element=plan.get('element'),
+                   date=date,
+                   plan_id=plan.get('id'),
+                   assignment_type=plan.get('type'),
+                   title=plan.get('title') or '',
+                   style=_class_value(event, 'type-'),
+                   span=int(_class_value(event, 'span-', '1')),
+                   is_published='is-published' in state,
+                   is_draft='is-draft' in state,
+                   is_open='is-open' in state,
+                   opens_on=plan.get('opens'),
+                   flagged=bool(plan.get('flagged')))
+
+
+class DaySnapshot(NamedTuple):
+    """A calendar day and the plans starting on it."""
+
+    element: WebElement
+    date: datetime
+    classes: str
+    plans: Tuple[PlanSnapshot, ...]
+
+    @property
+    def term(self) -> str:
+        """Return whether the date is before, in or after the course term.
+
+        :return: the status of the date with respect to the course term
+        :rtype: str
+
+        """
+        return _term(self.classes)
+
+    @property
+    def tense(self) -> str:
+        """Return whether the date is before today, today, or after.
+
+        :return: the status of the date with respect to today
+        :rtype: str
+
+        """
+        return _tense(self.classes)
+
+
+class MonthSnapshot(NamedTuple):
+    """A displayed calendar month read by one script call."""
+
+    month: datetime
+    days: Tuple[DaySnapshot, ...]
+
+    @classmethod
+    def from_grid(cls, grid: Dict) -> MonthSnapshot:
+        """Return the month from a month grid script result.
+
+        :param dict grid: the header label and days read by the script
+        :return: the month snapshot
+        :rtype: :py:class:`~pages.tutor.calendar.MonthSnapshot`
+
+        """
+        days = []
+        for day in grid.get('days', []):
+            date = datetime.strptime(day.get('date'), '%Y%m%d')
+            days.append(DaySnapshot(
+                element=day.get('element'),
+                date=date,
+                classes=day.get('classes') or '',
+                plans=tuple(PlanSnapshot.from_grid(date, plan)
+                            for plan in day.get('plans', []))))
+        return cls(month=datetime.strptime(grid.get('label'), '%B %Y'),
+                   days=tuple(days))
+
+    @property
+    def plans(self) -> Tuple[PlanSnapshot, ...]:
+        """Return every plan shown in the grid in display order.
+
+        :return: the plans for the displayed weeks
+        :rtype: tuple(:py:class:`~pages.tutor.calendar.PlanSnapshot`)
+
+        """
+        return tuple(plan for day in self.days for plan in day.plans)
+
+    def day(self, date: datetime) -> DaySnapshot:
+        """Return a day shown in the grid.
+
+        :param date: the calendar date
+        :type date: :py:class:`~datetime.datetime`
+        :return: the day snapshot
+        :rtype: :py:class:`~pages.tutor.calendar.DaySnapshot`
+
+        :raises :py:class:`~utils.tutor.TutorException`: if the date is not
+            shown in this month's grid
+
+        """
+        for day in self.days:
+            if day.date.date() == date.date():
+                return day
+        raise TutorException(
+            f'{date:%Y-%m-%d} is not shown in {self.month:%B %Y}')
+
+    def plans_on(self, date: datetime) -> Tuple[PlanSnapshot, ...]:
+        """Return the plans starting on a date.
+
+        :param date: the calendar date
+        :type date: :py:class:`~datetime.datetime`
+        :return: the plans starting on the date
+        :rtype: tuple(:py:class:`~pages.tutor.calendar.PlanSnapshot`)
+
+        """
+        return self.day(date).plans
+
 
 class Assignment(Region):
     """An individual student assignment or event."""
@@ -27,6 +231,15 @@ class Assignment(Region):
     _edit_draft_locator = (By.CSS_SELECTOR, 'a')
     _flagged_assignment_locator = (By.CSS_SELECTOR, 'label svg')
 
+    def __init__(self, page, root=None, record: PlanSnapshot = None):
+        """Override the initialization to accept a month grid plan.
+
+        When a plan snapshot is given, the plan fields are read from it
+        instead of the ribbon.
+        """
+        super(Assignment, self).__init__(page, root)
+        self.record = record
+
     @property
     def style(self):
         """Return the assignment color display type.
@@ -35,9 +248,9 @@ class Assignment(Region):
         :rtype: str
 
         """
-        return (self.root.get_attribute('class')
-                .split('type-')[-1]
-                .split()[0])
+        if self.record:
+            return self.record.style
+        return _class_value(self.root.get_attribute('class'), 'type-')
 
     @property
     def span(self):
@@ -48,9 +261,9 @@ class Assignment(Region):
         :rtype: int
 
         """
-        return int(self.root.get_attribute('class')
-                   .split('span-')[-1]
-                   .split()[0])
+        if self.record:
+            return self.record.span
+        return int(_class_value(self.root.get_attribute('class'), 'span-'))
 
     @property
     def plan(self):
@@ -71,6 +284,8 @@ class Assignment(Region):
         :rtype: bool
 
         """
+        if self.record:
+            return self.record.is_published
         return 'is-published' in self.plan.get_attribute('class')
 
     @property
@@ -82,6 +297,8 @@ class Assignment(Region):
         :rtype: bool
 
         """
+        if self.record:
+            return self.record.is_draft
         return 'is-draft' in self.plan.get_attribute('class')
 
     @property
@@ -93,6 +310,8 @@ class Assignment(Region):
         :rtype: bool
 
         """
+        if self.record:
+            return self.record.is_open
         return 'is-open' in self.plan.get_attribute('class')
 
     @property
@@ -103,6 +322,8 @@ class Assignment(Region):
         :rtype: str
 
         """
+        if self.record:
+            return self.record.plan_id
         return self.plan.get_attribute('data-plan-id')
 
     @property
@@ -113,6 +334,8 @@ class Assignment(Region):
         :rtype: str
 
         """
+        if self.record:
+            return self.record.assignment_type
         return self.plan.get_attribute('data-assignment-type')
 
     @property
@@ -123,6 +346,8 @@ class Assignment(Region):
         :rtype: str
 
         """
+        if self.record:
+            return self.record.opens_on
         return (self.find_element(*self._title_locator)
                 .get_attribute('data-opens-at'))
 
@@ -134,6 +359,8 @@ class Assignment(Region):
         :rtype: str
 
         """
+        if self.record:
+            return self.record.title
         return self.find_element(*self._title_locator).text
 
     def edit(self):
@@ -152,6 +379,7 @@ class Assignment(Region):
                 type
 
         """
+        self._invalidate_snapshots()
         if self.is_draft:
             assignment_type = self.assignment_type
             link = self.find_element(*self._edit_draft_locator)
@@ -173,7 +401,7 @@ class Assignment(Region):
                 target = target.page
             return go_to_(Assignment(self.driver, target.base_url))
         Utility.click_option(self.driver, element=self.plan)
-        sleep(0.5)
+        Wait.for_dom_quiet(self.driver, quiet=0.1)
         from regions.tutor.quick_look import QuickLook
         return QuickLook(self.page)
 
@@ -186,9 +414,20 @@ class Assignment(Region):
         :rtype: bool
 
         """
+        if self.record:
+            return self.record.flagged
         return bool(
             self.find_elements(*self._flagged_assignment_locator))
 
+    def _invalidate_snapshots(self):
+        """Discard the calendar's month snapshot before a change."""
+        target = self.page
+        while target is not None:
+            if hasattr(target, 'invalidate_snapshots'):
+                target.invalidate_snapshots()
+                return
+            target = getattr(target, 'page', None)
+
 
 class Calendar(TutorBase):
     """The instructor course calendar."""
@@ -199,9 +438,14 @@ class Calendar(TutorBase):
     _calendar_body_locator = (By.CSS_SELECTOR, '.month-body')
     _is_publishing_locator = (By.CSS_SELECTOR, '.is-publishing')
     _assignment_locator = (By.CSS_SELECTOR, '.event')
+    _month_label_locator = (
+        By.CSS_SELECTOR, '.month-body .calendar-header-label')
 
     _loading_message_selector = '.calendar-loading'
 
+    _displayed_month = None
+    _month_snapshot = None
+
     # ---------------------------------------------------- #
     # Banner / Header
     # ---------------------------------------------------- #
@@ -279,6 +523,92 @@ class Calendar(TutorBase):
         calendar = self.find_element(*self._calendar_body_locator)
         return self.CalendarMonth(self, calendar)
 
+    @property
+    def displayed_month(self) -> datetime:
+        """Return the first day of the displayed month.
+
+        :return: the displayed month
+        :rtype: :py:class:`~datetime.datetime`
+
+        """
+        if self._displayed_month is None:
+            label = self.find_element(*self._month_label_locator).text
+            self._displayed_month = datetime.strptime(label, '%B %Y')
+        return self._displayed_month
+
+    def snapshot(self, month: datetime = None) -> MonthSnapshot:
+        """Return the displayed month grid read by one script call.
+
+        The snapshot holds the elements of the rendered month so it is only
+        kept until the month changes, the page reloads or an action changes
+        the calendar; a grid read while plans are loading or publishing is
+        not kept.
+
+        :param month: (optional) display this month before reading the grid
+        :type month: :py:class:`~datetime.datetime`
+        :return: the days and plans for the month
+        :rtype: :py:class:`~pages.tutor.calendar.MonthSnapshot`
+
+        """
+        if month is not None:
+            self.go_to_month(month)
+        if self._month_snapshot is not None:
+            return self._month_snapshot
+        self.wait.until(lambda _: self.loaded)
+        grid = self.driver.execute_script(
+            MONTH_GRID, self.find_element(*self._calendar_body_locator),
+            {'label': self.CalendarMonth._current_month_locator[1],
+             'busy': (f'{self._loading_message_selector} , '
+                      f'{self._is_publishing_locator[1]}'),
+             'day': self.CalendarMonth._day_locator[1],
+             'event': self._assignment_locator[1],
+             'plan': Assignment._plan_locator[1],
+             'title': Assignment._title_locator[1],
+             'flagged': Assignment._flagged_assignment_locator[1], })
+        snapshot = MonthSnapshot.from_grid(grid)
+        self._displayed_month = snapshot.month
+        if not grid['busy']:
+            self._month_snapshot = snapshot
+        return snapshot
+
+    def invalidate_snapshots(self) -> None:
+        """Discard the month snapshot after the calendar changes.
+
+        :return: None
+
+        """
+        self._displayed_month = None
+        self._month_snapshot = None
+
+    def go_to_month(self, month: datetime) -> Calendar:
+        """Display the calendar for a month.
+
+        The month is loaded directly through the calendar route; if the
+        route is not available the calendar steps through the months
+        without waiting on a fixed delay.
+
+        :param month: any date within the month to display
+        :type month: :py:class:`~datetime.datetime`
+        :return: the course calendar
+        :rtype: :py:class:`~pages.tutor.calendar.Calendar`
+
+        """
+        target = _month(month)
+        if self.displayed_month == target:
+            return self
+        route = COURSE_ROUTE.match(self.driver.current_url)
+        if route:
+            self.driver.get(MONTH_ROUTE.format(course=route.group('course'),
+                                               month=target))
+            self.invalidate_snapshots()
+            self.wait.until(lambda _: self.loaded)
+        current = self.displayed_month
+        steps = ((target.year - current.year) * 12 +
+                 target.month - current.month)
+        for _ in range(abs(steps)):
+            self.calendar._turn(forward=steps > 0)
+        return self
+
     # ---------------------------------------------------- #
     # Calendar helper functions
     # ---------------------------------------------------- #
@@ -374,6 +704,7 @@ class Calendar(TutorBase):
         calendar.wait.until(
             lambda _: not self.driver.find_elements(
                 *self._is_publishing_locator))
+        self.invalidate_snapshots()
 
     def assignments(self, by_name: bool = False) \
             -> Union[List[Assignment], List[str]]:
@@ -386,12 +717,10 @@ class Calendar(TutorBase):
                      .Calendar.CalendarMonth.Day.Assignment`) or list(str)
 
         """
-        assignments = [Assignment(self, ribbon)
-                       for ribbon
-                       in self.find_elements(*self._assignment_locator)]
-        if not by_name:
-            return assignments
-        return [assignment.title for assignment in assignments]
+        plans = self.snapshot().plans
+        if by_name:
+            return [plan.title for plan in plans]
+        return [Assignment(self, plan.element, plan) for plan in plans]
 
     def assignment(self, name: str) -> Assignment:
         """Return the assignment from its name.
@@ -415,9 +744,7 @@ class Calendar(TutorBase):
 
         .. note:
 
-            Only looks at the current month
-            TODO: add a calendar rotation to pull the assignments for dates in
-                  different months
+            The calendar displays the date's month first
 
         :param date: a specific date
         :param bool by_name: (optional) return the assignment names found on
@@ -428,14 +755,10 @@ class Calendar(TutorBase):
         :rtype: list(:py:class:`~pages.tutor.calendar.Assignment`)
 
         """
-        selector = f'[data-date="{date.strftime("%Y%m%d")}"]'
-        due_date = self.find_element(By.CSS_SELECTOR, selector)
-        assignments = [Assignment(self, ribbon)
-                       for ribbon
-                       in due_date.find_elements(*self._assignment_locator)]
-        if not by_name:
-            return assignments
-        return [assignment.title for assignment in assignments]
+        plans = self.snapshot(date).plans_on(date)
+        if by_name:
+            return [plan.title for plan in plans]
+        return [Assignment(self, plan.element, plan) for plan in plans]
 
     # ---------------------------------------------------- #
     # Instructor course regions
@@ -774,10 +1097,8 @@ class Calendar(TutorBase):
             :rtype: :py:class:`Calendar`
 
             """
-            button = self.find_element(*self._last_month_locator)
-            Utility.click_option(self.driver, element=button)
-            sleep(0.5)
-            return Calendar(self.driver, self.page.base_url)
+            self._turn(forward=False)
+            return self.page
 
         def next_month(self):
             """Click on the right arrow to view the next month.
@@ -786,10 +1107,8 @@ class Calendar(TutorBase):
             :rtype: :py:class:`Calendar`
 
             """
-            button = self.find_element(*self._next_month_locator)
-            Utility.click_option(self.driver, element=button)
-            sleep(0.5)
-            return Calendar(self.driver, self.page.base_url)
+            self._turn(forward=True)
+            return self.page
 
         @property
         def days(self):
@@ -799,8 +1118,22 @@ class Calendar(TutorBase):
             :rtype: list(:py:class:`~Calendar.CalendarMonth.Day`)
 
             """
-            return [self.Day(self, date)
-                    for date in self.find_elements(*self._day_locator)]
+            return [self.Day(self, day.element, day)
+                    for day in self.page.snapshot().days]
+
+        def _turn(self, forward: bool) -> None:
+            """Click a month arrow and wait for the new month's label."""
+            page = self.page
+            before = page.displayed_month
+            locator = (self._next_month_locator if forward
+                       else self._last_month_locator)
+            button = page.find_element(*page._calendar_body_locator) \
+                .find_element(*locator)
+            Utility.click_option(self.driver, element=button)
+            page.invalidate_snapshots()
+            Wait.until(lambda: page.displayed_month != before,
+                       timeout=page.timeout, name='calendar_month')
+            page.wait.until(lambda _: page.loaded)
 
         class Day(Region):
             """A specific date."""
@@ -812,6 +1145,15 @@ class Calendar(TutorBase):
 
             _add_assignment_selector = 'a[data-assignment-type={0}]'
 
+            def __init__(self, page, root=None, record: DaySnapshot = None):
+                """Override the initialization to accept a month grid day.
+
+                When a day snapshot is given, the date, term, tense and
+                assignments are read from it instead of the cell.
+                """
+                super(Calendar.CalendarMonth.Day, self).__init__(page, root)
+                self.record = record
+
             @property
             def number(self):
                 """Return the calendar day number element.
@@ -830,6 +1172,8 @@ class Calendar(TutorBase):
                 :rtype: :py:class:`~datetime.datetime`
 
                 """
+                if self.record:
+                    return self.record.date
                 return datetime.strptime(self.root.get_attribute('data-date'),
                                          "%Y%m%d")
 
@@ -841,16 +1185,9 @@ class Calendar(TutorBase):
                 :rtype: str
 
                 """
-                term = self.root.get_attribute('class')
-                if Tutor.BEFORE_TERM in term:
-                    return Tutor.BEFORE_TERM
-                elif Tutor.IN_TERM in term:
-                    return Tutor.IN_TERM
-                elif Tutor.AFTER_TERM in term:
-                    return Tutor.AFTER_TERM
-                else:
-                    raise TutorException('No term-status listed in "{0}"'
-                                         .format(term.split()))
+                if self.record:
+                    return self.record.term
+                return _term(self.root.get_attribute('class'))
 
             @property
             def tense(self):
@@ -860,12 +1197,9 @@ class Calendar(TutorBase):
                 :rtype: str
 
                 """
-                term = self.root.get_attribute('class')
-                if Tutor.IN_PAST in term:
-                    return Tutor.IN_PAST
-                elif Tutor.IN_FUTURE in term:
-                    return Tutor.IN_FUTURE
-                return Tutor.TODAY
+                if self.record:
+                    return self.record.tense
+                return _tense(self.root.get_attribute('class'))
 
             def add_assignment(self, assignment_type=None):
                 """Click on the date number to add an assignment.
@@ -881,6 +1215,7 @@ class Calendar(TutorBase):
                         assignment_type does not match a known assignment type
 
                 """
+                self.page.page.invalidate_snapshots()
                 label = self.find_element(*self._date_label_locator)
                 Utility.click_option(self.driver, element=label)
                 sleep(0.5)
@@ -924,6 +1259,8 @@ class Calendar(TutorBase):
                 :rtype: bool
 
                 """
+                if self.record:
+                    return bool(self.record.plans)
                 return bool(self.find_elements(*self._event_locator))
 
             @property
@@ -935,6 +1272,9 @@ class Calendar(TutorBase):
                     list(:py:class:`~Calendar.CalendarMonth.Day.Assignment`)
 
                 """
+                if self.record:
+                    return [Assignment(self, plan.element, plan)
+                            for plan in self.record.plans]
                 return [Assignment(self, event)
                         for event
                         in self.find_elements(*self._assignment_locator)]
@@ -4,6 +4,7 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
 from pages.tutor.base import TutorLoginBase
+from utils.sessions import SessionCache
 from utils.utilities import Utility, go_to_, go_to_external_
 
 
@@ -88,8 +89,17 @@ class TutorHome(TutorLoginBase):
 
         """
         from pages.tutor.dashboard import Dashboard
-        accounts = self.go_to_log_in()
-        return accounts.log_in(username, password, Dashboard, self.base_url)
+
+        def log_in():
+            accounts = self.go_to_log_in()
+            return accounts.log_in(
+                username, password, Dashboard, self.base_url)
+
+        def resume():
+            return go_to_(Dashboard(self.driver, self.base_url))
+
+        return SessionCache.resume_or_log_in(
+            self.driver, username, password, self.base_url, log_in, resume)
 
     @property
     def logged_in(self):
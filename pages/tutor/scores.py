@@ -1,10 +1,12 @@
 """The student and instructor scores page."""
 
 from time import sleep
-from typing import List, Union
+from typing import List, NamedTuple, Tuple, Union
 
 from pypom import Region
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (NoSuchElementException,  # NOQA
+                                        TimeoutException,  # NOQA
+                                        WebDriverException)  # NOQA
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
@@ -15,6 +17,51 @@ from pages.tutor.performance import PerformanceForecast
 from utils.tutor import Tutor, TutorException
 from utils.utilities import Utility, go_to_
 
+# -------------------------------------------------------- #
+# Javascript page requests
+# -------------------------------------------------------- #
+
+# return the table mutation counter (bumped by the snapshot observer)
+TABLE_GENERATION = 'return arguments[0].__osGeneration;'
+# read every assignment column and student row in a single request; each
+# column and row is returned as a flat list with its root element first
+TABLE_SNAPSHOT = '''
+var root = arguments[0], css = arguments[1];
+if (root.__osObserver === undefined) {
+  root.__osGeneration = 0;
+  root.__osObserver = new MutationObserver(function() {
+    root.__osGeneration++; });
+  root.__osObserver.observe(root, {
+    attributes: true, characterData: true, childList: true, subtree: true});
+}
+var text = function(parent, selector) {
+  var node = parent.querySelector(selector);
+  return node ? node.innerText.trim() : null; };
+var all = function(parent, selector, read) {
+  return Array.prototype.map.call(parent.querySelectorAll(selector), read); };
+var columns = all(root, css.columns, function(column) {
+  var group = column.querySelector(css.columnGroup);
+  return [column,
+          group ? group.getAttribute('data-assignment-type') : null,
+          group ? group.innerText.trim() : null,
+          text(column, css.dueOn), text(column, css.columnAverage)]; });
+var students = all(root, css.students, function(row) {
+  var cells = all(row, css.cells, function(cell) {
+    var link = cell.querySelector(css.work);
+    var late = cell.querySelector(css.late);
+    return [cell,
+            link ? link.getAttribute('data-assignment-type') : null,
+            text(cell, css.score), !!late,
+            !!late && late.className.indexOf('accepted') >= 0]; });
+  return [row, text(row, css.name), text(row, css.studentId),
+          text(row, css.course), text(row, css.homeworkScore),
+          text(row, css.homeworkProgress), text(row, css.readingScore),
+          text(row, css.readingProgress), cells]; });
+return [root.__osGeneration, columns, students];
+'''
+
+Score = Union[int, str, None]
+
 
 def _average_helper(text):
     """Return a number from the text score or the text if it is not a number.
@@ -44,6 +91,137 @@ def _average_helper(text):
         return text
 
 
+# returned by the cached region reads once the table snapshot is out of date,
+# as a snapshot value may itself be None
+_STALE = object()
+
+
+def _snapshot_score(text):
+    """Return a score from snapshot text, keeping missing values as None."""
+    return None if text is None else _average_helper(text)
+
+
+class AssignmentColumn(NamedTuple):
+    """An assignment column heading read from a table snapshot."""
+
+    assignment_type: str
+    name: str
+    due_on: str
+    average: Score
+
+
+class AssignmentCell(NamedTuple):
+    """A student assignment score read from a table snapshot."""
+
+    assignment_type: str
+    score: Score
+    late: bool
+    accepted: bool
+
+
+class StudentRow(NamedTuple):
+    """A student score row read from a table snapshot."""
+
+    name: str
+    student_id: str
+    course_average: Score
+    homework_score: Score
+    homework_progress: Score
+    reading_score: Score
+    reading_progress: Score
+    assignments: Tuple[AssignmentCell, ...]
+
+
+class TableSnapshot(object):
+    """The scores table contents read in a single WebDriver request.
+
+    The snapshot stays valid until a page object action changes the table or
+    the table DOM is found to have changed since the snapshot was taken.
+    Regions built from a snapshot check the table generation before each
+    cached read and fall back to live element lookups once it is no longer
+    valid.
+
+    """
+
+    __slots__ = ('generation', 'columns', 'students', 'root',
+                 'column_roots', 'student_roots', 'cell_roots', 'valid')
+
+    def __init__(self, data: list) -> None:
+        """Unpack the raw script response.
+
+        :param list data: the ``TABLE_SNAPSHOT`` script response
+        :return: None
+
+        """
+        generation, columns, students = data
+        self.generation = generation
+        self.valid = True
+        self.root = None
+        self.column_roots = [column[0] for column in columns]
+        self.columns = tuple(
+            AssignmentColumn(
+                assignment_type=column[1],
+                name=column[2],
+                due_on=column[3],
+                average=(_snapshot_score(column[4].split()[0])
+                         if column[4] else None))
+            for column in columns)
+        self.student_roots = [student[0] for student in students]
+        self.cell_roots = [[cell[0] for cell in student[8]]
+                           for student in students]
+        self.students = tuple(
+            StudentRow(
+                name=student[1],
+                student_id=student[2],
+                course_average=_snapshot_score(student[3]),
+                homework_score=_snapshot_score(student[4]),
+                homework_progress=_snapshot_score(student[5]),
+                reading_score=_snapshot_score(student[6]),
+                reading_progress=_snapshot_score(student[7]),
+                assignments=tuple(
+                    AssignmentCell(
+                        assignment_type=cell[1],
+                        score=_snapshot_score(cell[2]),
+                        late=cell[3],
+                        accepted=cell[4])
+                    for cell in student[8]))
+            for student in students)
+
+    def current(self, driver) -> bool:
+        """Return True if the table DOM is unchanged since the snapshot.
+
+        A snapshot found to be out of date stays invalid.
+
+        :param driver: the webdriver reading the table
+        :return: ``True`` if the snapshot values may still be used
+        :rtype: bool
+
+        """
+        if self.valid and self.root is not None:
+            try:
+                generation = driver.execute_script(
+                    TABLE_GENERATION, self.root)
+            except WebDriverException:
+                generation = None
+            self.valid = generation == self.generation
+        return self.valid
+
+    def to_dict(self) -> dict:
+        """Return the snapshot as plain data.
+
+        :return: the assignment columns and student rows
+        :rtype: dict
+
+        """
+        return {
+            'assignments': [column._asdict() for column in self.columns],
+            'students': [
+                dict(row._asdict(),
+                     assignments=[cell._asdict() for cell in row.assignments])
+                for row in self.students],
+        }
+
+
 class Tooltip(Region):
     """A scores pop up tool tip."""
 
@@ -127,6 +305,7 @@ class LateWork(Tooltip):
         button = self.find_element(*self._button_locator)
         Utility.click_option(self.driver, element=button)
         self.wait.until(expect.staleness_of(self.root))
+        self.page.invalidate_snapshot()
         return self.page
 
     accept_late_score = use_this_score
@@ -477,6 +656,7 @@ class SetWeights(Weights):
         button = self.find_element(*self._save_button_locator)
         Utility.click_option(self.driver, element=button)
         self.page.wait.until(expect.staleness_of(self.root))
+        self.page.invalidate_snapshot()
         return self.page
 
     def cancel(self):
@@ -584,6 +764,20 @@ class Scores(TutorBase):
         """
         return bool(self.find_elements(*self._table_root_locator))
 
+    def invalidate_snapshot(self) -> None:
+        """Discard the cached scores table snapshot.
+
+        Page object actions that sort, filter or change the table call this
+        so the next read pulls a fresh snapshot.
+
+        :return: None
+
+        """
+        snapshot = getattr(self, '_table_snapshot', None)
+        if snapshot:
+            snapshot.valid = False
+        self._table_snapshot = None
+
     @property
     def is_teacher(self):
         """Return True if the current user is an instructor.
@@ -658,6 +852,7 @@ class Scores(TutorBase):
         """
         button = self.find_element(*self._as_percentage_button_locator)
         Utility.click_option(self.driver, element=button)
+        self.invalidate_snapshot()
         sleep(0.25)
         return self
 
@@ -670,6 +865,7 @@ class Scores(TutorBase):
         """
         button = self.find_element(*self._as_number_button_locator)
         Utility.click_option(self.driver, element=button)
+        self.invalidate_snapshot()
         sleep(0.25)
         return self
 
@@ -864,6 +1060,7 @@ class Scores(TutorBase):
 
             """
             Utility.click_option(self.driver, element=self.root)
+            self.page.invalidate_snapshot()
             return self.page
 
     class Table(Region):
@@ -877,6 +1074,57 @@ class Scores(TutorBase):
             '[class*="_rowsContainer"] > div:nth-child(4) > div')
         _table_legend_locator = (By.CSS_SELECTOR, '[class*=Legend]')
 
+        def snapshot(self, refresh: bool = False) -> TableSnapshot:
+            """Read the entire scores table in a single request.
+
+            A cached snapshot is reused while the table DOM is unchanged.
+            The table generation is checked here, once per call, rather than
+            on every region property read, so regions built from a snapshot
+            fall back to live lookups after the next call finds the table
+            changed.
+
+            :param bool refresh: (optional) ignore any cached snapshot
+            :return: the assignment columns and student rows
+            :rtype: :py:class:`~pages.tutor.scores.TableSnapshot`
+
+            """
+            scores = self.page
+            cached = getattr(scores, '_table_snapshot', None)
+            if cached and not refresh and cached.current(self.driver):
+                return cached
+            scores.invalidate_snapshot()
+            snapshot = TableSnapshot(self.driver.execute_script(
+                TABLE_SNAPSHOT, self.root, self._snapshot_selectors()))
+            snapshot.root = self.root
+            scores._table_snapshot = snapshot
+            return snapshot
+
+        def _snapshot_selectors(self) -> dict:
+            """Return the region selectors used by the snapshot script."""
+            heading = self.Heading
+            column = heading.AssignmentInfo
+            student = self.Student
+            cell = student.Assignment
+            return {
+                'columns': (f'{self._table_heading_locator[1]} '
+                            f'{heading._assignment_locator[1]}'),
+                'columnGroup': column._assignment_type_locator[1],
+                'dueOn': column._due_on_locator[1],
+                'columnAverage': column._assignment_average_locator[1],
+                'students': self._table_students_locator[1],
+                'name': student._name_locator[1],
+                'studentId': student._student_id_locator[1],
+                'course': student._course_average_locator[1],
+                'homeworkScore': student._homework_score_locator[1],
+                'homeworkProgress': student._homework_progress_locator[1],
+                'readingScore': student._reading_score_locator[1],
+                'readingProgress': student._reading_progress_locator[1],
+                'cells': student._assignment_locator[1],
+                'work': cell._student_work_locator[1],
+                'score': cell._score_locator[1],
+                'late': cell._late_work_locator[1],
+            }
+
         @property
         def heading(self):
             """Access the scores table heading information.
@@ -892,13 +1140,15 @@ class Scores(TutorBase):
         def students(self):
             """Access the student row(s).
 
+            The rows are read from a single table snapshot.
+
             :return: the list of student score rows
             :rtype: list(:py:class:`~Scores.Table.Student`)
 
             """
-            return [self.Student(self, student)
-                    for student
-                    in self.find_elements(*self._table_students_locator)]
+            snapshot = self.snapshot()
+            return [self.Student(self, root, snapshot=snapshot, position=row)
+                    for row, root in enumerate(snapshot.student_roots)]
 
         @property
         def legend(self):
@@ -971,6 +1221,7 @@ class Scores(TutorBase):
 
                 """
                 Utility.click_option(self.driver, element=self.name_sort)
+                self.page.page.invalidate_snapshot()
                 sleep(0.5)
                 return self.page.page
 
@@ -1011,6 +1262,7 @@ class Scores(TutorBase):
 
                 """
                 Utility.click_option(self.driver, element=self.averages_toggle)
+                self.page.page.invalidate_snapshot()
                 sleep(1)
                 return self.page.page
 
@@ -1118,17 +1370,45 @@ class Scores(TutorBase):
             def assignments(self):
                 """Access the assignment column headers.
 
+                The headers are read from a single table snapshot.
+
                 :return: a list of assignment headers
                 :rtype: list(:py:class:`~Scores.Table.Heading.AssignmentInfo`)
 
                 """
-                return [self.AssignmentInfo(self, assignment)
-                        for assignment
-                        in self.find_elements(*self._assignment_locator)]
+                snapshot = self.page.snapshot()
+                return [self.AssignmentInfo(self, root, snapshot=snapshot,
+                                            position=column)
+                        for column, root
+                        in enumerate(snapshot.column_roots)]
 
             class AssignmentInfo(Region):
                 """An assignment column header."""
 
+                def __init__(self, page, root=None, snapshot=None,
+                             position=None):
+                    """Hold onto the table snapshot for the column.
+
+                    :param page: the table heading region
+                    :param root: the column header element
+                    :param snapshot: (optional) a table snapshot
+                    :type snapshot: :py:class:`TableSnapshot`
+                    :param int position: (optional) the column index within
+                        the snapshot
+                    :return: None
+
+                    """
+                    super().__init__(page, root)
+                    self._snapshot = snapshot
+                    self._position = position
+
+                def _cached(self, field):
+                    """Return a snapshot value or _STALE if unavailable."""
+                    if self._snapshot is None or not self._snapshot.valid:
+                        return _STALE
+                    return getattr(
+                        self._snapshot.columns[self._position], field)
+
                 _assignment_type_locator = (
                     By.CSS_SELECTOR, '.header-cell.group')
                 _due_on_locator = (
@@ -1150,6 +1430,9 @@ class Scores(TutorBase):
                     :rtype: str
 
                     """
+                    cached = self._cached('assignment_type')
+                    if cached is not _STALE:
+                        return cached
                     return (self.find_element(*self._assignment_type_locator)
                             .get_attribute('data-assignment-type'))
 
@@ -1161,6 +1444,9 @@ class Scores(TutorBase):
                     :rtype: str
 
                     """
+                    cached = self._cached('name')
+                    if cached is not _STALE:
+                        return cached
                     return (self.find_element(*self._assignment_type_locator)
                             .text)
 
@@ -1172,6 +1458,9 @@ class Scores(TutorBase):
                     :rtype: str
 
                     """
+                    cached = self._cached('due_on')
+                    if cached is not _STALE:
+                        return cached
                     return self.find_element(*self._due_on_locator).text
 
                 @property
@@ -1197,6 +1486,7 @@ class Scores(TutorBase):
                     if self.assignment_type != Tutor.EXTERNAL:
                         Utility.click_option(self.driver,
                                              element=self.score_sort)
+                        self.page.page.page.invalidate_snapshot()
                         sleep(0.5)
                     return self.page.page.page
 
@@ -1239,6 +1529,7 @@ class Scores(TutorBase):
 
                     """
                     Utility.click_option(self.driver, element=self.score_sort)
+                    self.page.page.page.invalidate_snapshot()
                     sleep(0.5)
                     return self.page.page.page
 
@@ -1270,6 +1561,9 @@ class Scores(TutorBase):
                     :rtype: int
 
                     """
+                    cached = self._cached('average')
+                    if cached is not _STALE:
+                        return cached
                     average = self.find_element(
                         *self._assignment_average_locator).text
                     return _average_helper(average.split()[0])
@@ -1311,6 +1605,28 @@ class Scores(TutorBase):
                 '[class*="cellGroupWrapper"]:nth-child(2) ' +
                 '.public_fixedDataTableCell_main')
 
+            def __init__(self, page, root=None, snapshot=None, position=None):
+                """Hold onto the table snapshot for the student row.
+
+                :param page: the scores table region
+                :param root: the student row element
+                :param snapshot: (optional) a table snapshot
+                :type snapshot: :py:class:`TableSnapshot`
+                :param int position: (optional) the row index within the
+                    snapshot
+                :return: None
+
+                """
+                super().__init__(page, root)
+                self._snapshot = snapshot
+                self._position = position
+
+            def _cached(self, field):
+                """Return a snapshot value or _STALE if unavailable."""
+                if self._snapshot is None or not self._snapshot.valid:
+                    return _STALE
+                return getattr(self._snapshot.students[self._position], field)
+
             @property
             def name(self):
                 """Return the student's name.
@@ -1319,6 +1635,9 @@ class Scores(TutorBase):
                 :rtype: str
 
                 """
+                cached = self._cached('name')
+                if cached is not _STALE:
+                    return cached
                 return self.find_element(*self._name_locator).text
 
             @property
@@ -1329,6 +1648,9 @@ class Scores(TutorBase):
                 :rtype: str
 
                 """
+                cached = self._cached('student_id')
+                if cached is not _STALE:
+                    return cached
                 return self.find_element(*self._student_id_locator).text
 
             def performance_forecast(self) -> PerformanceForecast:
@@ -1355,6 +1677,9 @@ class Scores(TutorBase):
                 :rtype: int or str
 
                 """
+                cached = self._cached('course_average')
+                if cached is not _STALE:
+                    return cached
                 average = self.find_element(*self._course_average_locator).text
                 return _average_helper(average)
 
@@ -1367,6 +1692,9 @@ class Scores(TutorBase):
                 :rtype: int or str
 
                 """
+                cached = self._cached('homework_score')
+                if cached is not _STALE:
+                    return cached
                 average = self.find_element(*self._homework_score_locator).text
                 return _average_helper(average)
 
@@ -1379,6 +1707,9 @@ class Scores(TutorBase):
                 :rtype: int or str
 
                 """
+                cached = self._cached('homework_progress')
+                if cached is not _STALE:
+                    return cached
                 average = (self.find_element(*self._homework_progress_locator)
                            .text)
                 return _average_helper(average)
@@ -1392,6 +1723,9 @@ class Scores(TutorBase):
                 :rtype: int or str
 
                 """
+                cached = self._cached('reading_score')
+                if cached is not _STALE:
+                    return cached
                 average = self.find_element(*self._reading_score_locator).text
                 return _average_helper(average)
 
@@ -1404,6 +1738,9 @@ class Scores(TutorBase):
                 :rtype: int or str
 
                 """
+                cached = self._cached('reading_progress')
+                if cached is not _STALE:
+                    return cached
                 average = (self.find_element(*self._reading_progress_locator)
                            .text)
                 return _average_helper(average)
@@ -1416,6 +1753,12 @@ class Scores(TutorBase):
                 :rtype: list(:py:class:`~Scores.Table.Student.Assignment`)
 
                 """
+                if self._snapshot is not None and self._snapshot.valid:
+                    cells = self._snapshot.cell_roots[self._position]
+                    return [self.Assignment(self, cell,
+                                            snapshot=self._snapshot,
+                                            position=(self._position, column))
+                            for column, cell in enumerate(cells)]
                 return [self.Assignment(self, assignment)
                         for assignment
                         in self.find_elements(*self._assignment_locator)]
@@ -1423,6 +1766,33 @@ class Scores(TutorBase):
             class Assignment(Region):
                 """A student assignment result."""
 
+                def __init__(self, page, root=None, snapshot=None,
+                             position=None):
+                    """Hold onto the table snapshot for the assignment cell.
+
+                    :param page: the student row region
+                    :param root: the assignment cell element
+                    :param snapshot: (optional) a table snapshot
+                    :type snapshot: :py:class:`TableSnapshot`
+                    :param position: (optional) the row and column indices
+                        within the snapshot
+                    :type position: tuple(int, int)
+                    :return: None
+
+                    """
+                    super().__init__(page, root)
+                    self._snapshot = snapshot
+                    self._position = position
+
+                def _cached(self, field):
+                    """Return a snapshot value or _STALE if unavailable."""
+                    if self._snapshot is None or not self._snapshot.valid:
+                        return _STALE
+                    row, column = self._position
+                    return getattr(
+                        self._snapshot.students[row].assignments[column],
+                        field)
+
                 _student_work_locator = (By.CSS_SELECTOR, 'a')
                 _score_locator = (By.CSS_SELECTOR, '.correct-score , a span')
                 _tooltip_locator = (By.CSS_SELECTOR, '.worked')
@@ -1436,6 +1806,9 @@ class Scores(TutorBase):
                     :rtype: str
 
                     """
+                    cached = self._cached('assignment_type')
+                    if cached is not _STALE:
+                        return cached
                     return (self.find_element(*self._student_work_locator)
                             .get_attribute('data-assignment-type'))
 
@@ -1448,6 +1821,9 @@ class Scores(TutorBase):
                     :rtype: int or str
 
                     """
+                    cached = self._cached('score')
+                    if cached is not _STALE:
+                        return cached
                     average = self.find_element(*self._score_locator).text
                     return _average_helper(average)
 
@@ -1496,6 +1872,9 @@ class Scores(TutorBase):
                     :rtype: bool
 
                     """
+                    cached = self._cached('late')
+                    if cached is not _STALE:
+                        return cached
                     return bool(self.find_elements(*self._late_work_locator))
 
                 def view_late_work_tooltip(self):
@@ -1527,6 +1906,9 @@ class Scores(TutorBase):
                     :rtype: bool
 
                     """
+                    cached = self._cached('accepted')
+                    if cached is not _STALE:
+                        return cached
                     try:
                         late_work = self.find_element(*self._late_work_locator)
                     except NoSuchElementException:
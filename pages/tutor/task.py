@@ -6,8 +6,7 @@ Externals, Events, Homeworks, and Readings
 
 from __future__ import annotations
 
-from time import sleep
-from typing import Dict, List, Union
+from typing import Dict, List, NamedTuple, Union
 
 from pypom import Region
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -26,12 +25,45 @@ from regions.tutor.print_preview import PrintPreview
 from regions.tutor.tooltip import Float
 from utils.tutor import Tutor, TutorException
 from utils.utilities import Utility, go_to_
+from utils.wait import Wait
 
 COMPUTED_STYLE = ('return window.getComputedStyle(document.querySelector('
                   '"{selector}")).{property} == "{expected_value}";')
+STEP_MARKERS = ('var root = arguments[0], markers = arguments[1], found = {};'
+                'for (var name in markers) {'
+                '  found[name] = !!root.querySelector(markers[name]);'
+                '}'
+                'return found;')
 TutorHighlight = Dict[str, List[WebElement]]
 
 
+class StepState(NamedTuple):
+    """The assignment step markers read by one script call."""
+
+    root: str
+    url: str
+    step_type: str
+    answered: bool
+    correctness_shown: bool
+    interstitial: bool
+    complete: bool
+    free_response: bool
+    multiple_choice: bool
+    multipart: bool
+    two_step_intro: bool
+
+    @property
+    def is_assessment(self) -> bool:
+        """Return True if the step is a question.
+
+        :return: ``True`` if the step has a free response box or multiple
+            choice answers
+        :rtype: bool
+
+        """
+        return self.free_response or self.multiple_choice
+
+
 class Assignment(TutorBase):
     """The shared assignment features."""
 
@@ -55,6 +87,8 @@ class Assignment(TutorBase):
     _document_loading_selector = '.loading-animation'
     _step_loading_selector = '[aria-labelledby*=Loading]'
 
+    _step_state = None
+
     @property
     def loaded(self) -> bool:
         """Return True when the various loading panes are gone.
@@ -74,7 +108,7 @@ class Assignment(TutorBase):
         tooltip = Float(self).is_open
         # quit if no page loader is present or a tooltip is found
         if ready and (not page_load or tooltip):
-            sleep(1.0)
+            Wait.for_dom_quiet(self.driver)
             return True
         # otherwise check for a reading panel loader
         try:
@@ -166,6 +200,14 @@ class Assignment(TutorBase):
         while Float(self).is_open:
             Float(self).close()
 
+    def invalidate_step_state(self) -> None:
+        """Discard the step state after an action changes the step.
+
+        :return: None
+
+        """
+        self._step_state = None
+
     class Content(Region):
         """A placeholder for the assignment body."""
 
@@ -183,6 +225,74 @@ class Assignment(TutorBase):
                              '.openstax-two-step-intro , '
                              '.openstax-personalized-intro')
 
+        _answered_locator = (
+            By.CSS_SELECTOR, '.has-correct-answer , .answer-correct , '
+                             '.answer-incorrect , .free-response')
+        _is_multipart_locator = (
+            By.CSS_SELECTOR, '.mpq')
+        _is_two_step_intro_locator = (
+            By.CSS_SELECTOR, '.openstax-two-step-intro')
+        _step_loading_locator = (
+            By.CSS_SELECTOR, '[aria-labelledby*=Loading] , '
+                             '[class*=LoadingCard]')
+
+        @property
+        def state(self) -> StepState:
+            """Return the markers for the current step.
+
+            The markers are read by one script once the DOM is quiet and
+            reused until the step changes or an action invalidates them; a
+            state read while the step is still loading is not kept. The body
+            root persists between steps so the step URL is part of the cache
+            key.
+
+            :return: the current step state
+            :rtype: :py:class:`~pages.tutor.task.StepState`
+
+            """
+            cached = self.page._step_state
+            url = self.driver.current_url
+            if (cached is not None and cached.root == self.root.id and
+                    cached.url == url):
+                return cached
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
+            markers = {
+                'answered': self._answered_locator[1],
+                'correctness_shown': self._correctness_shown_locator[1],
+                'complete': self._assignment_completion_locator[1],
+                'free_response': self._is_free_response_locator[1],
+                'interstitial': self._interstitial_card_locator[1],
+                'multiple_choice': self._is_multiple_choice_locator[1],
+                'multipart': self._is_multipart_locator[1],
+                'two_step_intro': self._is_two_step_intro_locator[1], }
+            found = self.driver.execute_script(
+                STEP_MARKERS, self.root,
+                dict(markers, loading=self._step_loading_locator[1]))
+            if found['complete']:
+                step_type = Tutor.END_CARD
+            elif found['interstitial']:
+                step_type = Tutor.REVIEW_CARD
+            elif (found['free_response'] or found['multiple_choice'] or
+                    found['multipart']):
+                step_type = Tutor.EXERCISE
+            else:
+                step_type = Tutor.READING
+            state = StepState(root=self.root.id, url=url,
+                              step_type=step_type,
+                              **{name: bool(found.get(name))
+                                 for name in markers})
+            if not found['loading']:
+                self.page._step_state = state
+            return state
+
+        def invalidate_state(self) -> None:
+            """Discard the step state so the next read probes the page.
+
+            :return: None
+
+            """
+            self.page.invalidate_step_state()
+
         @property
         def is_free_response(self) -> bool:
             """Return True if the current step contains a free response box.
@@ -192,8 +302,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return bool(self.find_elements(*self._is_free_response_locator))
+            return self.state.free_response
 
         @property
         def is_multiple_choice(self) -> bool:
@@ -204,8 +313,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return bool(self.find_elements(*self._is_multiple_choice_locator))
+            return self.state.multiple_choice
 
         @property
         def has_correct_answer(self) -> bool:
@@ -216,8 +324,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return bool(self.find_elements(*self._correctness_shown_locator))
+            return self.state.correctness_shown
 
         @property
         def is_assessment(self) -> bool:
@@ -228,8 +335,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return self.is_free_response or self.is_multiple_choice
+            return self.state.is_assessment
 
         @property
         def is_interstitial(self) -> bool:
@@ -240,8 +346,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return bool(self.find_elements(*self._interstitial_card_locator))
+            return self.state.interstitial
 
         @property
         def assignment_complete(self) -> bool:
@@ -251,9 +356,7 @@ class Assignment(TutorBase):
             :rtype: bool
 
             """
-            sleep(0.5)
-            return bool(self.find_elements(
-                *self._assignment_completion_locator))
+            return self.state.complete
 
     class Footer(Region):
         """The assignment footer."""
@@ -415,7 +518,7 @@ class External(Assignment):
             link = self.find_element(*self._external_url_locator)
             url = link.get_attribute('href')
             Utility.switch_to(self.driver, element=link)
-            sleep(1)
+            Wait.for_ready(self.driver)
             return url
 
 
@@ -433,12 +536,8 @@ class Homework(Assignment):
             By.CSS_SELECTOR, 'button.btn-primary , button.continue')
         _is_free_response_locator = (
             By.CSS_SELECTOR, 'textarea')
-        _is_multipart_locator = (
-            By.CSS_SELECTOR, '.mpq')
         _is_multiple_choice_locator = (
             By.CSS_SELECTOR, '.answers-table')
-        _is_two_step_intro_locator = (
-            By.CSS_SELECTOR, '.openstax-two-step-intro')
         _multipart_root_locator = (
             By.CSS_SELECTOR, '.homework-task > div')
 
@@ -454,9 +553,8 @@ class Homework(Assignment):
                 root element isn't found
 
             """
-            sleep(0.33)
-            multipart = self.find_elements(*self._is_multipart_locator)
-            if multipart:
+            state = self.state
+            if state.multipart:
                 mpq_root = self.find_element(*self._multipart_root_locator)
                 from regions.tutor.assessment import MultipartQuestion
                 return MultipartQuestion(self, mpq_root)
@@ -466,17 +564,15 @@ class Homework(Assignment):
                         self._assessment_root_locator))
             except TimeoutException:
                 raise TutorException('Assessment root not found')
-            free_response = self.find_elements(*self._is_free_response_locator)
-            if free_response:
+            if state.free_response:
                 from regions.tutor.assessment import FreeResponse
                 return FreeResponse(self, assessment_root)
-            multiple_choice = self.find_elements(
-                *self._is_multiple_choice_locator)
-            if multiple_choice:
+            if state.multiple_choice:
                 from regions.tutor.assessment import MultipleChoice
                 return MultipleChoice(self, assessment_root)
             # No assessment found; wait
-            sleep(1)
+            self.invalidate_state()
+            Wait.for_dom_quiet(self.driver)
             return self.pane
 
         def _continue(self) -> Homework:
@@ -486,18 +582,19 @@ class Homework(Assignment):
             :rtype: :py:class:`~pages.tutor.task.Homework`
 
             """
-            sleep(0.75)
+            Wait.for_settled(self.driver, quiet=0.1)
             button = self.find_element(*self._continue_button_locator)
             try:
                 Utility.click_option(self.driver, element=button)
             except NoSuchElementException:
-                sleep(1)
+                Wait.for_dom_quiet(self.driver)
                 try:
                     Utility.click_option(self.driver, element=button)
                 except NoSuchElementException:
                     raise TutorException(
                         f'Could not continue ({self.page.location})')
-            sleep(1)
+            self.invalidate_state()
+            Wait.for_settled(self.driver)
             if self.is_two_step_intro:
                 raise TutorException('Still on two-step intro')
             return Homework(self.driver, base_url=self.page.base_url)
@@ -511,7 +608,7 @@ class Homework(Assignment):
             :rtype: bool
 
             """
-            return bool(self.find_elements(*self._is_two_step_intro_locator))
+            return self.state.two_step_intro
 
         def back_to_dashboard(self, other_destination: bool = False) \
                 -> StudentCourse:
@@ -530,7 +627,7 @@ class Homework(Assignment):
                 button = self.find_element(
                     *self._back_to_dashboard_button_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(1)
+                Wait.for_settled(self.driver)
                 if other_destination:
                     return
                 return go_to_(
@@ -697,7 +794,8 @@ class Homework(Assignment):
 
                 """
                 Utility.click_option(self.driver, element=self.root)
-                sleep(1)
+                self.page.page.invalidate_step_state()
+                Wait.for_settled(self.driver)
                 return self.page.page
 
 
@@ -764,7 +862,7 @@ class Reading(Assignment):
             overlay_root.get_attribute('outerHTML'))
 
         toggle.send_keys(Keys.RETURN)
-        sleep(0.75)
+        Wait.for_dom_quiet(self.driver)
 
         if (not overlay_open and not milestones) or \
                 (overlay_open and not highlights_active and not milestones):
@@ -819,7 +917,7 @@ class Reading(Assignment):
         """
         # Use the javascript selector to find the inline buttons wherever they
         # appear.
-        sleep(1.0)
+        Wait.for_dom_quiet(self.driver)
         initial_highlights = self.current_highlights_on_page
         try:
             highlighter = self.wait.until(lambda _: self.driver.execute_script(
@@ -827,7 +925,8 @@ class Reading(Assignment):
                 f'("{self._highlight_button_selector}");'))
         except TimeoutException:
             raise TutorException('Highlight button not available')
-        sleep(1.0)
+        Wait.for_clickable(self.driver, element=highlighter, timeout=3,
+                           required=False)
         Utility.click_option(self.driver, element=highlighter)
         try:
             self.wait.until(
@@ -848,7 +947,7 @@ class Reading(Assignment):
             page after clicking the annotate button
 
         """
-        sleep(1.0)
+        Wait.for_dom_quiet(self.driver)
         initial_highlights = self.current_highlights_on_page
         try:
             annotater = self.wait.until(lambda _: self.driver.execute_script(
@@ -856,7 +955,8 @@ class Reading(Assignment):
                 f'("{self._annotation_button_selector}");'))
         except TimeoutException:
             raise TutorException('Annotation button not available')
-        sleep(1.0)
+        Wait.for_clickable(self.driver, element=annotater, timeout=3,
+                           required=False)
         Utility.click_option(self.driver, element=annotater)
         try:
             self.wait.until(
@@ -941,9 +1041,8 @@ class Reading(Assignment):
             """
             box = self.find_element(*self._annotation_content_box_locator)
             Utility.clear_field(self.driver, field=box)
-            sleep(0.25)
             box.send_keys(note)
-            sleep(0.25)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
 
         def save(self) -> Reading:
             """Click the save annotation checkmark button.
@@ -956,7 +1055,7 @@ class Reading(Assignment):
                 *self._save_annotation_button_locator)
             Utility.click_option(self.driver, element=checkmark)
             self.wait.until(lambda _: not self.is_displayed())
-            sleep(0.75)
+            Wait.for_settled(self.driver)
             return self.page
 
         def delete(self) -> Reading:
@@ -970,7 +1069,7 @@ class Reading(Assignment):
                 *self._delete_annotation_button_locator)
             Utility.click_option(self.driver, element=trashcan)
             self.wait.until(lambda _: not self.is_displayed())
-            sleep(0.75)
+            Wait.for_settled(self.driver)
             return self.page
 
         def previous(self) -> Reading.AnnotationBox:
@@ -983,7 +1082,7 @@ class Reading(Assignment):
             up_arrow = self.find_element(
                 *self._view_previous_note_button_locator)
             Utility.click_option(self.driver, element=up_arrow)
-            sleep(1)
+            Wait.for_dom_quiet(self.driver)
             return self
 
         def next(self) -> Reading.AnnotationBox:
@@ -996,7 +1095,7 @@ class Reading(Assignment):
             down_arrow = self.find_element(
                 *self._view_next_note_button_locator)
             Utility.click_option(self.driver, element=down_arrow)
-            sleep(1)
+            Wait.for_dom_quiet(self.driver)
             return self
 
         def see_all(self) -> MyHighlights:
@@ -1009,7 +1108,7 @@ class Reading(Assignment):
             see_all = self.find_element(
                 *self._view_all_highlights_button_locator)
             Utility.click_option(self.driver, element=see_all)
-            sleep(1)
+            Wait.for_dom_quiet(self.driver)
             overlay_root = self.driver.execute_script(
                 'return document.querySelector("{0}");'
                 .format(self.page._overlay_page_locator[1]))
@@ -1037,7 +1136,7 @@ class Reading(Assignment):
             try:
                 button = self.find_element(*self._previous_page_arrow_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(1)
+                Wait.for_settled(self.driver)
             except NoSuchElementException:
                 pass
             return Reading(self.driver, base_url=self.page.base_url)
@@ -1079,7 +1178,7 @@ class Reading(Assignment):
                 Utility.click_option(self.driver, element=self.next_page_arrow)
             except NoSuchElementException:
                 pass
-            sleep(1)
+            Wait.for_settled(self.driver)
             return Reading(self.driver, base_url=self.page.base_url)
 
         @property
@@ -1146,7 +1245,7 @@ class Reading(Assignment):
                 button = self.find_element(
                     *self._back_to_dashboard_button_locator)
                 Utility.click_option(self.driver, element=button)
-                sleep(1)
+                Wait.for_settled(self.driver)
                 return go_to_(
                     StudentCourse(self.driver, base_url=self.page.base_url))
             except NoSuchElementException:
@@ -1202,7 +1301,7 @@ class Reading(Assignment):
             :rtype: bool
 
             """
-            sleep(0.5)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self.driver.execute_script(
                 COMPUTED_STYLE.format(
                     selector=self.page._main_content_selector,
@@ -1280,7 +1379,7 @@ class Reading(Assignment):
                     if ((option in sections and not option_is_checked) or
                             (option not in sections and option_is_checked)):
                         section.select()
-                sleep(0.25)
+                Wait.for_dom_quiet(self.driver, quiet=0.1)
             return self
 
         def show_print_preview(self) -> PrintPreview:
@@ -1353,9 +1452,8 @@ class Reading(Assignment):
                 Utility.click_option(self.driver, element=button)
                 if text:
                     self.note_box.send_keys(text)
-                    sleep(0.1)
                     self.save_edit()
-                    sleep(0.25)
+                    Wait.for_settled(self.driver)
                 return self.page
 
             @property
@@ -1418,7 +1516,7 @@ class Reading(Assignment):
                     script, self._pop_over_content_selector)
                 confirm = pop_up.find_element(*self._delete_confirm_locator)
                 Utility.click_option(self.driver, element=confirm)
-                sleep(0.25)
+                Wait.for_settled(self.driver)
                 return self.page
 
     class Milestones(Region):
@@ -1436,7 +1534,7 @@ class Reading(Assignment):
             :rtype: bool
 
             """
-            sleep(0.5)
+            Wait.for_dom_quiet(self.driver, quiet=0.1)
             overlay = self.driver.execute_script(
                 'return document.querySelector' +
                 f'("{self._overlay_page_selector}");')
@@ -1455,7 +1553,7 @@ class Reading(Assignment):
                 'return document.querySelector("{0}");'
                 .format(self._milestone_chart_toggle_selector))
             Utility.click_option(self.driver, element=toggle)
-            sleep(0.3)
+            Wait.for_dom_quiet(self.driver)
             return self.page
 
         @property
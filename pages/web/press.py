@@ -9,6 +9,7 @@ from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 
 from pages.web.base import WebBase
+from utils.geometry import Geometry
 from utils.utilities import Utility, go_to_
 from utils.web import Web
 
@@ -441,11 +442,11 @@ class Press(WebBase):
         def is_displayed(self):
             """Return True if the portrait is loaded and in the frame."""
             Utility.scroll_to(self.driver, element=self.portrait, shift=-20)
-            card = self.find_element(*self._card_locator)
-            return (Utility.is_image_visible(
-                        self.driver, image=self.portrait) and
-                    Utility.in_viewport(
-                        self.driver, element=card, display_marks=True))
+            portrait, card = Geometry.measure(
+                self.driver, [self.portrait,
+                              self.find_element(*self._card_locator)])
+            explorer = Geometry.is_internet_explorer(self.driver)
+            return portrait.image_loaded(explorer) and card.in_viewport()
 
         @property
         def portrait(self):
@@ -208,7 +208,7 @@ class Research(WebBase):
         def is_visible(self):
             """Return True if the person's card is in the viewport."""
             return Utility.in_viewport(self.driver, element=self.root,
-                                       ignore_bottom=True, display_marks=True)
+                                       ignore_bottom=True)
 
     class Person(Entry):
         """A current member of the research team."""
@@ -1,6 +1,6 @@
 """The Subjects page."""
 
-from time import sleep
+from typing import Dict, FrozenSet, List, NamedTuple
 
 from pypom import Region
 from pypom.exception import UsageError
@@ -12,6 +12,40 @@ from pages.web.base import WebBase
 from utils.utilities import Utility, go_to_
 from utils.web import Library, Web, WebException
 
+# Javascript page requests
+# read the title, link and cover image for every visible book tile
+BOOK_TILES = '''
+return Array.from(document.querySelectorAll(arguments[0])).map(
+  function(cover) {
+    var image = cover.querySelector('img');
+    var link = cover.querySelector('a');
+    return [image ? image.getAttribute('alt') : '',
+            link ? link.href : '',
+            image ? image.src : ''];
+  });
+'''
+
+
+class BookTile(NamedTuple):
+    """A book cover read from the subjects page."""
+
+    position: int
+    title: str
+    url: str
+    image_source: str
+
+    @property
+    def url_append(self) -> str:
+        """Return the last part of the URL."""
+        return self.url.split('/')[-1]
+
+    @property
+    def language(self) -> str:
+        """Return the book language."""
+        if 'Fizyka' in self.title:
+            return Library.POLISH
+        return Library.ENGLISH
+
 
 class Subjects(WebBase):
     """The subjects page."""
@@ -21,6 +55,35 @@ class Subjects(WebBase):
     SEQUENCE = 1
     PEER_REVIEWED = 2
 
+    # the Library group used for each book selector
+    BOOK_GROUPS = {
+        Library.AP: 'ap',
+        Library.AVAILABLE: 'available',
+        Library.BOOKSHARE: 'bookshare',
+        Library.BUSINESS: 'business',
+        Library.COMP_COPY: 'comp_copy',
+        Library.CURRENT: 'current',
+        Library.HAS_I_LOCK: 'locked_instructor',
+        Library.HAS_I_UNLOCK: 'unlocked_instructor',
+        Library.HAS_S_LOCK: 'locked_student',
+        Library.HAS_S_UNLOCK: 'unlocked_student',
+        Library.HIGH_SCHOOL: 'high_school',
+        Library.HUMANITIES: 'humanities',
+        Library.ITUNES: 'itunes',
+        Library.KINDLE: 'kindle',
+        Library.MATH: 'math',
+        Library.PRINT_COPY: 'print',
+        Library.SCIENCE: 'science',
+        Library.SOCIAL: 'social_sciences',
+        Library.SUPERSEDED: 'superseded',
+    }
+    # the book languages used for each language selector
+    BOOK_LANGUAGES = {
+        Library.ALL_BOOKS: (Library.ENGLISH, Library.POLISH),
+        Library.OPENSTAX: (Library.ENGLISH, ),
+        Library.POLISH: (Library.POLISH, ),
+    }
+
     category_xpath = '//div[h2[text()="{subject}"]]'
 
     _loader_locator = (By.CSS_SELECTOR, '.subjects-page.loaded')
@@ -54,6 +117,9 @@ class Subjects(WebBase):
     _book_locator = (By.CSS_SELECTOR, 'div.book-category:not(.hidden) .cover')
     _image_locators = (By.CSS_SELECTOR, _book_locator[1] + ' img')
 
+    _group_titles: Dict[str, FrozenSet[str]] = {}
+    _tiles = None
+
     @property
     def loaded(self):
         """Override the base loader."""
@@ -65,6 +131,7 @@ class Subjects(WebBase):
 
     def wait_for_page_to_load(self):
         """Override the page wait."""
+        self.invalidate_catalog()
         WebDriverWait(self.driver, 15).until(
             lambda _: self.loaded)
         self.pm.hook.pypom_after_wait_for_page_to_load(page=self)
@@ -164,6 +231,50 @@ class Subjects(WebBase):
             *self._high_school_category_locator)
         return self.Category(self, high_school_root)
 
+    @property
+    def catalog(self) -> List[BookTile]:
+        """Return every visible book tile.
+
+        The tiles are read by a single script and kept until the page is
+        reloaded or the subject filter changes.
+
+        :return: the visible book tiles in page order
+        :rtype: list(:py:class:`BookTile`)
+
+        """
+        if self._tiles is None:
+            tiles = self.driver.execute_script(
+                BOOK_TILES, self._book_locator[1]) or []
+            self._tiles = [BookTile(position, *tile)
+                           for position, tile in enumerate(tiles)]
+        return self._tiles
+
+    def invalidate_catalog(self) -> None:
+        """Discard the book tiles read from the page.
+
+        :return: None
+
+        """
+        self._tiles = None
+
+    def book_tiles(self, _from: str = Library.OPENSTAX) -> List[BookTile]:
+        """Return the visible book tiles for a book selector.
+
+        :param str _from: (optional) a Library group, subject or language
+            selector; defaults to the English language books
+        :return: the matching book tiles
+        :rtype: list(:py:class:`BookTile`)
+        :raises :py:class:`~utils.web.WebException`: if the selector is not
+            known
+
+        """
+        if _from in self.BOOK_LANGUAGES:
+            languages = self.BOOK_LANGUAGES[_from]
+            return [tile for tile in self.catalog
+                    if tile.language in languages]
+        titles = self._titles(_from)
+        return [tile for tile in self.catalog if tile.title in titles]
+
     @property
     def _active_books(self):
         """Select active books for use by the class."""
@@ -243,14 +354,12 @@ class Subjects(WebBase):
     @property
     def openstax_books(self, filter_current=False):
         """Select active books while excluding Polish versions."""
-        return [book for book in self._active_books
-                if book.language == Library.ENGLISH]
+        return self._books(self.book_tiles(Library.OPENSTAX))
 
     @property
     def polish_books(self):
         """Select active books in Polish."""
-        return [book for book in self._active_books
-                if book.language == Library.POLISH]
+        return self._books(self.book_tiles(Library.POLISH))
 
     @property
     def print_books(self):
@@ -296,51 +405,40 @@ class Subjects(WebBase):
 
     def select_random_book(self, _from=Library.OPENSTAX, filter_current=False):
         """Return a random book from the active list."""
-        using = {
-            Library.ALL_BOOKS: self._active_books,
-            Library.AP: self.ap_books,
-            Library.AVAILABLE: self.available_books,
-            Library.BOOKSHARE: self.bookshare_books,
-            Library.BUSINESS: self.business_books,
-            Library.COMP_COPY: self.comp_copy,
-            Library.CURRENT: self.current_books,
-            Library.HAS_I_LOCK: self.locked_instructor,
-            Library.HAS_I_UNLOCK: self.unlocked_instructor,
-            Library.HAS_S_LOCK: self.locked_student,
-            Library.HAS_S_UNLOCK: self.unlocked_student,
-            Library.HIGH_SCHOOL: self.high_school,
-            Library.HUMANITIES: self.humanities_books,
-            Library.ITUNES: self.itunes_books,
-            Library.KINDLE: self.kindle_books,
-            Library.MATH: self.math_books,
-            Library.OPENSTAX: self.openstax_books,
-            Library.POLISH: self.polish_books,
-            Library.PRINT_COPY: self.print_books,
-            Library.SCIENCE: self.science_books,
-            Library.SOCIAL: self.social_sciences_books,
-            Library.SUPERSEDED: self.old_book_editions,
-        }.get(_from)
+        using = self.book_tiles(_from)
         if filter_current:
-            using = list(filter(
-                lambda book: book.title not in Library.OLD_EDITIONS, using))
+            using = [tile for tile in using
+                     if tile.title not in Library.OLD_EDITIONS]
         total = len(using)
         if total <= 0:
             raise WebException('No books are available for selection')
-        book = Utility.random(0, total - 1)
-        selected = using[book]
+        selected = using[Utility.random(0, total - 1)]
         print('Selected book: {0}'.format(selected.title))
-        destination = selected.url_append
-        selected.select()
-        sleep(1.0)
-        from pages.web.book import Book as Details
-        return go_to_(Details(self.driver, book_name=destination))
+        return self._books([selected])[0].select()
+
+    def _books(self, tiles):
+        """Return the book regions for a list of book tiles."""
+        covers = self.find_elements(*self._book_locator)
+        return [Book(self, covers[tile.position]) for tile in tiles]
 
     def _selection_helper(self, modifier):
         """Return a list of books for a modified collection."""
-        library = Library()
-        collection = library.get_titles(modifier)
-        return [book for book in self._active_books
-                if book.title in collection]
+        collection = set(Library().get_titles(modifier))
+        return self._books([tile for tile in self.catalog
+                            if tile.title in collection])
+
+    @classmethod
+    def _titles(cls, _from):
+        """Return the library titles for a book selector."""
+        titles = cls._group_titles.get(_from)
+        if titles is None:
+            group = cls.BOOK_GROUPS.get(_from)
+            if group is None:
+                raise WebException(f'Unknown book selection: {_from}')
+            library = Library()
+            titles = frozenset(library.get_titles(getattr(library, group)))
+            cls._group_titles[_from] = titles
+        return titles
 
     def view_about_our_textbooks(self):
         """Scroll to the textbook blurbs."""
@@ -371,6 +469,7 @@ class Subjects(WebBase):
         def view_books(self):
             """Select the filter category to view the topic textbooks."""
             Utility.click_option(self.driver, element=self.root)
+            self.page.invalidate_catalog()
             return self.page
 
         @property
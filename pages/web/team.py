@@ -34,7 +34,7 @@ class Individual(Region):
     def is_visible(self):
         """Return True if the person's card is in the viewport."""
         return Utility.in_viewport(self.driver, element=self.root,
-                                   ignore_bottom=True, display_marks=True)
+                                   ignore_bottom=True)
 
 
 class Team(WebBase):
@@ -480,6 +480,7 @@ class QuestionBase(Region):
         """
         sleep(0.33)
         Utility.click_option(self.driver, element=self.answer_button)
+        self._invalidate_step_state()
         if not multipart:
             sleep(1)
             if Utility.is_browser(self.driver, 'safari'):
@@ -495,6 +496,19 @@ class QuestionBase(Region):
             sleep(1.5)
         sleep(1)
 
+    def _invalidate_step_state(self) -> None:
+        """Discard the assignment step state cached by the task page.
+
+        :return: None
+
+        """
+        page = self.page
+        while isinstance(page, Region):
+            page = page.page
+        invalidate = getattr(page, 'invalidate_step_state', None)
+        if invalidate:
+            invalidate()
+
     def _continue(self, multipart: bool = False) -> None:
         """Click the 'Continue' button.
 
@@ -515,6 +529,7 @@ class QuestionBase(Region):
         sleep(1)
         if self.driver.current_url == current_page:
             self.answer_button.send_keys(Keys.RETURN)
+            self._invalidate_step_state()
             sleep(1)
 
     @property
@@ -1 +1,34 @@
 """Test the Accounts administrative pages."""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.accounts.admin.users import Search, UserRecord
+from tests.markers import accounts, nondestructive
+
+
+class OfflineDriver(WebDriver):
+    """Fail any command sent to the browser."""
+
+    def __init__(self):
+        """Start without a browser session."""
+        self.session_id = None
+
+    def execute(self, driver_command, params=None):
+        """Reject the command."""
+        raise AssertionError(f'Unexpected {driver_command} command')
+
+
+@nondestructive
+@accounts
+def test_search_result_emails_are_read_from_the_user_record():
+    """Build the result emails from the record without a table lookup."""
+    driver = OfflineDriver()
+    record = UserRecord.from_row({
+        'id': '1',
+        'emails': [['qa@openstax.org', 1], ['old@openstax.org', 0]]})
+    result = Search.Result(Search(driver), None, 1, record=record)
+
+    emails = [(email.email, email.is_confirmed) for email in result.emails]
+
+    assert(emails == [('qa@openstax.org', True),
+                      ('old@openstax.org', False)])
@@ -5,6 +5,8 @@ import os
 import pytest
 from dotenv import load_dotenv
 
+from utils.durations import DurationStore
+
 DOTENV_PATH = os.path.join(
     os.path.realpath(os.path.dirname(__file__)), '../.env')
 load_dotenv(dotenv_path=DOTENV_PATH)
@@ -14,8 +16,12 @@ load_dotenv(dotenv_path=DOTENV_PATH)
 pytest_plugins = (
     'fixtures.accounts',
     'fixtures.base',
+    'fixtures.durations',
     'fixtures.exercises',
+    'fixtures.mail',
     'fixtures.payments',
+    'fixtures.profiler',
+    'fixtures.selection',
     'fixtures.snapshot',
     'fixtures.tutor',
     'fixtures.users',
@@ -64,6 +70,21 @@ def pytest_addoption(parser):
         action='store_true',
         default=os.getenv('PRINT_PAGE_SOURCE_ON_FAILURE', False),
         help='Print page source to stdout when a test fails.')
+    selenium_options.addoption(
+        '--reuse-browser',
+        action='store_true',
+        default=os.getenv('REUSE_BROWSER', False),
+        help='Reuse warm browsers between tests instead of restarting them.')
+    settings.addini(
+        'reuse_browser',
+        default=False,
+        help='Reuse warm browsers between tests instead of restarting them.')
+    selenium_options.addoption(
+        '--browser-recycle',
+        action='store',
+        type=int,
+        default=int(os.getenv('BROWSER_RECYCLE', 25)),
+        help='Replace a reused browser after this many tests.')
     selenium_options.addoption(
         '--run-social',
         action='store_true',
@@ -83,6 +104,20 @@ def pytest_addoption(parser):
         'smoke_test',
         default=False,
         help='Run deployment smoke tests;\noption overrides other flags.')
+    selenium_options.addoption(
+        '--profile-webdriver',
+        action='store_true',
+        default=os.getenv('PROFILE_WEBDRIVER', False),
+        help='Time the WebDriver commands and sleeps of each page object.')
+    settings.addini(
+        'profile_webdriver',
+        default=False,
+        help='Time the WebDriver commands and sleeps of each page object.')
+    selenium_options.addoption(
+        '--profile-dir',
+        action='store',
+        default=os.getenv('PROFILE_DIR', os.path.join('results', 'profile')),
+        help='The directory for the WebDriver profile reports.')
     selenium_options.addoption(
         '--randomize',
         action='store_true',
@@ -92,6 +127,24 @@ def pytest_addoption(parser):
         'randomize',
         default=False,
         help='Randomize the test ordering.')
+    selenium_options.addoption(
+        '--schedule-by-duration',
+        action='store_true',
+        default=os.getenv('SCHEDULE_BY_DURATION', False),
+        help='Start the longest recorded tests first when using xdist.')
+    settings.addini(
+        'schedule_by_duration',
+        default=False,
+        help='Start the longest recorded tests first when using xdist.')
+    selenium_options.addoption(
+        '--snapshot-archive',
+        action='store_true',
+        default=os.getenv('SNAPSHOT_ARCHIVE', False),
+        help='Keep the JSON test snapshots in one compressed archive.')
+    settings.addini(
+        'snapshot_archive',
+        default=False,
+        help='Keep the JSON test snapshots in one compressed archive.')
     selenium_options.addoption(
         '--strip-flake',
         action='store_true',
@@ -242,6 +295,41 @@ def pytest_addoption(parser):
             os.getenv('GOOGLE_SIGNUP'),
             os.getenv('GOOGLE_SIGNUP_PASSWORD')],
         help='OpenStax test Google user signup account')
+    user_options.addoption(
+        '--cache-logins',
+        action='store_true',
+        default=os.getenv('CACHE_LOGINS', False),
+        help='Reuse stored log in sessions instead of logging in each test.')
+    settings.addini(
+        'cache_logins',
+        default=False,
+        help='Reuse stored log in sessions instead of logging in each test.')
+    user_options.addoption(
+        '--mail-sink',
+        action='store_true',
+        default=os.getenv('MAIL_SINK', False),
+        help='Receive test mail with a local sink instead of restmail.net.')
+    settings.addini(
+        'mail_sink',
+        default=False,
+        help='Receive test mail with a local sink instead of restmail.net.')
+    user_options.addoption(
+        '--mail-sink-port',
+        action='store',
+        type=int,
+        default=int(os.getenv('MAIL_SINK_PORT', 2525)),
+        help='The SMTP port for the local mail sink.')
+    user_options.addoption(
+        '--restmail-url',
+        action='store',
+        default=os.getenv('RESTMAIL_URL', None),
+        help='A RestMail-compatible mailbox URL with a {username} field.')
+    user_options.addoption(
+        '--login-ttl',
+        action='store',
+        type=float,
+        default=float(os.getenv('LOGIN_TTL', 1800)),
+        help='Discard a stored log in session after this many seconds.')
 
     # Product options
     product_options.addoption(
@@ -257,81 +345,6 @@ def pytest_addoption(parser):
             '         payments, support, tutor, web'))
 
 
-def pytest_collection_modifyitems(config, items):
-    """Runtime test options."""
-    # Runtime markers
-    run_smoke_tests = (config.getoption('--smoke-test') or
-                       config.getini('smoke_test'))
-    shuffle_tests = (config.getoption('--randomize') or
-                     config.getini('randomize'))
-    testrail = (config.getoption('--testrail') or
-                config.getini('testrail'))
-    skip_flake = (config.getoption('--strip-flake') or
-                  config.getini('strip_flake8'))
-
-    run_social = config.getoption('--run-social')
-    mark_run_social = pytest.mark.skip(reason='Skipping non-social tests.')
-    skip_social = config.getoption('--skip-social')
-    mark_skip_social = pytest.mark.skip(reason='Skipping social login tests.')
-
-    run_systems = (config.getoption('--systems') or
-                   config.getini('systems'))
-
-    headless_mode = (config.getoption('--headless') or
-                     config.getini('headless_browsing'))
-
-    # Throw out other ignored tests
-    deselected = []
-    remaining = []
-    for item in items:
-        if 'Function test_case' in str(item):
-            deselected.append(item)
-            continue
-        if run_smoke_tests:
-            if 'smoke_test' not in item.keywords:
-                deselected.append(item)
-                continue
-        if testrail:
-            if 'testrail' not in item.keywords:
-                deselected.append(item)
-                continue
-        if skip_flake:
-            item_name = str(item)
-            if 'Flake8Item' in item_name:
-                deselected.append(item)
-                continue
-        if run_systems:
-            keys = item.keywords
-            if ('accounts' not in run_systems and 'accounts' in keys or
-                    'biglearn' not in run_systems and 'biglearn' in keys or
-                    'exercises' not in run_systems and 'exercises' in keys or
-                    'payments' not in run_systems and 'payments' in keys or
-                    'tutor' not in run_systems and 'tutor' in keys or
-                    'support' not in run_systems and 'support' in keys or
-                    'web' not in run_systems and 'web' in keys):
-                deselected.append(item)
-                continue
-        if headless_mode and 'skip_if_headless' in item.keywords:
-            deselected.append(item)
-            continue
-        remaining.append(item)
-
-        # Apply runtime markers
-        if skip_social and 'social' in item.keywords:
-            item.add_marker(mark_skip_social)
-        if run_social and 'social' not in item.keywords:
-            item.add_marker(mark_run_social)
-
-    if deselected:
-        config.hook.pytest_deselected(items=deselected)
-        items[:] = remaining
-
-    # If requested, shuffle the test list
-    if shuffle_tests:
-        from random import shuffle
-        shuffle(items)
-
-
 def pytest_collectreport(report):
     """Break for errors during test collection."""
     if report.failed:
@@ -351,6 +364,10 @@ def pytest_runtest_makereport(item, call):
     # test failed (see selenium fixture)
     setattr(item, 'rep_{when}'.format(when=rep.when), rep)
 
+    # Record the time taken by each phase for the duration scheduler
+    if DurationStore.active is not None:
+        DurationStore.active.add(item, rep)
+
 
 def pytest_sessionfinish(session, exitstatus):
     """If pytest finishes without any tests being run, exit with a 0."""
@@ -0,0 +1,61 @@
+"""Test the calendar month snapshot without a browser."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.tutor.calendar import Calendar
+from tests.markers import nondestructive, tutor
+
+
+class FakeDriver(WebDriver):
+    """Render a calendar month selected by the month route."""
+
+    def __init__(self):
+        """Open on the first month of the year."""
+        self.month = datetime(2020, 1, 1)
+        self.loads = []
+        self.reads = 0
+
+    @property
+    def current_url(self):
+        """Return the course calendar route."""
+        return 'https://tutor-qa.openstax.org/course/1/t/month/2020-01-01'
+
+    def get(self, url):
+        """Load a month route."""
+        self.loads.append(url)
+        self.month = datetime.strptime(url.split('/')[-1], '%Y-%m-%d')
+
+    def find_element(self, by=None, value=None):
+        """Return the calendar container or the month label."""
+        return SimpleNamespace(text=f'{self.month:%B %Y}',
+                               is_displayed=lambda: True,
+                               get_attribute=lambda name: 'calendar-container')
+
+    def execute_script(self, script, *args):
+        """Read the month grid, rendering new day elements each time."""
+        self.reads += 1
+        return {'label': f'{self.month:%B %Y}', 'busy': False,
+                'days': [{'element': object(), 'classes': '', 'plans': [],
+                          'date': f'{self.month:%Y%m%d}'}]}
+
+
+@nondestructive
+@tutor
+def test_month_snapshot_is_dropped_when_the_month_changes():
+    """Read the grid again after leaving and returning to a month."""
+    driver = FakeDriver()
+    calendar = Calendar(driver)
+
+    january = calendar.snapshot()
+    cached = calendar.snapshot()
+    march = calendar.snapshot(datetime(2020, 3, 15))
+    returned = calendar.snapshot(datetime(2020, 1, 20))
+
+    assert(cached is january)
+    assert(march.month == datetime(2020, 3, 1))
+    assert(returned.month == january.month)
+    assert(returned.days[0].element is not january.days[0].element)
+    assert(driver.reads == 3 and len(driver.loads) == 2)
@@ -9,6 +9,7 @@ from typing import Union
 
 from autochomsky import chomsky
 
+from pages.tutor.calendar import Calendar
 from pages.tutor.enrollment import Enrollment, Terms
 from pages.tutor.home import TutorHome
 from pages.tutor.task import Homework
@@ -16,7 +17,7 @@ from tests.markers import nondestructive, skip_test, test_case, tutor
 from utils import bookterm
 from utils.email import RestMail
 from utils.tutor import States, Tutor
-from utils.utilities import Actions, Card, Utility
+from utils.utilities import Actions, Card, Utility, go_to_
 
 
 @skip_test(reason='WRM')
@@ -766,7 +767,7 @@ def test_assignment_creation_external(tutor_base_url, selenium, store):
 @skip_test(reason='WRM')
 @test_case('C485051')
 @tutor
-def test_assignment_creation_event(tutor_base_url, selenium, store):
+def test_assignment_creation_event(tutor_base_url, selenium, tutor_course):
     """Test publishing each assignment type.
 
     Start a new event from the assignment menu, switch it to individual section
@@ -774,32 +775,20 @@ def test_assignment_creation_event(tutor_base_url, selenium, store):
 
     """
     # SETUP:
-    test_data = store.get('C485051')
-    user = test_data.get('username')
-    if '-dev.' in tutor_base_url:
-        password = test_data.get('password_dev')
-    elif '-qa.' in tutor_base_url:
-        password = test_data.get('password_qa')
-    elif '-staging.' in tutor_base_url:
-        password = test_data.get('password_staging')
-    elif 'tutor.' in tutor_base_url:
-        password = test_data.get('password_prod')
-    else:
-        password = test_data.get('password_unique')
-    course_name = test_data.get('course_name')
+    # the teacher is logged in and the course and its sections are seeded
+    # through the Tutor API by the tutor_course fixture
     assignment_name = f'Auto Event - {Utility.random_hex(5)}'
     description = f'Assignment description for {assignment_name}'
     today = datetime.now()
     two_days_from_today = today + timedelta(days=2)
     dates_and_times = {
-        '1st': (today + timedelta(days=1), today + timedelta(days=2)),
-        '2nd': (today + timedelta(days=2), today + timedelta(days=3)),
-        '3rd': (today + timedelta(days=3), today + timedelta(days=4)), }
+        period.name: (today + timedelta(days=day),
+                      today + timedelta(days=day + 1))
+        for day, period in enumerate(tutor_course.periods, 1)}
 
     # GIVEN: a Tutor teacher viewing their course calendar
-    home = TutorHome(selenium, tutor_base_url).open()
-    courses = home.log_in(user, password)
-    calendar = courses.go_to_course(course_name)
+    selenium.get(f'{tutor_base_url}{tutor_course.path}')
+    calendar = go_to_(Calendar(selenium, tutor_base_url))
 
     # WHEN:  they open the 'Add Assignment' taskbar
     # AND:   click the 'Add Event' link
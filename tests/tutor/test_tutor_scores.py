@@ -0,0 +1,81 @@
+"""Test the scores table snapshot without a browser."""
+
+from types import SimpleNamespace
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.tutor.scores import TABLE_GENERATION, Scores, TableSnapshot
+from tests.markers import nondestructive, tutor
+
+
+class FakeDriver(WebDriver):
+    """Answer the table generation script with a settable counter."""
+
+    def __init__(self):
+        """Start at the first table generation."""
+        self.generation = 0
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        """Return the table generation."""
+        self.scripts.append(script)
+        return self.generation
+
+
+class FakeElement(SimpleNamespace):
+    """A table element holding its child elements by selector."""
+
+    def find_element(self, strategy, locator):
+        """Return a child element."""
+        return self.children[locator]
+
+
+def _snapshot(root):
+    snapshot = TableSnapshot([0, [], [[
+        None, 'Cached Name', '1234', '90%', '80%', '100%', '70%', '50%', []]]])
+    snapshot.root = root
+    return snapshot
+
+
+@nondestructive
+@tutor
+def test_snapshot_reads_fall_back_to_live_lookups_after_a_dom_change():
+    """Read the live row once a table check finds the generation moved on."""
+    driver = FakeDriver()
+    table = FakeElement(children={})
+    row = FakeElement(children={
+        Scores.Table.Student._name_locator[1]: SimpleNamespace(
+            text='Live Name')})
+    snapshot = _snapshot(table)
+    page = SimpleNamespace(driver=driver, timeout=1, pm=Scores(driver).pm)
+    student = Scores.Table.Student(page, row, snapshot=snapshot, position=0)
+
+    cached = [student.name, student.name, student.assignments]
+    current = snapshot.current(driver)
+    driver.generation = 1
+    changed = snapshot.current(driver)
+    live = student.name
+
+    assert(cached == ['Cached Name', 'Cached Name', []])
+    assert(current and not changed)
+    assert(live == 'Live Name')
+    assert(driver.scripts == [TABLE_GENERATION, TABLE_GENERATION])
+    driver.generation = 0
+    assert(not snapshot.current(driver))
+    assert(student.name == 'Live Name')
+
+
+@nondestructive
+@tutor
+def test_empty_snapshot_values_are_not_looked_up_again():
+    """Return a missing cached score without a live element lookup."""
+    driver = FakeDriver()
+    snapshot = TableSnapshot([0, [], [[
+        None, 'Name', '1234', None, '80%', '100%', '70%', '50%', []]]])
+    page = SimpleNamespace(driver=driver, timeout=1, pm=Scores(driver).pm)
+    student = Scores.Table.Student(page, FakeElement(children={}),
+                                   snapshot=snapshot, position=0)
+
+    assert(student.course_average is None)
+    assert(student.homework_score == 80)
+    assert(not driver.scripts)
@@ -0,0 +1,55 @@
+"""Test the assignment step state cache without a browser."""
+
+from types import SimpleNamespace
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.tutor.task import Assignment
+from tests.markers import nondestructive, tutor
+from utils.wait import Wait
+
+MARKERS = dict.fromkeys(
+    ('answered', 'correctness_shown', 'complete', 'free_response',
+     'interstitial', 'loading', 'multiple_choice', 'multipart',
+     'two_step_intro'), False)
+
+
+class FakeDriver(WebDriver):
+    """Report the step markers for a settable step URL."""
+
+    def __init__(self):
+        """Open on the first step."""
+        self.url = 'https://tutor-qa.openstax.org/course/1/task/2/step/1'
+        self.markers = {'multiple_choice': True}
+        self.reads = 0
+
+    @property
+    def current_url(self):
+        """Return the step URL."""
+        return self.url
+
+    def execute_script(self, script, *args):
+        """Return the step markers."""
+        self.reads += 1
+        return dict(MARKERS, **self.markers)
+
+
+@nondestructive
+@tutor
+def test_step_state_is_reread_when_the_step_changes(monkeypatch):
+    """Key the cached step state on the step as well as the body root."""
+    monkeypatch.setattr(Wait, 'for_dom_quiet', lambda *args, **kwargs: True)
+    driver = FakeDriver()
+    page = SimpleNamespace(driver=driver, timeout=1, _step_state=None,
+                           pm=Assignment(driver).pm)
+    content = Assignment.Content(page, SimpleNamespace(id='body'))
+
+    first = content.state
+    cached = content.state
+    driver.url = driver.url.replace('step/1', 'step/2')
+    driver.markers = {'free_response': True}
+    second = content.state
+
+    assert(cached is first and first.multiple_choice)
+    assert(second.free_response and not second.multiple_choice)
+    assert(driver.reads == 2)
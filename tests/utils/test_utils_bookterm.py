@@ -0,0 +1,64 @@
+"""Test the book term index."""
+
+import os
+
+import pytest
+from yaml import safe_load as load_yaml
+
+from tests.markers import nondestructive, support
+from utils import bookterm
+
+
+def _glossary(book):
+    with open(os.path.join(bookterm.BOOK_DIRECTORY, book)) as file:
+        return load_yaml(file)
+
+
+@nondestructive
+@support
+def test_book_terms_are_indexed_once(tmp_path, monkeypatch):
+    """Share one index per book regardless of the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    first, second = bookterm.Biology2e(), bookterm.Biology2e()
+
+    assert(first._terms is second._terms)
+    assert(first._terms is not bookterm.CollegePhysics()._terms)
+
+
+@nondestructive
+@support
+def test_chapter_terms_are_merged_from_sections():
+    """Return chapter terms from its sections with the first one winning."""
+    glossary = _glossary(bookterm.Biology_2e)
+    book = bookterm.Biology2e()
+    expected = {}
+    for section in range(9, 0, -1):
+        expected.update(glossary.get(float(f'1.{section}')) or {})
+
+    terms, definitions = book._terms.get(1)
+    term, definition = book.get_term('1')
+
+    assert(dict(zip(terms, definitions)) == expected)
+    assert(expected[term] == definition)
+    assert(glossary[1.1][book.get_term(1.1)[0]])
+    with pytest.raises(bookterm.BookIndexError):
+        book.get_term(999)
+    assert(book.get_random_term())
+
+
+@nondestructive
+@support
+def test_term_index_binary_cache(tmp_path, monkeypatch):
+    """Write the index to the cache and load it back on the next run."""
+    monkeypatch.setenv(bookterm.CACHE_VARIABLE, str(tmp_path))
+    path = os.path.join(bookterm.BOOK_DIRECTORY, bookterm.Sociology_2e)
+
+    built = bookterm.TermIndex.load(path)
+    cached = os.listdir(tmp_path)
+    loaded = bookterm.TermIndex.load(path)
+
+    assert(len(cached) == 1 and cached[0].endswith('.pickle'))
+    assert(loaded.sections == built.sections)
+    assert(all(loaded.get(section) == built.get(section)
+               for section in built.sections))
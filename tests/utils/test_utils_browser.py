@@ -0,0 +1,120 @@
+"""Test the warm browser pool."""
+
+from selenium.common.exceptions import (NoAlertPresentException,  # NOQA
+                                        WebDriverException)  # NOQA
+from urllib3.exceptions import MaxRetryError
+
+from tests.markers import nondestructive, support
+from utils.browser import DriverPool
+
+
+class FakeDriver:
+    """Record the calls made while resetting a browser."""
+
+    def __init__(self):
+        """Open with two tabs and a cookie."""
+        self.window_handles = ['main', 'popup']
+        self.cookies = ['session']
+        self.calls = []
+        self.alive = True
+        self.service_down = False
+        self.switch_to = self
+
+    @property
+    def alert(self):
+        """Raise as no alert is open."""
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        """Switch tabs."""
+        self._check()
+        self.calls.append(('window', handle))
+
+    def close(self):
+        """Close the current tab."""
+        self.window_handles.pop()
+
+    def execute_script(self, script):
+        """Run the storage reset."""
+        self.calls.append('script')
+
+    def delete_all_cookies(self):
+        """Clear the cookies."""
+        self._check()
+        self.cookies = []
+
+    def get(self, url):
+        """Load a page."""
+        self.calls.append(url)
+
+    def implicitly_wait(self, seconds):
+        """Set the implicit wait."""
+
+    def set_window_size(self, width, height):
+        """Resize the window."""
+        self.calls.append((width, height))
+
+    def quit(self):
+        """Stop the browser."""
+        if self.service_down:
+            raise ConnectionRefusedError()
+        self.alive = False
+
+    def _check(self):
+        if self.service_down:
+            raise MaxRetryError(None, '/session', 'connection refused')
+        if not self.alive:
+            raise WebDriverException('browser crashed')
+
+
+@nondestructive
+@support
+def test_browsers_are_reset_and_reused():
+    """Reuse a browser after closing tabs and clearing its state."""
+    pool = DriverPool()
+    first = pool.acquire('chrome', FakeDriver)
+    pool.release('chrome', first)
+
+    second = pool.acquire('chrome', FakeDriver)
+
+    assert(second is first)
+    assert(first.window_handles == ['main'] and not first.cookies)
+    assert(first.calls[-2:] == ['about:blank', (1024, 768)])
+    assert(pool.summary()['started'] == 1 and pool.reused == 1)
+
+
+@nondestructive
+@support
+def test_browsers_are_recycled_after_the_limit_or_a_crash():
+    """Replace a browser after N tests or when it stops responding."""
+    pool = DriverPool(limit=2)
+    driver = pool.acquire('firefox', FakeDriver)
+    pool.release('firefox', driver)
+    pool.release('firefox', pool.acquire('firefox', FakeDriver))
+
+    crashed = pool.acquire('firefox', FakeDriver)
+    crashed.alive = False
+    pool.release('firefox', crashed)
+    pool.acquire('firefox', FakeDriver)
+
+    assert(not driver.alive)
+    assert(crashed is not driver)
+    assert((pool.started, pool.recycled, pool.crashed) == (3, 1, 1))
+    pool.close()
+
+
+@nondestructive
+@support
+def test_browsers_are_recycled_when_the_driver_service_is_gone():
+    """Count a refused connection or a browser without windows as a crash."""
+    pool = DriverPool()
+    stopped = pool.acquire('chrome', FakeDriver)
+    stopped.service_down = True
+    pool.release('chrome', stopped)
+    windowless = pool.acquire('chrome', FakeDriver)
+    windowless.window_handles = []
+    pool.release('chrome', windowless)
+
+    assert(windowless is not stopped)
+    assert((pool.started, pool.reused, pool.crashed) == (2, 0, 2))
+    assert(not pool._idle)
@@ -0,0 +1,77 @@
+"""Test the bundled Braintree test card catalog."""
+
+import random
+
+from tests.markers import nondestructive, support
+from utils.cards import Card, CardCatalog, Status
+from utils.utilities import Utility
+
+BRAINTREE_PAGE = '''
+<table><tbody><tr><td>Skipped</td></tr></tbody></table>
+<table><tbody>
+  <tr><td>378282246310005</td><td>American Express</td></tr>
+  <tr><td>4111111111111111</td><td>Visa</td></tr>
+</tbody></table>
+<table><tbody>
+  <tr><td>4000111111111115</td><td>Visa</td><td>processor declined</td></tr>
+</tbody></table>
+<table><tbody>
+  <tr><td>4500600000000061</td><td>Prepaid</td></tr>
+</tbody></table>
+<table><tbody></tbody></table>
+'''
+
+
+@nondestructive
+@support
+def test_the_card_catalog_is_loaded_once_and_indexed():
+    """Share one catalog and answer lookups from its indexes."""
+    catalog = CardCatalog.shared()
+
+    valid_visa = catalog.find(status=Status.VALID, type=Status.VISA)
+
+    assert(Card().catalog is catalog is CardCatalog.shared())
+    assert(valid_visa and all(card['number'].startswith('4')
+                              for card in valid_visa))
+    assert(catalog.find(type=Status.VISA, status=Status.VALID) is valid_visa)
+    assert(catalog.find(response=Status.DECLINED, type=Status.MC))
+    generic = Card().generic()
+    assert(len(generic['cvv']) ==
+           (4 if generic[Status.TYPE] == Status.AMEX else 3))
+    assert(all(len(card['cvv']) == 3
+               for card in Card().get_by(Status.TYPE, Status.VISA)))
+    assert(all(len(card['cvv']) == 4
+               for card in Card().get_by(Status.TYPE, Status.AMEX)))
+
+
+@nondestructive
+@support
+def test_card_selection_follows_the_random_seed():
+    """Return the same cards for the same seed."""
+    selections = []
+    for _ in range(2):
+        random.seed(1234)
+        selections.append([Utility.get_test_credit_card(card=card)
+                           for card in (Status.VISA, Status.AMEX, Status.MC)])
+
+    assert(selections[0] == selections[1])
+    number, cvv = Utility.get_test_credit_card(status=Status.DECLINED)
+    assert(number == '4000111111111115' and len(cvv) == 3)
+
+
+@nondestructive
+@support
+def test_the_refreshed_catalog_round_trips(tmp_path):
+    """Parse the Braintree tables and reload the written catalog."""
+    path = str(tmp_path / 'cards.yaml')
+    parsed = CardCatalog(CardCatalog.parse(BRAINTREE_PAGE), '2020-06-01')
+
+    parsed.save(path)
+    loaded = CardCatalog.load(path)
+
+    assert([card['number'] for card in loaded.cards] ==
+           ['378282246310005', '4111111111111111', '4000111111111115',
+            '4500600000000061'])
+    assert(loaded.cards == parsed.cards)
+    assert(loaded.find(status=Status.TYPED)[0]['data'] == 'Prepaid')
+    assert(loaded.retrieved == '2020-06-01')
@@ -0,0 +1,125 @@
+"""Test the recorded durations and the longest-first scheduler."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.markers import nondestructive, support
+from utils.durations import DurationStore, group_key
+
+COURSE = 'tests/tutor/test_tutor_end_to_end.py'
+WEB = 'tests/web/test_web_home.py'
+
+
+class FakeCache:
+    """A pytest cache kept in memory."""
+
+    def __init__(self):
+        """Start empty."""
+        self.values = {}
+
+    def get(self, key, default):
+        """Return a cached value."""
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        """Store a value."""
+        self.values[key] = value
+
+
+def _item(nodeid, *fixtures):
+    return SimpleNamespace(nodeid=nodeid, fixturenames=list(fixtures))
+
+
+def _report(duration, skipped=False):
+    return SimpleNamespace(duration=duration, skipped=skipped)
+
+
+@nondestructive
+@support
+def test_durations_are_recorded_smoothed_and_grouped():
+    """Sum the test phases and blend them with the previous runs."""
+    cache = FakeCache()
+    first = DurationStore.load(cache)
+    create = _item(f'{COURSE}::test_create', 'selenium', 'teacher')
+    for duration in (2.0, 60.0, 1.0):
+        first.add(create, _report(duration))
+    first.add(_item(f'{WEB}::test_skipped'), _report(0.0, skipped=True))
+    first.save(cache)
+
+    second = DurationStore.load(cache)
+    second.add(create, _report(33.0))
+    second.save(cache)
+    history = DurationStore.load(cache).history
+
+    assert(list(history) == [create.nodeid])
+    assert(history[create.nodeid] ==
+           {'duration': 48.0, 'group': f'{COURSE}::teacher'})
+    assert(group_key(f'{COURSE}::test_b', ['store', 'selenium', 'admin']) ==
+           f'{COURSE}::admin+store')
+    assert(group_key(f'{WEB}::test_a', ['selenium']) == f'{WEB}::test_a')
+
+
+@nondestructive
+@support
+def test_groups_are_ordered_longest_first():
+    """Order groups by their total time and estimate unknown tests."""
+    store = DurationStore({
+        f'{COURSE}::test_create': {'duration': 300.0,
+                                   'group': f'{COURSE}::teacher'},
+        f'{COURSE}::test_edit': {'duration': 200.0,
+                                 'group': f'{COURSE}::teacher'},
+        f'{WEB}::test_a': {'duration': 4.0, 'group': f'{WEB}::test_a'},
+        f'{WEB}::test_b': {'duration': 96.0, 'group': f'{WEB}::test_b'},
+    })
+    nodeids = [f'{WEB}::test_a', f'{WEB}::test_b', f'{WEB}::test_new',
+               f'{COURSE}::test_create', f'{COURSE}::test_edit']
+    units = {}
+    for nodeid in nodeids:
+        units.setdefault(store.scope(nodeid), []).append(nodeid)
+
+    assert(store.estimate(f'{WEB}::test_new') == 150.0)
+    assert(store.order(units) ==
+           [f'{COURSE}::teacher', f'{WEB}::test_new', f'{WEB}::test_b',
+            f'{WEB}::test_a'])
+
+
+@nondestructive
+@support
+def test_the_scheduler_hands_out_the_longest_group_first():
+    """Assign the slow course group to the first worker."""
+    pytest.importorskip('xdist')
+    from utils.durations import DurationScheduling
+
+    class Node:
+        shutting_down = False
+
+        def __init__(self, name):
+            self.gateway = SimpleNamespace(id=name)
+            self.sent = []
+
+        def send_runtest_some(self, indexes):
+            self.sent.append(indexes)
+
+        def shutdown(self):
+            self.shutting_down = True
+
+    store = DurationStore({
+        f'{COURSE}::test_create': {'duration': 300.0,
+                                   'group': f'{COURSE}::teacher'},
+        f'{COURSE}::test_edit': {'duration': 200.0,
+                                 'group': f'{COURSE}::teacher'},
+    })
+    collection = [f'{WEB}::test_a', f'{COURSE}::test_create',
+                  f'{COURSE}::test_edit']
+    config = SimpleNamespace(getvalue=lambda name: ['2*popen'])
+    scheduler = DurationScheduling(config, store=store)
+    slow, fast = Node('gw0'), Node('gw1')
+    for node in (slow, fast):
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+
+    assert(slow.sent[0] == [1, 2])
+    assert(fast.sent[0] == [0])
@@ -1,16 +1,25 @@
 """Test the e-mail hosts."""
 
+import asyncio
+import base64
 import re
+import smtplib
+from email.message import EmailMessage
+from email.utils import formataddr as format_address
+from threading import Timer
+from time import monotonic
 
 import pytest
+from requests.exceptions import Timeout
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as expect
 from selenium.webdriver.support.ui import WebDriverWait
 
 from tests.markers import nondestructive, skip_test, social, support, test_case
-from utils.email import EmailVerificationError, GoogleBase  # NOQA
-from utils.email import GuerrillaMail, RestMail, SendMail  # NOQA
+from utils.email import EmailVerificationError, GmailReader, GoogleBase  # NOQA
+from utils.email import GuerrillaMail, MailPoller, RestMail  # NOQA
+from utils.email import MessageTokens, SendMail, _message_key  # NOQA
 
 TEST_EMAIL_SUBJECT = (
     '[OpenStax] Use PIN 999999 to confirm your email address'
@@ -25,7 +34,234 @@ TEST_EMAIL_BODY = (
     'wasn\'t you, please disregard this message.\n\nRegards,\nThe '
     'OpenStax Team'
 )
-GOOGLE = ('smtp.gmail.com', 587, 10)
+
+
+class FakeGmail:
+    """A Gmail API service stand-in."""
+
+    class Call:
+        """A prepared API request."""
+
+        def __init__(self, result):
+            self.result = result
+
+        def execute(self, http=None):
+            return self.result()
+
+    class Batch:
+        """A batch HTTP request."""
+
+        def __init__(self):
+            self.calls = []
+
+        def add(self, call, callback):
+            self.calls.append((call, callback))
+
+        def execute(self, http=None):
+            for number, (call, callback) in enumerate(self.calls):
+                callback(str(number), call.execute(), None)
+
+    def __init__(self):
+        """Start with an empty mailbox."""
+        self.messages_store = []
+        self.formats = []
+        self.listed = 0
+
+    def add(self, pin):
+        """Add a new message with a PIN in its snippet."""
+        number = len(self.messages_store)
+        self.messages_store.insert(0, {
+            'id': f'm{number}', 'historyId': str(100 + number),
+            'internalDate': str(1577836800000 + number * 1000),
+            'labelIds': ['INBOX'], 'snippet': f'Your PIN: {pin}',
+            'sizeEstimate': '100',
+            'payload': {'headers': [{'name': 'Subject', 'value': 'PIN'}]}})
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def history(self):
+        return self
+
+    def new_batch_http_request(self):
+        return self.Batch()
+
+    def list(self, userId, labelIds=None, startHistoryId=None, labelId=None,
+             historyTypes=None):
+        if startHistoryId is None:
+            self.listed += 1
+            return self.Call(lambda: {'messages': [
+                {'id': message['id']} for message in self.messages_store]})
+        return self.Call(lambda: {'history': [
+            {'messagesAdded': [{'message': message}]}
+            for message in self.messages_store
+            if int(message['historyId']) > int(startHistoryId)]})
+
+    def list_next(self, request, data):
+        return None
+
+    def get(self, userId, id, format='full', metadataHeaders=None):
+        self.formats.append(format)
+        message = next(message for message in self.messages_store
+                       if message['id'] == id)
+        if format == 'full':
+            data = base64.urlsafe_b64encode(b'Full body').decode()
+            message = dict(message, payload=dict(message['payload'], parts=[{
+                'headers': [{'name': 'Content-Transfer-Encoding',
+                             'value': 'base64'}],
+                'body': {'data': data}}]))
+        return self.Call(lambda: message)
+
+
+def deliver(sink, user, subject, text=TEST_EMAIL_BODY):
+    """Send a message to a mailbox through the sink's SMTP port."""
+    message = EmailMessage()
+    message['From'] = format_address(('OpenStax QA', 'noreply@openstax.org'))
+    message['To'] = f'{user}@restmail.net'
+    message['Subject'] = subject
+    message.set_content(text)
+    with smtplib.SMTP(sink.host, sink.smtp_port, timeout=5) as smtp:
+        smtp.send_message(message)
+
+
+@support
+@nondestructive
+def test_restmail_wait_returns_when_mail_arrives(mail_sink):
+    """Return as soon as a message is delivered."""
+    email = RestMail('waiting')
+    Timer(0.3, deliver, args=(mail_sink, 'waiting', TEST_EMAIL_SUBJECT)) \
+        .start()
+
+    box = email.wait_for_mail(max_time=5)
+
+    assert(box[-1].has_pin), 'PIN not found'
+    assert(box[-1].subject == TEST_EMAIL_SUBJECT)
+    assert(box[-1].recipients[0]['address'] == 'waiting@restmail.net')
+    assert(email.poller is mail_sink)
+    assert(mail_sink.deliveries[-1].waited < 1)
+    assert(mail_sink.stats()['count'] == 1)
+
+
+@support
+@nondestructive
+def test_restmail_wait_honors_the_timeout(mail_sink):
+    """Stop waiting after max_time seconds rather than max_time / pause."""
+    email = RestMail('nobody')
+    start = monotonic()
+
+    with pytest.raises(Timeout):
+        email.wait_for_mail(max_time=0.5)
+
+    assert(monotonic() - start < 1)
+
+
+@support
+@nondestructive
+def test_restmail_poller_backs_off_over_http(mail_sink):
+    """Read the sink's RestMail endpoint with a backing off poller."""
+    poller = MailPoller(mail_sink.url)
+    requests = []
+    get = poller.session.get
+
+    def counted(*args, **kwargs):
+        requests.append(args[0])
+        return get(*args, **kwargs)
+
+    poller.session.get = counted
+    deliver(mail_sink, 'polled', 'Existing message')
+    assert([package['subject'] for package in poller.fetch('polled')] ==
+           ['Existing message'])
+
+    with pytest.raises(Timeout):
+        poller.watch('nobody', timeout=0.5).result()
+    waited = poller.watch('polled', seen={_message_key(
+        mail_sink.fetch('polled')[0])}, timeout=5)
+    deliver(mail_sink, 'polled', TEST_EMAIL_SUBJECT)
+
+    assert(waited.result()[-1]['subject'] == TEST_EMAIL_SUBJECT)
+    assert(len(requests) < 12), 'Polling did not back off'
+    poller.delete('polled')
+    assert(mail_sink.fetch('polled') == [])
+
+
+@support
+@nondestructive
+def test_restmail_waiters_share_one_poller(mail_sink):
+    """Wait on several mailboxes at once and only parse new messages."""
+    boxes = [RestMail(f'user{number}') for number in range(4)]
+    deliver(mail_sink, 'user0', 'Existing message')
+    first = boxes[0].get_mail()[0]
+    futures = [box.mail_future(max_time=5, new=True) for box in boxes]
+    for number in range(4):
+        deliver(mail_sink, f'user{number}', TEST_EMAIL_SUBJECT)
+
+    inboxes = [future.result() for future in futures]
+
+    assert([len(inbox) for inbox in inboxes] == [2, 1, 1, 1])
+    assert(inboxes[0][0] is first), 'Existing message parsed again'
+    assert(boxes[1].poller is boxes[0].poller)
+    deliver(mail_sink, 'user1', 'Async message')
+    inbox = asyncio.run(boxes[1].wait_for_mail_async(max_time=5, new=True))
+    assert(inbox[-1].subject == 'Async message')
+    boxes[1].empty()
+    assert(boxes[1].size == 0 and not boxes[1].get_mail())
+
+
+@support
+@nondestructive
+def test_send_mail_reuses_one_connection(mail_sink, monkeypatch):
+    """Send a batch over one session and reconnect after it is dropped."""
+    monkeypatch.setattr(SendMail, '_connections', {})
+    send = SendMail('qa', 'secret', mail_sink.host, mail_sink.smtp_port)
+    sender = ('OpenStax QA', 'noreply@openstax.org')
+    batch = [SendMail.message(('Support', f'support{number}@restmail.net'),
+                              sender, f'Message {number}', TEST_EMAIL_BODY)
+             for number in range(3)]
+
+    timings = send.send_batch(batch)
+    send.connection.smtp.close()  # the relay dropped the session
+    single = send.send_mail(('Support', 'support0@restmail.net'), sender,
+                            TEST_EMAIL_SUBJECT, TEST_EMAIL_BODY)
+    other = SendMail('qa', 'secret', mail_sink.host, mail_sink.smtp_port)
+    other.send_mail(('Support', 'support1@restmail.net'), sender,
+                    'Shared', TEST_EMAIL_BODY)
+    monkeypatch.setattr(SendMail, 'IDLE_TIMEOUT', -1)
+    other.send_mail(('Support', 'support2@restmail.net'), sender,
+                    'After idle', TEST_EMAIL_BODY)
+
+    assert([timing.subject for timing in timings] ==
+           ['Message 0', 'Message 1', 'Message 2'])
+    assert(single.subject == TEST_EMAIL_SUBJECT)
+    assert(RestMail('support0').get_mail()[-1].has_pin)
+    assert(send.stats()['count'] == 4)
+    assert(other.stats()['connections'] == 3)
+    SendMail.close_all()
+    assert(send.connection.smtp is None)
+
+
+@support
+@nondestructive
+def test_message_tokens_are_found_in_one_pass():
+    """Read the PIN and both links together and cache them."""
+    text = (TEST_EMAIL_BODY +
+            '\nhttps://accounts-qa.openstax.org/confirm?code=abc123'
+            '\nhttps://accounts.openstax.org/i/reset_password?token=xyz789')
+    email = RestMail.Email({'text': text, 'subject': 'Confirm'})
+    plain = RestMail.Email({'subject': 'No tokens'})
+
+    assert(MessageTokens.scan(text) == MessageTokens(
+        '999999',
+        'https://accounts-qa.openstax.org/confirm?code=abc123',
+        'https://accounts.openstax.org/i/reset_password?token=xyz789'))
+    assert(email.has_pin and email.pin == '999999')
+    assert(email.has_link and email.has_reset)
+    assert(email.tokens is email.tokens), 'Tokens scanned again'
+    assert(not (plain.has_pin or plain.has_link or plain.has_reset))
+    with pytest.raises(EmailVerificationError):
+        plain.reset_link
 
 
 @test_case('C195537')
@@ -101,14 +337,15 @@ def test_guerrilla_mail_received_pin_email(selenium):
 
 @test_case('C210268')
 @support
-def test_restmail_received_pin_email(google_signup):
+@nondestructive
+def test_restmail_received_pin_email(mail_sink):
     """Test a RestMail JSON email."""
     # GIVEN: A RestMail address with a verification PIN email
     username = 'openstax'
     email = RestMail(username)
     email.empty()  # clear the message inbox
 
-    send = SendMail(*google_signup, *GOOGLE)
+    send = SendMail('qa', 'password', mail_sink.host, mail_sink.smtp_port)
     sender = ('OpenStax QA', 'noreply@openstax.org')
     recipient = ('OpenStax Automation', 'openstax@restmail.net')
     send.send_mail(recipient, sender, TEST_EMAIL_SUBJECT, TEST_EMAIL_BODY)
@@ -119,3 +356,24 @@ def test_restmail_received_pin_email(google_signup):
     # THEN: Able to retrieve a fake confirmation PIN
     assert(box), 'No emails recovered'
     assert(box[-1].has_pin), 'PIN not found'
+
+
+@support
+@nondestructive
+def test_gmail_reader_only_downloads_new_messages():
+    """Read metadata incrementally and fetch bodies on demand."""
+    service = FakeGmail()
+    for pin in ('111111', '222222'):
+        service.add(pin)
+
+    reader = GmailReader('fake', service=service).read_mail()
+    assert(reader.size == 2 and reader.latest.get_pin == '222222')
+    service.add('333333')
+    reader = GmailReader('fake', service=service).read_mail()
+
+    assert(reader.sort_mail().latest.get_pin == '333333')
+    assert(reader.size == 3 and reader[-1].get_pin == '111111')
+    assert(service.listed == 1), 'History was not used for the second read'
+    assert(service.formats == ['metadata'] * 3)
+    assert(reader.latest.body == 'Full body')
+    assert(service.formats[-1] == 'full')
@@ -0,0 +1,103 @@
+"""Test the batched element geometry checks."""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from tests.markers import nondestructive, support
+from utils.geometry import Geometry
+from utils.utilities import Utility
+
+VIEW = [0, 100, 1024, 868]
+
+
+class FakeDriver:
+    """Answer the geometry script with prepared element measurements."""
+
+    capabilities = {'browserName': 'chrome'}
+
+    def __init__(self, measurements):
+        """Store the measurements keyed by element or selector."""
+        self.measurements = measurements
+        self.scripts = []
+        self.found = []
+
+    def find_elements(self, strategy, selector):
+        """Find the elements for a non-CSS locator."""
+        self.found.append(selector)
+        return [selector]
+
+    def find_element(self, strategy, selector):
+        """Find an element."""
+        return selector
+
+    def execute_script(self, script, targets):
+        """Measure every target in a single call."""
+        self.scripts.append(targets)
+        return [dict(self.measurements[target], element=target, view=VIEW)
+                for target in targets]
+
+
+def _measurement(box, displayed=True, image=False, natural=True,
+                 sized=True):
+    return {'box': box, 'displayed': displayed, 'sized': sized,
+            'image': image, 'complete': natural if image else None,
+            'natural': natural if image else None}
+
+
+@nondestructive
+@support
+def test_a_group_of_elements_is_measured_in_one_script_call():
+    """Measure elements and locators together against the viewport."""
+    driver = FakeDriver({
+        'header': _measurement([10, 120, 500, 200]),
+        '.logo': _measurement([10, 900, 500, 980], image=True),
+        '//footer': _measurement([0, 850, 1024, 1200]),
+    })
+
+    results = Geometry.measure(
+        driver, ['header', (By.CSS_SELECTOR, '.logo'), (By.XPATH, '//footer')])
+
+    assert(len(driver.scripts) == 1)
+    assert(driver.found == ['//footer'])
+    assert([result.in_viewport() for result in results] ==
+           [True, False, False])
+    assert(results[2].in_viewport(ignore_bottom=True))
+    assert(Geometry.images_loaded(driver, [(By.CSS_SELECTOR, '.logo')]))
+    assert(not Utility.in_viewport(driver, element='//footer'))
+    assert(len(driver.scripts) == 3)
+
+
+@nondestructive
+@support
+def test_unsized_images_are_skipped_for_locators_only():
+    """Skip images without a height only when they are found by locator."""
+    driver = FakeDriver({
+        'img': _measurement([0, 0, 0, 0], image=True, natural=False,
+                            sized=False),
+    })
+
+    assert(Utility.is_image_visible(driver, locator=(By.CSS_SELECTOR, 'img')))
+    assert(not Utility.is_image_visible(driver, image='img'))
+
+
+@nondestructive
+@support
+def test_bulk_visibility_assertion_lists_every_failure():
+    """Report each hidden, unloaded or off screen element at once."""
+    driver = FakeDriver({
+        'hidden': _measurement([0, 0, 0, 0], displayed=False),
+        'broken': _measurement([0, 120, 10, 130], image=True, natural=False),
+        'below': _measurement([0, 900, 10, 950]),
+        'shown': _measurement([0, 120, 10, 130]),
+    })
+
+    assert(len(Geometry.assert_visible(driver, ['shown', 'below'])) == 2)
+    with pytest.raises(AssertionError) as failure:
+        Geometry.assert_visible(
+            driver, ['hidden', 'broken', 'below', 'shown'], in_viewport=True)
+
+    message = str(failure.value)
+    assert('Element 0 is not displayed' in message)
+    assert('Element 1 image is not rendered' in message)
+    assert('Element 2 is not in the window' in message)
+    assert('Element 3' not in message)
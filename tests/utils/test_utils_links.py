@@ -0,0 +1,138 @@
+"""Test the pooled link checker against a local HTTP server."""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+
+import pytest
+
+from tests.markers import nondestructive, support
+from utils.links import LinkChecker
+from utils.utilities import Utility
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    """Answer link checks with canned responses."""
+
+    hits = Counter()
+    active = 0
+    most_active = 0
+    lock = Lock()
+
+    def do_HEAD(self):
+        """Respond to a HEAD request."""
+        self._respond(head=True)
+
+    def do_GET(self):
+        """Respond to a GET request."""
+        self._respond(head=False)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+    def _respond(self, head):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] += 1
+            hits = cls.hits[self.path]
+            cls.active += 1
+            cls.most_active = max(cls.most_active, cls.active)
+        try:
+            if self.path.startswith('/slow'):
+                sleep(0.2)
+            if self.path == '/missing':
+                code = 404
+            elif self.path == '/busy':
+                code = 503 if hits < 3 else 200
+            elif self.path == '/no-head':
+                code = 403 if head else 200
+            else:
+                code = 200
+            self.send_response(code)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+@pytest.fixture
+def server():
+    """Run the stand-in HTTP server for a single test."""
+    LinkHandler.hits.clear()
+    LinkHandler.active = LinkHandler.most_active = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), LinkHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@nondestructive
+@support
+def test_link_batch_reports_status_and_latency(server):
+    """Check a batch of links and return per-link results in order."""
+    checker = LinkChecker(backoff=0.01)
+    urls = [f'{server}/ok', f'{server}/missing', f'{server}/no-head']
+
+    results = checker.check_all(urls)
+
+    assert([result.url for result in results] == urls)
+    assert([result.status for result in results] == [200, 404, 200])
+    assert(results[1].reason == '<404 Not Found>')
+    assert(not results[1].passed)
+    assert(results[2].method == 'GET'), 'HEAD 403 did not fall back to GET'
+    assert(all(result.latency > 0 for result in results))
+    checker.close()
+
+
+@nondestructive
+@support
+def test_link_results_are_cached(server):
+    """Only request a URL once per checker."""
+    checker = LinkChecker()
+
+    first = checker.check(f'{server}/ok')
+    second = checker.check_all([f'{server}/ok', f'{server}/ok'])
+
+    assert(second == [first, first])
+    assert(LinkHandler.hits['/ok'] == 1)
+    checker.close()
+
+
+@nondestructive
+@support
+def test_link_server_errors_are_retried(server):
+    """Back off and retry a 503 until the link recovers."""
+    checker = LinkChecker(backoff=0.01)
+
+    result = checker.check(f'{server}/busy')
+
+    assert(result.ok)
+    assert(result.attempts == 3)
+    checker.close()
+
+
+@nondestructive
+@support
+def test_link_requests_are_limited_per_host(server):
+    """Never send more than the host limit at once."""
+    checker = LinkChecker(workers=8, per_host=2)
+
+    results = checker.check_all([f'{server}/slow{n}' for n in range(8)])
+
+    assert(all(result.ok for result in results))
+    assert(LinkHandler.most_active <= 2)
+    checker.close()
+
+
+@nondestructive
+@support
+def test_url_and_warn_warns_for_a_missing_link(server):
+    """Warn and fail for a link that returns a client error."""
+    with pytest.warns(UserWarning, match='404 Not Found'):
+        assert(not Utility.test_url_and_warn(url=f'{server}/missing',
+                                             message='Missing page'))
+    assert(Utility.test_url_and_warn(url=f'{server}/ok'))
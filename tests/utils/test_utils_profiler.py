@@ -0,0 +1,132 @@
+"""Test the WebDriver command profiler."""
+
+import importlib.util
+import time
+
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from tests.markers import nondestructive, support
+from utils.profiler import WebDriverProfiler, report_path
+
+PAGE = '''
+import time
+
+
+class Home:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def title(self):
+        return self.driver.execute('getTitle')['value']
+
+    def load(self):
+        time.sleep(0.001)
+        return self.title
+
+
+class Calendar:
+
+    class Day(Home):
+
+        @property
+        def title(self):
+            return self.driver.execute('getPageSource')['value']
+
+        @classmethod
+        def open(cls, driver):
+            return cls(driver).load()
+'''
+
+
+class FakeExecutor:
+    """Answer every command with the command name."""
+
+    def execute(self, command, params):
+        """Return a successful response."""
+        return {'status': 0, 'value': command}
+
+
+def _driver():
+    driver = object.__new__(WebDriver)
+    driver.session_id = 'session'
+    driver.command_executor = FakeExecutor()
+    driver.error_handler = ErrorHandler()
+    driver.w3c = True
+    return driver
+
+
+def _page_module(root):
+    (root / 'pages').mkdir()
+    (root / 'pages' / 'home.py').write_text(PAGE)
+    spec = importlib.util.spec_from_file_location(
+        'profiled.home', root / 'pages' / 'home.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@nondestructive
+@support
+def test_commands_are_charged_to_page_object_methods(tmp_path):
+    """Aggregate commands and sleeps by the page object method calling them."""
+    module = _page_module(tmp_path)
+    home = module.Home(_driver())
+    execute, sleep = WebDriver.execute, time.sleep
+    previous = WebDriverProfiler.active
+    profiler = WebDriverProfiler(root=str(tmp_path)).install()
+    try:
+        home.title
+        profiler.start('tests/test_home.py::test_load')
+        assert(home.load() == 'getTitle')
+        home.driver.execute('getCurrentUrl')
+        module.Calendar.Day.open(home.driver)
+        profile = profiler.finish()
+    finally:
+        profiler.uninstall()
+    report = profile.report()
+    lines = profile.folded().splitlines()
+
+    assert(WebDriver.execute is execute and time.sleep is sleep)
+    assert(WebDriverProfiler.active is previous)
+    assert(report['count'] == 5)
+    assert({(call['method'], call['command'], call['count'])
+            for call in report['calls']} ==
+           {('profiled.home.Home.title', 'getTitle', 1),
+            ('profiled.home.Calendar.Day.title', 'getPageSource', 1),
+            ('profiled.home.Home.load', 'sleep', 2),
+            ('(test)', 'getCurrentUrl', 1)})
+    assert([line.rsplit(' ', 1)[0] for line in lines] == [
+        'tests/test_home.py::test_load;getCurrentUrl',
+        'tests/test_home.py::test_load;profiled.home.Calendar.Day.open;'
+        'profiled.home.Home.load;profiled.home.Calendar.Day.title;'
+        'getPageSource',
+        'tests/test_home.py::test_load;profiled.home.Calendar.Day.open;'
+        'profiled.home.Home.load;sleep',
+        'tests/test_home.py::test_load;profiled.home.Home.load;'
+        'profiled.home.Home.title;getTitle',
+        'tests/test_home.py::test_load;profiled.home.Home.load;sleep'])
+    assert(profiler.session.calls == profile.calls)
+
+
+@nondestructive
+@support
+def test_profiles_merge_and_write_reports(tmp_path):
+    """Merge worker profiles and write the JSON and folded reports."""
+    profiler = WebDriverProfiler(root=str(tmp_path))
+    profiler.current = profiler.session
+    profiler.test = 'tests/test_a.py::test_one[a b]'
+    profiler.session.add((profiler.test, 'pages.home.Home.open'), 'get', 0.5)
+    other = WebDriverProfiler(root=str(tmp_path)).session
+    other.merge(profiler.session.to_dict())
+    other.merge(profiler.session.to_dict())
+    path = report_path(str(tmp_path), profiler.test)
+    other.write(path)
+
+    assert(path.endswith('test_a.py_test_one_a_b'))
+    assert(other.report()['methods'] == [
+        {'method': 'pages.home.Home.open', 'count': 2, 'seconds': 1.0}])
+    assert(open(f'{path}.folded').read() ==
+           'tests/test_a.py::test_one[a_b];pages.home.Home.open;get 1000000\n')
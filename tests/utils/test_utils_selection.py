@@ -0,0 +1,103 @@
+"""Test the marker bitset test selection."""
+
+import os
+from types import SimpleNamespace
+
+from fixtures.selection import BITS, MarkerIndex, selection_masks
+from tests.markers import nondestructive, support
+
+
+class Function(SimpleNamespace):
+    """A collected test function."""
+
+
+class Flake8Item(SimpleNamespace):
+    """A collected Flake8 check."""
+
+
+class FakeCache(dict):
+    """A pytest cache kept in memory."""
+
+    def set(self, key, value):
+        """Store a value."""
+        self[key] = value
+
+
+class FakeConfig:
+    """Runtime options for the selection."""
+
+    def __init__(self, **options):
+        """Set the command line options."""
+        self.options = options
+
+    def getoption(self, name):
+        """Return a command line option."""
+        return self.options.get(name.lstrip('-').replace('-', '_'))
+
+    def getini(self, name):
+        """Return no ini settings."""
+        return None
+
+
+def _items(root):
+    module = root / 'test_web_home.py'
+    module.write_text('')
+    nodeid = 'test_web_home.py'
+    return [
+        Function(nodeid=f'{nodeid}::test_smoke', name='test_smoke',
+                 keywords={'web': 1, 'smoke_test': 1}),
+        Function(nodeid=f'{nodeid}::test_headed', name='test_headed',
+                 keywords={'tutor': 1, 'skip_if_headless': 1}),
+        Function(nodeid=f'{nodeid}::test_case', name='test_case',
+                 keywords={}),
+        Flake8Item(nodeid=f'{nodeid}::flake-8::FLAKE8', name='flake-8',
+                   keywords={}),
+    ]
+
+
+def _select(config, items, masks):
+    required, excluded = selection_masks(config)
+    return [item.name for item, mask in zip(items, masks)
+            if mask & required == required and not mask & excluded]
+
+
+@nondestructive
+@support
+def test_options_select_items_with_marker_masks(tmp_path):
+    """Apply the smoke, system, headless and Flake8 options as masks."""
+    items = _items(tmp_path)
+    masks = MarkerIndex(root=str(tmp_path)).masks(items)
+
+    assert(masks[0] == BITS['web'] | BITS['smoke_test'])
+    assert(_select(FakeConfig(), items, masks) ==
+           ['test_smoke', 'test_headed', 'flake-8'])
+    assert(_select(FakeConfig(strip_flake=True, headless=True), items,
+                   masks) == ['test_smoke'])
+    assert(_select(FakeConfig(smoke_test=True), items, masks) ==
+           ['test_smoke'])
+    assert(_select(FakeConfig(systems=['tutor']), items, masks) ==
+           ['test_headed', 'flake-8'])
+
+
+@nondestructive
+@support
+def test_marker_masks_are_cached_until_a_file_changes(tmp_path):
+    """Reuse the cached masks until a collected file is modified."""
+    cache = FakeCache()
+    items = _items(tmp_path)
+    first = MarkerIndex(cache, str(tmp_path))
+    masks = first.masks(items)
+
+    second = MarkerIndex(cache, str(tmp_path))
+    items[0].keywords = {}
+    cached = second.masks(items)
+    (tmp_path / 'test_web_home.py').write_text('# changed')
+    stat = (tmp_path / 'test_web_home.py').stat()
+    os.utime(tmp_path / 'test_web_home.py',
+             ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    third = MarkerIndex(cache, str(tmp_path))
+    rebuilt = third.masks(items)
+
+    assert(not first.cached and second.cached and not third.cached)
+    assert(cached == masks)
+    assert(rebuilt[0] == 0)
@@ -0,0 +1,131 @@
+"""Test the shared log in session cache."""
+
+import pytest
+
+from tests.markers import nondestructive, support
+from utils.sessions import SessionCache
+
+BASE_URL = 'https://tutor.example.org'
+DASHBOARD = f'{BASE_URL}/dashboard'
+LOG_IN = 'https://accounts.example.org/i/login'
+
+
+class FakeDriver:
+    """A browser holding cookies and local storage for one site."""
+
+    def __init__(self, server):
+        """Start on a blank page."""
+        self.server = server
+        self.current_url = 'about:blank'
+        self.cookies = []
+        self.storage = {}
+
+    def get(self, url):
+        """Load a page, redirecting to the log in without a valid session."""
+        if url == DASHBOARD and not self.server.accepts(self.cookies):
+            url = LOG_IN
+        self.current_url = url
+
+    def get_cookies(self):
+        """Return the cookies for the current page."""
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        """Set a cookie for the current page."""
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        """Clear the cookies."""
+        self.cookies = []
+
+    def execute_script(self, script, *args):
+        """Read or write the local storage."""
+        if args:
+            self.storage.update(args[0])
+            return None
+        return dict(self.storage)
+
+
+class FakeServer:
+    """Count UI log ins and issue session cookies."""
+
+    def __init__(self):
+        """Start without sessions."""
+        self.sessions = set()
+        self.log_ins = 0
+
+    def accepts(self, cookies):
+        """Return True if a cookie holds a live session."""
+        return any(cookie['value'] in self.sessions for cookie in cookies)
+
+    def log_in(self, driver):
+        """Log in through the UI."""
+        self.log_ins += 1
+        session = f'session-{self.log_ins}'
+        self.sessions.add(session)
+        driver.cookies = [{'name': 'session', 'value': session}]
+        driver.storage = {'tutor': 'ready'}
+        driver.current_url = DASHBOARD
+        return 'dashboard'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Activate a session cache in a temporary directory."""
+    SessionCache.active = SessionCache(tmp_path)
+    yield SessionCache.active
+    SessionCache.active = None
+
+
+def _log_in(server, driver, user='teacher', password='password'):
+    return SessionCache.resume_or_log_in(
+        driver, user, password, BASE_URL,
+        lambda: server.log_in(driver), lambda: 'dashboard')
+
+
+@nondestructive
+@support
+def test_sessions_are_restored_into_new_browsers(cache):
+    """Log in once and inject the stored session into later browsers."""
+    server = FakeServer()
+
+    _log_in(server, FakeDriver(server))
+    driver = FakeDriver(server)
+    page = _log_in(server, driver)
+    _log_in(server, FakeDriver(server), user='student')
+
+    assert(page == 'dashboard')
+    assert(driver.current_url == DASHBOARD)
+    assert(driver.storage == {'tutor': 'ready'})
+    assert(server.log_ins == 2)
+    assert(cache.summary() == {'hits': 1, 'misses': 2, 'rejected': 0})
+
+
+@nondestructive
+@support
+def test_expired_and_rejected_sessions_log_in_again(cache):
+    """Replace stored sessions that expired or the site no longer accepts."""
+    server = FakeServer()
+    _log_in(server, FakeDriver(server))
+
+    server.sessions.clear()
+    driver = FakeDriver(server)
+    _log_in(server, driver)
+    cache.ttl = -1
+    _log_in(server, FakeDriver(server))
+
+    assert(driver.cookies == [{'name': 'session', 'value': 'session-2'}])
+    assert(server.log_ins == 3)
+    assert(cache.summary() == {'hits': 0, 'misses': 3, 'rejected': 1})
+
+
+@nondestructive
+@support
+def test_inactive_cache_always_logs_in():
+    """Log in through the UI every time unless the cache is enabled."""
+    server = FakeServer()
+
+    _log_in(server, FakeDriver(server))
+    _log_in(server, FakeDriver(server))
+
+    assert(server.log_ins == 2)
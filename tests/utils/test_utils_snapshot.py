@@ -0,0 +1,54 @@
+"""Test the session JSON snapshot store."""
+
+import json
+
+import pytest
+
+from fixtures.snapshot import SnapshotStore
+from tests.markers import nondestructive, support
+
+
+@nondestructive
+@support
+def test_snapshots_are_compared_in_memory_and_flushed_once(tmp_path):
+    """Buffer new snapshots and write them when the session ends."""
+    (tmp_path / 'web').mkdir()
+    (tmp_path / 'web' / 'home.json').write_text(json.dumps({'a': [1, 2]}))
+    (tmp_path / 'web' / 'old.json').write_text('[]')
+    store = SnapshotStore(str(tmp_path))
+
+    store.assert_match({'a': [1, 2]}, 'web/home.json')
+    (tmp_path / 'web' / 'home.json').write_text('changed')
+    store.assert_match({'a': [1, 2]}, 'web/home.json')
+    store.assert_match((1, 'two'), 'tutor/new.json')
+    store.assert_match([1, 'two'], 'tutor/new.json')
+    with pytest.raises(AssertionError):
+        store.assert_match({'a': [3]}, 'web/home.json')
+
+    assert(not (tmp_path / 'tutor').exists())
+    assert(store.flush() == 1)
+    assert(json.loads((tmp_path / 'tutor' / 'new.json').read_text()) ==
+           [1, 'two'])
+    assert(store.stale == {'web/home.json'})
+    assert(store.unused() == ['web/old.json'])
+
+
+@nondestructive
+@support
+def test_archive_keeps_snapshots_written_by_other_workers(tmp_path):
+    """Merge each worker's new snapshots into one archive."""
+    first = SnapshotStore(str(tmp_path), archive=True)
+    second = SnapshotStore(str(tmp_path), archive=True)
+
+    first.assert_match({'value': 1}, 'shared.json')
+    second.assert_match({'value': 2}, 'shared.json')
+    second.assert_match(['b'], 'second.json')
+    written = (first.flush(), second.flush())
+    reader = SnapshotStore(str(tmp_path), archive=True)
+
+    assert(written == (1, 1))
+    assert(reader.get('shared.json') == {'value': 1})
+    assert(reader.get('second.json') == ['b'])
+    assert(reader.unused() == ['second.json', 'shared.json'])
+    assert(sorted(path.name for path in tmp_path.iterdir()) ==
+           [SnapshotStore.LOCK, SnapshotStore.ARCHIVE])
@@ -0,0 +1,40 @@
+"""Test the Tutor assignment date and time values."""
+
+from datetime import datetime
+
+from tests.markers import nondestructive, support
+from utils.tutor import AssignmentTimes, get_date_times
+
+
+@nondestructive
+@support
+def test_assignment_times_feed_both_field_setters():
+    """Return keystroke values and the rendered input values."""
+    times = get_date_times(None, (('01/02/2030', '1:05p'),
+                                  ('01/09/2030', '11:59p')))
+
+    open_on, open_at, due_on, due_at = times
+
+    assert((open_on, open_at, due_on, due_at) ==
+           ('01/02/2030', '01:05:PM', '01/09/2030', '11:59:PM'))
+    assert(times.inputs() == {
+        'due_date': ('01/09/2030', '01/09/2030'),
+        'due_time': ('23:59', '11:59 PM'),
+        'open_date': ('01/02/2030', '01/02/2030'),
+        'open_time': ('13:05', '01:05 PM')})
+    assert(AssignmentTimes('01/02/2030', '', '01/09/2030', '').inputs() ==
+           {'due_date': ('01/09/2030', '01/09/2030'),
+            'open_date': ('01/02/2030', '01/02/2030')})
+
+
+@nondestructive
+@support
+def test_rendered_values_are_compared_in_any_browser_format():
+    """Read 24-hour, 12-hour and date input values."""
+    expected = datetime(1900, 1, 1, 13, 5)
+
+    assert(AssignmentTimes.rendered('open_time', '13:05') == expected)
+    assert(AssignmentTimes.rendered('open_time', '01:05 PM') == expected)
+    assert(AssignmentTimes.rendered('due_date', '01/09/2030') ==
+           datetime(2030, 1, 9))
+    assert(AssignmentTimes.rendered('due_date', '') is None)
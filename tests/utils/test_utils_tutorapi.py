@@ -0,0 +1,77 @@
+"""Test the Tutor API data factory against the local fake server."""
+
+import pytest
+
+from tests.markers import nondestructive, support
+from utils.tutor import Tutor, TutorException
+from utils.tutorapi import FakeTutor, HTTPTransport, TutorFactory
+
+
+class FakeCache(dict):
+    """A pytest cache kept in memory."""
+
+    def get(self, key, default):
+        """Return a stored value."""
+        return super().get(key, default)
+
+    def set(self, key, value):
+        """Store a value."""
+        self[key] = value
+
+
+@pytest.fixture
+def fake_tutor():
+    """Run a fake Tutor API server and forget the session's seeds."""
+    TutorFactory.forget_seeds()
+    with FakeTutor() as fake:
+        yield fake
+    TutorFactory.forget_seeds()
+
+
+@nondestructive
+@support
+def test_factory_creates_courses_periods_enrollments_and_plans(fake_tutor):
+    """Create a course scenario with HTTP calls."""
+    factory = TutorFactory(HTTPTransport(fake_tutor.url))
+
+    course = factory.create_course('Factory Course', sections=2)
+    period = factory.add_period(course, 'Evening')
+    plan = factory.publish(course, 'Field Trip', Tutor.EVENT)
+    enrollment = factory.enroll(period, HTTPTransport(fake_tutor.url),
+                                student_identifier='1234')
+    stored = factory.course(course.id)
+
+    assert([p.name for p in course.periods] == ['Period 1', 'Period 2'])
+    assert(plan.is_published and plan.type == Tutor.EVENT)
+    assert(set(plan.period_ids) == {p.id for p in course.periods})
+    assert(enrollment.status == 'approved')
+    assert(enrollment.period_id == period.id)
+    assert(len(stored.periods) == 3)
+    assert(stored.plan('Field Trip').id == plan.id)
+    with pytest.raises(TutorException):
+        factory.publish(course, 'Unknown', 'quiz')
+    with pytest.raises(TutorException):
+        factory.course('999')
+
+
+@nondestructive
+@support
+def test_seeded_courses_are_reused(fake_tutor):
+    """Build a seed once per instance and reuse its ID in later runs."""
+    cache = FakeCache()
+    factory = TutorFactory(HTTPTransport(fake_tutor.url), 'qa', cache)
+
+    course = factory.seed()
+    created = len(fake_tutor.requests)
+    again = TutorFactory(HTTPTransport(fake_tutor.url), 'qa').seed()
+    TutorFactory.forget_seeds()
+    resumed = TutorFactory(HTTPTransport(fake_tutor.url), 'qa', cache).seed()
+
+    assert(len(course.periods) == 2)
+    assert(sorted(plan.type for plan in course.plans) ==
+           sorted(TutorFactory.SEED_ASSIGNMENTS))
+    assert(again is course)
+    assert(resumed.id == course.id and resumed.plans == course.plans)
+    assert(len(fake_tutor.requests) == created + 2)
+    assert(TutorFactory(HTTPTransport(fake_tutor.url), 'dev').seed().id !=
+           course.id)
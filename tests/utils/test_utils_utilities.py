@@ -1,10 +1,57 @@
 """Test the helper functions for OpenStax Pages."""
 
+from threading import Event
+
+import pytest
 from selenium.webdriver.common.by import By
 
 from pages.accounts.home import AccountsHome as Home
 from tests.markers import accounts, nondestructive, support, test_case
-from utils.utilities import Status, Utility
+from utils import utilities
+from utils.utilities import Salesforce, Status, Utility
+
+
+class FakeSalesforce:
+    """A simple-salesforce stand-in serving canned result pages."""
+
+    PAGE_SIZE = 2
+
+    def __init__(self, username, password, domain):
+        """Hold the rows for the next request."""
+        self.rows = []
+        self.queries = []
+        self.prefetched = Event()
+
+    def _page(self, start):
+        end = start + self.PAGE_SIZE
+        page = {'totalSize': len(self.rows), 'done': end >= len(self.rows),
+                'records': self.rows[start:end]}
+        if not page['done']:
+            page['nextRecordsUrl'] = f'/services/data/v42.0/query/01g-{end}'
+        return page
+
+    def query(self, query):
+        """Return the first page."""
+        self.queries.append(query)
+        return self._page(0)
+
+    def query_more(self, next_records):
+        """Return a following page."""
+        self.prefetched.set()
+        return self._page(int(next_records.split('-')[-1]))
+
+
+@pytest.fixture
+def salesforce(monkeypatch):
+    """Return a Salesforce reader using the stubbed transport."""
+    monkeypatch.setattr(utilities, 'SF', FakeSalesforce)
+    reader = Salesforce('qa', 'password')
+    reader._sf.rows = [
+        {'attributes': {'url': f'/Lead/{number}'}, 'Id': f'00Q{number}',
+         'Email': f'lead{number}@openstax.org', 'Complete__c': 1,
+         'Number_of_Students__c': 35}
+        for number in range(5)]
+    return reader
 
 
 @test_case('C195539')
@@ -74,3 +121,50 @@ def test_card_retrieval_from_braintree():
     assert(get_card), 'Failed to select a Mastercard'
     get_card = Utility.get_test_credit_card(status=Status.DECLINED)
     assert(get_card), 'Failed to select a declined card'
+
+
+@nondestructive
+@support
+def test_salesforce_query_collects_every_page(salesforce):
+    """Collect each result page into typed records."""
+    salesforce.query(record_type=Salesforce.Lead, fields=['email'])
+
+    assert(salesforce.size == 5)
+    assert([lead.email for lead in salesforce.records] ==
+           [f'lead{number}@openstax.org' for number in range(5)])
+    assert(salesforce._sf.queries[-1] ==
+           "SELECT Id,Email FROM Lead WHERE Company='Automation' "
+           "ORDER BY LastName,FirstName ASC NULLS FIRST")
+
+
+@nondestructive
+@support
+def test_salesforce_stream_prefetches_the_next_page(salesforce):
+    """Request the next page while the current page is consumed."""
+    stream = salesforce.stream(record_type=Salesforce.Lead,
+                               fields=['email', 'confirmed', 'students'])
+
+    first = next(stream)
+
+    assert(salesforce._sf.prefetched.wait(2)), 'Next page not prefetched'
+    assert(first.confirmed is True and first.students == 35)
+    assert(first.phone is None), 'Unselected column was populated'
+    assert(not hasattr(first, '__dict__'))
+    assert(len([first] + list(stream)) == 5)
+
+
+@nondestructive
+@support
+def test_salesforce_records_leave_unselected_fields_empty():
+    """Set unselected columns to None and unselected flags to False."""
+    lead = Salesforce.Lead({'attributes': {'url': '/Lead/1'}, 'Id': '00Q1'})
+    organization = Salesforce.Organization({
+        'attributes': {'url': '/Account/1'}, 'Id': '0011',
+        'Name': 'Automation'})
+    located = Salesforce.Organization({
+        'attributes': {'url': '/Account/2'}, 'Id': '0012',
+        'BillingCity': 'Houston'})
+
+    assert(lead.confirmed is False and lead.students is None)
+    assert(organization.address is None)
+    assert(located.address == (None, 'Houston', None, None))
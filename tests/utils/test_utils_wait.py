@@ -0,0 +1,107 @@
+"""Test the adaptive wait engine."""
+
+from time import monotonic
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from tests.markers import nondestructive, support
+from utils.wait import Wait
+
+
+class ActivityDriver:
+    """Replay page activity readings for the activity hooks."""
+
+    def __init__(self, mutations):
+        """Set the mutation times (in ms) reported on each poll."""
+        self.start = monotonic()
+        self.mutations = mutations
+
+    def execute_script(self, script, *args):
+        """Return the ready state, clock, mutation and request readings."""
+        now = (monotonic() - self.start) * 1000
+        mutation = self.mutations.pop(0) if self.mutations else 0
+        return ['complete', now, mutation, 0, 0]
+
+
+@nondestructive
+@support
+def test_wait_returns_as_soon_as_the_condition_holds():
+    """Return the first truthy value without waiting out the timeout."""
+    Wait.reset()
+    checks = iter([False, None, 'ready'])
+    start = monotonic()
+
+    value = Wait.until(lambda: next(checks), timeout=5, name='fake')
+
+    assert(value == 'ready')
+    assert(monotonic() - start < 1), 'Wait did not return early'
+    assert(Wait.history[-1].name == 'fake')
+    assert(Wait.history[-1].satisfied)
+    assert(Wait.stats()['fake']['count'] == 1)
+
+
+@nondestructive
+@support
+def test_wait_timeout_is_recorded():
+    """Raise a timeout exception when required and record the miss."""
+    Wait.reset()
+
+    with pytest.raises(TimeoutException):
+        Wait.until(lambda: False, timeout=0.2, name='never')
+    assert(Wait.until(lambda: 0, timeout=0.1, required=False) == 0)
+
+    assert(Wait.stats()['never']['timeouts'] == 1)
+    assert(Wait.slowest(1)[0].elapsed >= 0.2)
+
+
+@nondestructive
+@support
+def test_wait_for_action_retries_webdriver_errors():
+    """Retry an action until it stops raising WebDriver exceptions."""
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise WebDriverException('Covered by an overlay')
+        return 'clicked'
+
+    assert(Wait.for_action(flaky, timeout=2) == 'clicked')
+    assert(len(attempts) == 3)
+
+
+@nondestructive
+@support
+def test_dom_quiet_waits_for_mutations_to_stop():
+    """Wait out recent DOM mutations then return."""
+    driver = ActivityDriver(mutations=[0, 80, 160])
+    start = monotonic()
+
+    assert(Wait.for_dom_quiet(driver, quiet=0.1, timeout=2))
+    assert(0.1 <= monotonic() - start < 1.5)
+
+
+@nondestructive
+@support
+def test_optional_dom_quiet_gives_up_early_and_warns(monkeypatch):
+    """Continue after the short fallback timeout on a page that never rests."""
+    monkeypatch.setattr(Wait, 'QUIET_TIMEOUT', 0.3)
+    driver = ActivityDriver(mutations=[])
+    driver.execute_script = lambda *args: [
+        'complete', (monotonic() - driver.start) * 1000,
+        (monotonic() - driver.start) * 1000, 0, 0]
+    start = monotonic()
+
+    with pytest.warns(UserWarning, match='dom quiet not reached'):
+        assert(not Wait.for_dom_quiet(driver))
+
+    assert(0.3 <= monotonic() - start < Wait.SETTLE_TIMEOUT)
+
+
+@nondestructive
+@support
+def test_geometry_waits_need_a_locator_or_an_element():
+    """Reject a stability wait with nothing to find."""
+    with pytest.raises(ValueError):
+        Wait.for_stable(ActivityDriver(mutations=[]))
@@ -0,0 +1,116 @@
+"""Test the OpenStax web library indexes."""
+
+import pytest
+
+from tests.markers import nondestructive, support
+from utils.web import Library, WebException
+
+# the number of random draws checked against a full scan
+CASES = 50
+
+
+def _scan_get(library, books, book, field=None):
+    """Resolve a book the way the unindexed library did."""
+    alts = {library.ANATOMY_PHYS_ALT: library.ANATOMY_PHYS,
+            library.AP_PHYS_ALT: library.AP_PHYS,
+            library.AP_PHYS_ALT_2: library.AP_PHYS,
+            library.AP_BIO_ALT: library.AP_BIO,
+            library.ACCOUNTING_1_ALT: library.ACCOUNTING_1,
+            library.ACCOUNTING_2_ALT: library.ACCOUNTING_2,
+            library.MANAGEMENT_ALT: library.MANAGEMENT,
+            library.U_PHYS_ALT: library.U_PHYS_1, }
+    record = books.get(alts.get(book, book))
+    if record is None:
+        record = books.get(book + ' 2e')
+    if record is None:
+        record = books.get(book.replace('®', ''))
+    return record.get(field) if field else record
+
+
+def _scan_short_names():
+    """Collect the short names by scanning a freshly built library."""
+    library = Library()
+    books = library._catalog()
+    return {_scan_get(library, books, book, library.SHORT_NAME)
+            for book in books
+            if _scan_get(library, books, book, library.SHORT_NAME)}
+
+
+def _scan_available():
+    """Collect the available English books by scanning a fresh library."""
+    library = Library()
+    books = library._catalog()
+    return {book for book in books
+            if (not _scan_get(library, books, book, library.PRE_RELEASE) and
+                _scan_get(library, books, book, library.LANGUAGE) ==
+                library.ENGLISH)}
+
+
+@nondestructive
+@support
+def test_library_indexes_are_shared_and_read_only():
+    """Build the indexes once and keep the records immutable."""
+    first, second = Library(), Library()
+
+    assert(first.books is second.books)
+    with pytest.raises(TypeError):
+        first.books[Library.BIOLOGY_2E] = {}
+    with pytest.raises(TypeError):
+        first.get(Library.BIOLOGY_2E)[Library.SHORT_NAME] = 'Bio'
+
+
+@nondestructive
+@support
+def test_library_resolves_alternate_titles():
+    """Resolve altered titles, edition suffixes and trademark symbols."""
+    library = Library()
+
+    assert(library.get(Library.ACCOUNTING_1_ALT) is
+           library.get(Library.ACCOUNTING_1))
+    assert(library.get(Library.U_PHYS_ALT) is library.get(Library.U_PHYS_1))
+    assert(library.get(Library.BIOLOGY_2E[:-3]) is
+           library.get(Library.BIOLOGY_2E))
+    assert(library.get(f'{Library.BIOLOGY_2E}®') is
+           library.get(Library.BIOLOGY_2E))
+    with pytest.raises(WebException):
+        library.get('Not a Book')
+
+
+@nondestructive
+@support
+def test_library_groups_match_the_book_records():
+    """Return the same books as a full scan of the records."""
+    library = Library()
+    books = library.books
+
+    assert(library.kindle ==
+           [(book, books[book]) for book in books
+            if books[book].get(Library.KINDLE)])
+    assert(library.science ==
+           [(book, books[book]) for book in books
+            if Library.SCIENCE in books[book].get(Library.CATEGORY)])
+    assert(sorted(library.short_names) ==
+           sorted({record.get(Library.SHORT_NAME)
+                   for record in books.values()
+                   if record.get(Library.SHORT_NAME)}))
+    record, short, full, details = library.get_name_set()
+    assert(library.get(full) is record)
+    assert(record.get(Library.DETAILS) == details)
+
+
+@nondestructive
+@support
+def test_library_random_lookups_match_a_full_scan():
+    """Draw random books from the same candidates as a full catalog scan."""
+    short_names, available = _scan_short_names(), _scan_available()
+
+    for _ in range(CASES):
+        library = Library()
+        short_name = library.random_book()
+        record, short, full, details = library.get_name_set()
+
+        assert(len(short_name) == 1 and short_name[0] in short_names)
+        assert(full in available)
+        assert(record is library.get(full))
+        assert((short, details) ==
+               (record.get(Library.SHORT_NAME), record.get(Library.DETAILS)))
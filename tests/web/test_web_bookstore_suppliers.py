@@ -34,16 +34,17 @@ def test_book_suppliers_has_a_pdf_of_openstax_isbn_numbers(
     home = WebHome(selenium, web_base_url).open()
     suppliers = home.quotes.get(Web.BOOKSTORE_SUPPLIERS).click()
 
-    for price_list in suppliers.price_lists:
-        # WHEN: they click on the "View" button for each price list
-        country = price_list.country
-        list_pdf_passed = Utility.test_url_and_warn(
-            url=price_list.url,
-            message=f'{country} retail price list PDF',
-            driver=selenium)
+    # WHEN: they click on the "View" button for each price list
+    countries = [price_list.country for price_list in suppliers.price_lists]
+    results = Utility.test_urls_and_warn(
+        [price_list.url for price_list in suppliers.price_lists],
+        messages=[f'{country} retail price list PDF'
+                  for country in countries],
+        driver=selenium)
 
-        # THEN: the file is downloaded
-        assert(list_pdf_passed), f'the {country} PDF download URL failed'
+    # THEN: the file is downloaded
+    for country, result in zip(countries, results):
+        assert(result.passed), f'the {country} PDF download URL failed'
 
 
 @test_case('C210468')
@@ -89,10 +90,12 @@ def test_there_are_four_additional_provider_options(web_base_url, selenium):
     assert(len(providers) == 4), \
         f'unexpected number of providers ({", ".join(providers)})'
 
-    for provider in suppliers.other_providers:
-        # WHEN: they test the "Order from <provider>" button
-        provider_passed = Utility.test_url_and_warn(
-            url=provider.url, message=provider.name, driver=selenium)
+    # WHEN: they test the "Order from <provider>" button
+    results = Utility.test_urls_and_warn(
+        [provider.url for provider in suppliers.other_providers],
+        messages=providers,
+        driver=selenium)
 
-        # THEN: the provider site is verified as working
-        assert(provider_passed), f'failed to verify {provider.name}'
+    # THEN: the provider site is verified as working
+    for provider, result in zip(providers, results):
+        assert(result.passed), f'failed to verify {provider}'
@@ -74,8 +74,8 @@ def test_institutional_partner_logos_are_displayed(web_base_url, selenium):
     impact.view_partners()
 
     # THEN: institutional partner logos are displayed
-    for partner in impact.partners:
-        assert(Utility.is_image_visible(selenium, image=partner.logo))
+    assert(Utility.is_image_visible(
+        selenium, image=[partner.logo for partner in impact.partners]))
 
 
 @skip_test(reason='new impact page')
@@ -1,19 +1,35 @@
-"""A term and definition selector for OpenStax Tutor Beta books."""
+"""A term and definition selector for OpenStax Tutor Beta books.
+
+Each book glossary is parsed once per process into a :py:class:`TermIndex`
+shared by every book instance. Set ``BOOKTERM_CACHE`` to a directory to
+also keep a pickled copy of each index, keyed by the glossary file hash, so
+later test sessions (and xdist workers) skip the YAML parse entirely.
+
+"""
 
 from __future__ import annotations
 
 import os
+import pickle
+from hashlib import sha256
 from random import randint
-from typing import Tuple, Union
+from threading import Lock
+from typing import Dict, Optional, Tuple, Union
 
 from yaml import safe_load as load_yaml
 
 Term = Tuple[str, str]
+Section = Union[int, float]
 
 Biology_2e = 'biology_2e.yaml'
 College_Physics = 'college_physics.yaml'
 Sociology_2e = 'introduction_to_sociology_2e.yaml'
 
+BOOK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+CACHE_VARIABLE = 'BOOKTERM_CACHE'
+# bump when the index layout changes to ignore older cache files
+INDEX_VERSION = 1
+
 
 class BookIndexError(IndexError):
     """A error for when a book section index is not found."""
@@ -21,6 +37,115 @@ class BookIndexError(IndexError):
     pass
 
 
+class TermIndex(object):
+    """The terms and definitions of a book stored as flat arrays.
+
+    Chapters without their own glossary entry are merged from their
+    sections when the index is built so every lookup is a single dictionary
+    access followed by an O(1) random pick.
+
+    """
+
+    __slots__ = ('sections', '_entries')
+
+    def __init__(self, glossary: Dict[Section, Dict[str, str]]) -> None:
+        """Flatten a parsed book glossary.
+
+        :param dict glossary: the book terms keyed by chapter or section
+        :return: None
+
+        """
+        entries = {}
+        for section, terms in glossary.items():
+            if terms:
+                entries[section] = (tuple(terms.keys()),
+                                    tuple(terms.values()))
+        chapters = {int(section) for section in glossary
+                    if isinstance(section, float)}
+        for chapter in chapters - set(entries):
+            merged = {}
+            for section_number in range(9, 0, -1):
+                merged.update(
+                    glossary.get(float(f'{chapter}.{section_number}')) or {})
+            if merged:
+                entries[chapter] = (tuple(merged.keys()),
+                                    tuple(merged.values()))
+        self._entries = entries
+        self.sections = tuple(section for section in glossary
+                              if section in entries)
+
+    def get(self, section: Section) -> Optional[Tuple[Tuple[str, ...],
+                                                      Tuple[str, ...]]]:
+        """Return the terms and definitions for a chapter or section.
+
+        :param section: the chapter or section number
+        :type section: int or float
+        :return: the section terms and the matching definitions or None
+        :rtype: tuple(tuple(str), tuple(str))
+
+        """
+        return self._entries.get(section)
+
+    @classmethod
+    def load(cls, file_path: str) -> TermIndex:
+        """Return the index for a glossary file, using the binary cache.
+
+        :param str file_path: the YAML glossary path
+        :return: the book term index
+        :rtype: :py:class:`TermIndex`
+
+        """
+        with open(file_path, 'rb') as file:
+            content = file.read()
+        cache_directory = os.getenv(CACHE_VARIABLE)
+        if not cache_directory:
+            return cls(load_yaml(content))
+        digest = sha256(content).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        cache_path = os.path.join(
+            cache_directory, f'{name}-{INDEX_VERSION}-{digest}.pickle')
+        try:
+            with open(cache_path, 'rb') as cache:
+                return pickle.load(cache)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        index = cls(load_yaml(content))
+        os.makedirs(cache_directory, exist_ok=True)
+        # write then rename so parallel workers never read a partial file
+        temporary = f'{cache_path}.{os.getpid()}'
+        with open(temporary, 'wb') as cache:
+            pickle.dump(index, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+        return index
+
+    def __getstate__(self):
+        """Return the pickled state."""
+        return (self.sections, self._entries)
+
+    def __setstate__(self, state):
+        """Restore the pickled state."""
+        self.sections, self._entries = state
+
+
+_indexes: Dict[str, TermIndex] = {}
+_indexes_lock = Lock()
+
+
+def term_index(book: str) -> TermIndex:
+    """Return the process-wide term index for a book glossary.
+
+    :param str book: the glossary file name
+    :return: the book term index
+    :rtype: :py:class:`TermIndex`
+
+    """
+    with _indexes_lock:
+        if book not in _indexes:
+            _indexes[book] = TermIndex.load(
+                os.path.join(BOOK_DIRECTORY, book))
+        return _indexes[book]
+
+
 class OpenStaxBook(object):
     """An index of book terms for use in free response questions."""
 
@@ -30,13 +155,8 @@ class OpenStaxBook(object):
 
     def __init__(self) -> None:
         """Initialize the term group."""
-        current_dir = os.getcwd()
-        slash = '/' if '/' in current_dir else '\\'
-        file_path = f'{current_dir}{slash}utils{slash}{self.BOOK}'
         self._book_title = self.TITLE
-        with open(file_path) as file:
-            book = file.read()
-            self._terms = load_yaml(book)
+        self._terms = term_index(self.BOOK)
 
     @property
     def book_title(self) -> str:
@@ -62,22 +182,15 @@ class OpenStaxBook(object):
             else:
                 section = int(section)
         terms = self._terms.get(section)
-        if not terms and isinstance(section, int):
-            terms = {}
-            for section_number in range(9, 0, -1):
-                section_terms = self._terms.get(float(
-                    f'{section}.{section_number}'))
-                if section_terms:
-                    terms.update(section_terms)
         if not terms:
             raise BookIndexError(
                 'No terms found in {0} {1} of {2}'.format(
                     'chapter' if isinstance(section, int) else 'section',
                     section,
                     self.book_title))
-        keys = list(terms.keys())
-        term = keys[randint(0, len(keys) - 1)]
-        return (term, terms.get(term))
+        keys, definitions = terms
+        pick = randint(0, len(keys) - 1)
+        return (keys[pick], definitions[pick])
 
     def get_random_term(self) -> Term:
         """Return a random term and definition from the book.
@@ -86,7 +199,7 @@ class OpenStaxBook(object):
         :rtype: tuple(str, str)
 
         """
-        sections = self._terms.keys()
+        sections = self._terms.sections
         section = sections[randint(0, len(sections) - 1)]
         return self.get_term(section)
 
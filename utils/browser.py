@@ -0,0 +1,189 @@
+"""A pool of warm WebDriver sessions reused between tests.
+
+Starting Chrome or Firefox is the slowest part of most test setups.
+:py:class:`DriverPool` keeps one idle browser per driver type for the
+current process (so one per xdist worker), resets it between tests and
+recycles it after a set number of tests or when it stops responding.
+
+"""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import Callable, Dict, Hashable
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.exceptions import HTTPError
+
+# clear the web storage for the current origin
+CLEAR_STORAGE = 'window.localStorage.clear(); window.sessionStorage.clear();'
+# the errors raised by a browser or driver service that stopped responding:
+# a dead service refuses the command connection and a crashed browser may
+# report no open windows
+DRIVER_ERRORS = (WebDriverException, HTTPError, OSError, IndexError)
+
+
+class DriverPool(object):
+    """Hand out warm browsers and reset them when a test is finished."""
+
+    LIMIT = 25
+    WIDTH = 1024
+    HEIGHT = 768
+
+    def __init__(self, limit: int = None) -> None:
+        """Set up an empty pool.
+
+        :param int limit: (optional) the number of tests a browser is used
+            for before it is replaced
+        :return: None
+
+        """
+        self.limit = limit or self.LIMIT
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+        self.crashed = 0
+        self.startup_time = 0.0
+        self.reset_time = 0.0
+        self._idle: Dict[Hashable, WebDriver] = {}
+        self._uses: Dict[WebDriver, int] = {}
+
+    def acquire(self, key: Hashable,
+                factory: Callable[[], WebDriver]) -> WebDriver:
+        """Return an idle browser or start a new one.
+
+        :param key: the driver type and configuration identifier
+        :param factory: a callable starting a new browser
+        :return: a browser ready for a test
+        :rtype: :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+
+        """
+        driver = self._idle.pop(key, None)
+        if driver is not None:
+            self.reused += 1
+            return driver
+        start = monotonic()
+        driver = factory()
+        self.startup_time += monotonic() - start
+        self.started += 1
+        self._uses[driver] = 0
+        return driver
+
+    def release(self, key: Hashable, driver: WebDriver) -> None:
+        """Reset a browser for the next test or retire it.
+
+        :param key: the driver type and configuration identifier
+        :param driver: the browser used by the finished test
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :return: None
+
+        """
+        self._uses[driver] = self._uses.get(driver, 0) + 1
+        if self._uses[driver] >= self.limit:
+            self.recycled += 1
+            self._quit(driver)
+            return
+        start = monotonic()
+        try:
+            self.reset(driver)
+        except DRIVER_ERRORS:
+            # the browser or its driver service is no longer responding
+            self.crashed += 1
+            self._quit(driver)
+            return
+        self.reset_time += monotonic() - start
+        previous = self._idle.pop(key, None)
+        if previous is not None:
+            self._quit(previous)
+        self._idle[key] = driver
+
+    @classmethod
+    def reset(cls, driver: WebDriver) -> None:
+        """Return a browser to a blank state.
+
+        Dismiss any alert, close every tab but the first, clear the cookies
+        and web storage, load a blank page and restore the window size.
+
+        :param driver: the browser to reset
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :return: None
+        :raises WebDriverException: if the browser is not responding
+        :raises HTTPError: if the driver service is not responding
+
+        """
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.execute_script(CLEAR_STORAGE)
+        except WebDriverException:
+            # storage is not available for the current page
+            pass
+        driver.delete_all_cookies()
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # Chrome can also clear the cookies set by other domains
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except WebDriverException:
+                pass
+        driver.get('about:blank')
+        driver.implicitly_wait(0)
+        driver.set_window_size(width=cls.WIDTH, height=cls.HEIGHT)
+
+    def close(self) -> None:
+        """Quit every idle browser.
+
+        :return: None
+
+        """
+        for driver in self._idle.values():
+            self._quit(driver)
+        self._idle.clear()
+
+    @property
+    def saved(self) -> float:
+        """Return the estimated setup time saved in seconds.
+
+        Each reuse saves an average browser start less an average reset.
+
+        """
+        if not self.started or not self.reused:
+            return 0.0
+        startup = self.startup_time / self.started
+        reset = self.reset_time / max(self.reused, 1)
+        return max(0.0, self.reused * (startup - reset))
+
+    def summary(self) -> dict:
+        """Return the pool usage counts and timings.
+
+        :return: the browsers started, reused, recycled and crashed, the
+            startup and reset times and the estimated time saved
+        :rtype: dict
+
+        """
+        return {
+            'started': self.started,
+            'reused': self.reused,
+            'recycled': self.recycled,
+            'crashed': self.crashed,
+            'startup_time': self.startup_time,
+            'reset_time': self.reset_time,
+            'saved': self.saved,
+        }
+
+    def _quit(self, driver):
+        """Quit a browser, ignoring one that already stopped."""
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except DRIVER_ERRORS:
+            pass
@@ -0,0 +1,293 @@
+"""Braintree sandbox test cards from a bundled, versioned catalog.
+
+The card numbers come from the Braintree testing reference. Reading that page
+for every card made the payment tests depend on a third-party site, so the
+table is stored in ``braintree_cards.yaml`` and loaded once per process.
+Refresh the file with::
+
+    python -m utils.cards
+
+Card choices and CVVs use the ``random`` module so they follow the seed set
+by pytest-randomly.
+
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from argparse import ArgumentParser
+from datetime import date
+from random import randint
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from yaml import safe_dump, safe_load
+
+CARD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'braintree_cards.yaml')
+# bump when the catalog layout changes
+CATALOG_VERSION = 1
+BRAINTREE = ('https://developers.braintreepayments.com/'
+             'reference/general/testing/python')
+
+CardRecord = Mapping[str, object]
+
+
+class Status:
+    """Card states."""
+
+    STATUS = 'status'
+    VALID = 2
+    NO_VERIFY = 3
+    TYPED = 4
+    OTHER = 5
+
+    TYPE = 'type'
+    AMEX = 'American Express'
+    DINERS = 'Diners Club'
+    DISCOVER = 'Discover'
+    JCB = 'JCB'
+    MAESTRO = 'Maestro'
+    MC = 'Mastercard'
+    VISA = 'Visa'
+
+    RESPONSE = 'response'
+    DECLINED = 'processor declined'
+    FAILED = 'failed (3000)'
+
+
+class CardCatalog(object):
+    """Read-only test cards indexed by status, processor and response."""
+
+    FIELDS = ('number', Status.TYPE, Status.STATUS, Status.RESPONSE, 'data')
+    INDEXED = (Status.STATUS, Status.TYPE, Status.RESPONSE)
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(self, cards: List[Dict[str, object]],
+                 retrieved: str = None) -> None:
+        """Freeze the cards and build the lookup indexes.
+
+        :param cards: the card records
+        :type cards: list(dict)
+        :param str retrieved: (optional) the date the cards were read from
+            Braintree
+        :return: None
+
+        """
+        self.retrieved = retrieved
+        self.cards = tuple(MappingProxyType(dict(card)) for card in cards)
+        index = {}
+        for card in self.cards:
+            for field in self.INDEXED:
+                index.setdefault((field, card.get(field)), []).append(card)
+        self._index = {key: tuple(group) for key, group in index.items()}
+        self._queries = {}
+
+    @classmethod
+    def shared(cls) -> CardCatalog:
+        """Return the catalog loaded from the bundled card file.
+
+        :return: the process-wide card catalog
+        :rtype: :py:class:`CardCatalog`
+
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.load()
+            return cls._shared
+
+    @classmethod
+    def load(cls, path: str = CARD_FILE) -> CardCatalog:
+        """Load a catalog file.
+
+        :param str path: (optional) the catalog file path
+        :return: the card catalog
+        :rtype: :py:class:`CardCatalog`
+        :raises ValueError: if the file uses a different catalog version
+
+        """
+        with open(path) as catalog_file:
+            catalog = safe_load(catalog_file)
+        if catalog.get('version') != CATALOG_VERSION:
+            raise ValueError(
+                f'{path} is catalog version {catalog.get("version")}; '
+                f'expected version {CATALOG_VERSION}')
+        return cls(catalog.get('cards', []), catalog.get('retrieved'))
+
+    @classmethod
+    def download(cls, url: str = BRAINTREE) -> CardCatalog:
+        """Read the current test cards from the Braintree reference.
+
+        :param str url: (optional) the Braintree testing reference URL
+        :return: the card catalog
+        :rtype: :py:class:`CardCatalog`
+
+        """
+        import requests
+        response = requests.get(url)
+        response.raise_for_status()
+        return cls(cls.parse(response.text), date.today().isoformat())
+
+    @staticmethod
+    def parse(html: str) -> List[Dict[str, object]]:
+        """Return the test cards listed in the Braintree reference tables.
+
+        :param str html: the Braintree testing reference page source
+        :return: the card records
+        :rtype: list(dict)
+
+        """
+        from bs4 import BeautifulSoup
+        page = BeautifulSoup(html, 'html.parser')
+        cards = []
+        for card_status in range(Status.VALID, Status.OTHER + 1):
+            selector = f'table:nth-of-type({card_status}) tbody tr'
+            for row in page.select(selector):
+                fields = [cell.text for cell in row.select('td')]
+                cards.append({
+                    'number': fields[0],
+                    Status.TYPE: (Status.VISA if fields[0][0] == '4'
+                                  else fields[1]),
+                    Status.STATUS: card_status,
+                    Status.RESPONSE: fields[2] if len(fields) > 2 else '',
+                    'data': (fields[1]
+                             if card_status in (Status.TYPED, Status.OTHER)
+                             else ''),
+                })
+        return cards
+
+    def save(self, path: str = CARD_FILE) -> None:
+        """Write the catalog file.
+
+        :param str path: (optional) the catalog file path
+        :return: None
+
+        """
+        lines = ['---',
+                 '# Braintree sandbox test card numbers',
+                 '# Regenerate from the Braintree testing reference with:',
+                 '#   python -m utils.cards',
+                 f'version: {CATALOG_VERSION}',
+                 f'source: {BRAINTREE}',
+                 f"retrieved: '{self.retrieved or date.today().isoformat()}'",
+                 'cards:']
+        for card in self.cards:
+            record = {field: card.get(field) for field in self.FIELDS}
+            lines.append('  - ' + safe_dump(
+                record, default_flow_style=True, sort_keys=False,
+                width=1000).strip())
+        temporary = f'{path}.{os.getpid()}'
+        with open(temporary, 'w') as catalog_file:
+            catalog_file.write('\n'.join(lines) + '\n')
+        os.replace(temporary, path)
+
+    def find(self, **fields) -> Tuple[CardRecord, ...]:
+        """Return the cards matching every field value.
+
+        :param fields: card field values like ``status=Status.VALID`` or
+            ``type=Status.VISA``
+        :return: the matching cards in catalog order
+        :rtype: tuple(dict)
+
+        """
+        query = tuple(sorted(fields.items()))
+        cards = self._queries.get(query)
+        if cards is None:
+            if not query:
+                cards = self.cards
+            else:
+                (field, value), rest = query[0], query[1:]
+                cards = tuple(
+                    card for card in self._group(field, value)
+                    if all(card.get(name) == want for name, want in rest))
+            self._queries[query] = cards
+        return cards
+
+    def random(self, **fields) -> Optional[CardRecord]:
+        """Return a random card matching every field value.
+
+        :param fields: card field values
+        :return: a matching card or ``None`` if no card matches
+        :rtype: dict
+
+        """
+        cards = self.find(**fields)
+        if not cards:
+            return None
+        return cards[randint(0, len(cards) - 1)]
+
+    def _group(self, field, value):
+        """Return the indexed group or scan the cards for other fields."""
+        if field in self.INDEXED:
+            return self._index.get((field, value), ())
+        return tuple(card for card in self.cards if card.get(field) == value)
+
+
+def cvv(card: CardRecord) -> str:
+    """Return a random security code sized for the card processor.
+
+    :param card: a test card
+    :type card: dict
+    :return: a four digit code for American Express or a three digit code
+    :rtype: str
+
+    """
+    if card.get(Status.TYPE) == Status.AMEX:
+        return '{:04}'.format(randint(0, 9999))
+    return '{:03}'.format(randint(0, 999))
+
+
+class Card:
+    """Fake card objects."""
+
+    def __init__(self, catalog: CardCatalog = None):
+        """Use the shared card catalog."""
+        self.catalog = catalog or CardCatalog.shared()
+
+    @property
+    def options(self):
+        """Return every test card with a security code."""
+        return self._with_cvv(self.catalog.cards)
+
+    def get_by(self, field=None, state=None, use_list=None):
+        """Return a subset of test cards with a specific type."""
+        _field = field if field else Status.STATUS
+        _state = state if state else Status.VALID
+        if not use_list:
+            return self._with_cvv(self.catalog.find(**{_field: _state}))
+        return [card for card in use_list if card[_field] == _state]
+
+    def generic(self):
+        """Return a random, valid test card."""
+        card = self.catalog.random(**{Status.STATUS: Status.VALID})
+        return dict(card, cvv=cvv(card))
+
+    @staticmethod
+    def _with_cvv(cards):
+        """Copy the cards adding a security code to each."""
+        return [dict(card, cvv=cvv(card)) for card in cards]
+
+
+def main(argv: List[str] = None) -> int:
+    """Refresh the bundled card catalog from the Braintree reference."""
+    parser = ArgumentParser(description=main.__doc__)
+    parser.add_argument('--url', default=BRAINTREE,
+                        help='the Braintree testing reference URL')
+    parser.add_argument('--output', default=CARD_FILE,
+                        help='the catalog file to write')
+    options = parser.parse_args(argv)
+    catalog = CardCatalog.download(options.url)
+    if not catalog.cards:
+        print(f'No test cards found at {options.url}', file=sys.stderr)
+        return 1
+    catalog.save(options.output)
+    print(f'Wrote {len(catalog.cards)} test cards to {options.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
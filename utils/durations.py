@@ -0,0 +1,193 @@
+"""Historical test durations and a longest-first xdist scheduler.
+
+Each run records the setup, call and teardown time of every test along with
+a scheduling group: tests in the same module sharing a log in or course
+fixture are kept together so they run on one worker. With
+``--schedule-by-duration`` the xdist controller hands out the groups with the
+longest recorded time first, so the slow course tests start immediately
+instead of leaving the other workers idle at the end of the run.
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:  # xdist is only needed for parallel runs
+    LoadScopeScheduling = object
+
+# the fixtures whose state is shared by the tests in a module
+GROUP_FIXTURES = frozenset((
+    'admin', 'content', 'facebook', 'facebook_signup', 'google',
+    'google_signup', 'salesforce', 'store', 'student', 'teacher'))
+
+
+class DurationStore(object):
+    """Smoothed per-test durations kept in the pytest cache."""
+
+    CACHE_KEY = 'os-automation/durations'
+    # the weight given to the newest duration
+    SMOOTHING = 0.5
+    # the estimate used for a test without a recorded duration
+    DEFAULT = 5.0
+
+    active: Optional[DurationStore] = None
+
+    def __init__(self, history: Mapping[str, dict] = None) -> None:
+        """Start from recorded test durations.
+
+        :param history: (optional) the duration and group for each test
+            node ID
+        :type history: dict
+        :return: None
+
+        """
+        self.history: Dict[str, dict] = dict(history or {})
+        self.recorded: Dict[str, dict] = {}
+        known = [entry['duration'] for entry in self.history.values()]
+        self.default = sum(known) / len(known) if known else self.DEFAULT
+
+    @classmethod
+    def load(cls, cache) -> DurationStore:
+        """Read the durations from the pytest cache.
+
+        :param cache: the pytest cache
+        :type cache: :py:class:`~_pytest.cacheprovider.Cache`
+        :return: the duration store
+        :rtype: :py:class:`DurationStore`
+
+        """
+        return cls(cache.get(cls.CACHE_KEY, {}))
+
+    def save(self, cache) -> None:
+        """Merge the durations recorded by this run and write them.
+
+        :param cache: the pytest cache
+        :type cache: :py:class:`~_pytest.cacheprovider.Cache`
+        :return: None
+
+        """
+        self.merge(self.recorded)
+        self.recorded = {}
+        cache.set(self.CACHE_KEY, self.history)
+
+    def add(self, item, report) -> None:
+        """Add the time taken by one phase of a test.
+
+        :param item: the test item
+        :type item: :py:class:`~_pytest.nodes.Item`
+        :param report: the phase report
+        :type report: :py:class:`~_pytest.reports.TestReport`
+        :return: None
+
+        """
+        if report.skipped:
+            self.recorded.pop(item.nodeid, None)
+            return
+        entry = self.recorded.setdefault(
+            item.nodeid,
+            {'duration': 0.0,
+             'group': group_key(item.nodeid,
+                                getattr(item, 'fixturenames', ()))})
+        entry['duration'] += report.duration
+
+    def merge(self, recorded: Mapping[str, dict]) -> None:
+        """Blend newly recorded durations into the history.
+
+        :param recorded: the duration and group for each test node ID
+        :type recorded: dict
+        :return: None
+
+        """
+        for nodeid, entry in recorded.items():
+            previous = self.history.get(nodeid)
+            duration = entry['duration']
+            if previous:
+                duration = (self.SMOOTHING * duration +
+                            (1 - self.SMOOTHING) * previous['duration'])
+            self.history[nodeid] = {'duration': round(duration, 3),
+                                    'group': entry['group']}
+
+    def estimate(self, nodeid: str) -> float:
+        """Return the expected duration of a test in seconds.
+
+        :param str nodeid: the test node ID
+        :return: the smoothed recorded duration or the average duration
+        :rtype: float
+
+        """
+        entry = self.history.get(nodeid)
+        return entry['duration'] if entry else self.default
+
+    def scope(self, nodeid: str) -> str:
+        """Return the scheduling group of a test.
+
+        :param str nodeid: the test node ID
+        :return: the recorded group or the node ID for ungrouped tests
+        :rtype: str
+
+        """
+        entry = self.history.get(nodeid)
+        return entry['group'] if entry else nodeid
+
+    def order(self, units: Mapping[str, Iterable[str]]) -> List[str]:
+        """Return the scheduling groups with the longest total time first.
+
+        Groups with the same total keep their collection order.
+
+        :param units: the test node IDs in each group
+        :type units: dict
+        :return: the group names
+        :rtype: list(str)
+
+        """
+        return sorted(
+            units,
+            key=lambda scope: -sum(self.estimate(nodeid)
+                                   for nodeid in units[scope]))
+
+
+def group_key(nodeid: str, fixturenames: Iterable[str]) -> str:
+    """Return the scheduling group for a test.
+
+    :param str nodeid: the test node ID
+    :param fixturenames: the fixtures used by the test
+    :type fixturenames: list(str)
+    :return: the module and shared fixtures, or the node ID when the test
+        shares no state
+    :rtype: str
+
+    """
+    shared = sorted(GROUP_FIXTURES.intersection(fixturenames))
+    if not shared:
+        return nodeid
+    module = nodeid.split('::')[0]
+    return f'{module}::{"+".join(shared)}'
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Distribute test groups to xdist workers longest-first."""
+
+    def __init__(self, config, log=None, store: DurationStore = None):
+        """Use the recorded durations to plan the run."""
+        super().__init__(config, log)
+        self.store = store or DurationStore()
+        self._ordered = False
+
+    def _split_scope(self, nodeid):
+        """Group the tests sharing log in or course fixtures."""
+        return self.store.scope(nodeid)
+
+    def _assign_work_unit(self, node):
+        """Sort the work queue before the first group is handed out."""
+        if not self._ordered:
+            self._ordered = True
+            units = OrderedDict(
+                (scope, self.workqueue[scope])
+                for scope in self.store.order(self.workqueue))
+            self.workqueue.clear()
+            self.workqueue.update(units)
+        super()._assign_work_unit(node)
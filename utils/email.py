@@ -1,19 +1,30 @@
 """Email providers."""
 
+import asyncio
+import atexit
 import base64
+import os
 import re
 import smtplib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from heapq import heappush
 from email.mime.text import MIMEText
 from email.utils import formataddr as format_address
-from time import sleep
+from threading import Condition, Lock, Thread
+from time import monotonic, sleep
+from typing import Dict, List, NamedTuple, Optional
 
 import requests
 from apiclient.discovery import build
+from apiclient.errors import HttpError
 from httplib2 import Http
 from oauth2client import client, file, tools
 from pypom import Page, Region
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as expect
 
@@ -27,6 +38,92 @@ RESET_MATCHER = re.compile(
     r'(https:\/\/accounts([-\w]*)?\.openstax\.org\/i\/' +
     r'([_\w]*)\?token=\w{1,64})'
 )
+# the PIN, confirmation link and reset link found in one pass
+TOKEN_MATCHER = re.compile('|'.join(
+    f'(?P<{name}>{matcher.pattern})'
+    for name, matcher in (('pin', PIN_MATCHER),
+                          ('confirmation_link', URL_MATCHER),
+                          ('reset_link', RESET_MATCHER))))
+
+
+class MessageTokens(NamedTuple):
+    """The verification values found in a message."""
+
+    pin: Optional[str] = None
+    confirmation_link: Optional[str] = None
+    reset_link: Optional[str] = None
+
+    @classmethod
+    def scan(cls, text: str) -> 'MessageTokens':
+        """Find the first PIN, confirmation link and reset link.
+
+        :param str text: the message text to search
+        :return: the values found; missing values are ``None``
+        :rtype: :py:class:`MessageTokens`
+
+        """
+        found = {}
+        for match in TOKEN_MATCHER.finditer(text or ''):
+            name = match.lastgroup
+            if name not in found:
+                value = match.group(name)
+                found[name] = value[-6:] if name == 'pin' else value
+                if len(found) == len(cls._fields):
+                    break
+        return cls(**found)
+
+
+class _Message(object):
+    """Verification values read from a message once and cached."""
+
+    __slots__ = ('_tokens',)
+
+    def _token_text(self):
+        """Return the text searched for verification values."""
+        raise NotImplementedError
+
+    @property
+    def tokens(self):
+        """Return the PIN, confirmation link and reset link."""
+        if self._tokens is None:
+            self._tokens = MessageTokens.scan(self._token_text())
+        return self._tokens
+
+    @property
+    def has_pin(self):
+        """Return True if a pin string is in the body excerpt."""
+        return self.tokens.pin is not None
+
+    @property
+    def pin(self):
+        """Return the numeric pin."""
+        if self.has_pin:
+            return self.tokens.pin
+        raise EmailVerificationError('No pin found')
+
+    @property
+    def has_link(self):
+        """Return True if a confirmation URL is in the excerpt."""
+        return self.tokens.confirmation_link is not None
+
+    @property
+    def confirmation_link(self):
+        """Access the confirmation URL link."""
+        if self.has_link:
+            return self.tokens.confirmation_link
+        raise EmailVerificationError('No confirmation link found')
+
+    @property
+    def has_reset(self):
+        """Return True if a password reset URL is in the excerpt."""
+        return self.tokens.reset_link is not None
+
+    @property
+    def reset_link(self):
+        """Access the password reset URL link."""
+        if self.has_reset:
+            return self.tokens.reset_link
+        raise EmailVerificationError('No password reset link found')
 
 
 class GoogleBase(Page):
@@ -186,19 +283,77 @@ class Google(GoogleBase):
             return ((datetime.now() - self.sent).seconds / 60.0) < 5.0
 
 
+class _GmailMailbox(object):
+    """The messages already downloaded for a Gmail user and label set.
+
+    Kept for the life of the process so each reader only requests messages
+    added since the previous read. Messages are held in a heap ordered from
+    the newest to the oldest.
+
+    """
+
+    __slots__ = ('heap', 'seen', 'history', 'lock', 'count')
+
+    def __init__(self):
+        self.heap = []
+        self.seen = set()
+        self.history = None
+        self.lock = Lock()
+        self.count = 0
+
+    def push(self, email):
+        """Add a message unless it is already in the mailbox."""
+        with self.lock:
+            if email.id in self.seen:
+                return
+            self.seen.add(email.id)
+            self.count += 1
+            heappush(self.heap, (-email.epoch, self.count, email))
+            if email.history and (self.history is None or
+                                  int(email.history) > int(self.history)):
+                self.history = email.history
+
+
 class GmailReader(object):
     """Read the user's inbox."""
 
-    def __init__(self, tag=''):
-        """Initialize the reader."""
+    BATCH_SIZE = 100
+    WORKERS = 4
+    METADATA_HEADERS = ['From', 'To', 'Subject']
+
+    _mailboxes: Dict[tuple, _GmailMailbox] = {}
+    _mailboxes_lock = Lock()
+
+    def __init__(self, tag='', service=None):
+        """Initialize the reader.
+
+        Args:
+            tag: the client secret and token file suffix
+            service: (optional) a Gmail API service to use instead of
+                     authorizing with the client secret
+
+        """
         # If modifying the scope(s), delete the file token.json.
         self._scopes = 'https://www.googleapis.com/auth/gmail.readonly'
-        self._inbox = []
+        self._mailbox = _GmailMailbox()
+        self._newest_first = True
+        self._sorted = None
+        self._service = service
+        self._credentials = None
         self._tag = '_{suffix}'.format(suffix=tag) if tag else ''
         self._file = 'client_secret{suffix}.json'.format(suffix=self._tag)
         print('"{one}": "{two}" "{three}"'.format(one=tag, two=self._tag,
                                                   three=self._file))
 
+    @property
+    def _inbox(self):
+        """Return the messages in the inbox order."""
+        if self._sorted is None:
+            self._sorted = [entry[2] for entry in sorted(self._mailbox.heap)]
+            if not self._newest_first:
+                self._sorted.reverse()
+        return self._sorted
+
     def add_email(self, request_id, response, exception):
         """Do something with the batch response.
 
@@ -215,10 +370,16 @@ class GmailReader(object):
             print(f'{request_id} blew up! {exception}')
             raise exception
         else:
-            self._inbox.append(self.Email(response))
+            self._mailbox.push(self.Email(response, loader=self._loader))
+            self._sorted = None
 
     def read_mail(self, user='me', labels=['INBOX']):
-        """Query Gmail and download the the inbox mail.
+        """Query Gmail and download the new inbox mail.
+
+        Only messages added since the last read (for this user and label set
+        within the process) are requested, using the Gmail history when it
+        is available. Messages are downloaded in the ``metadata`` format in
+        concurrent batches; each message body is downloaded when first used.
 
         Args:
             user: the Gmail user to query for
@@ -227,43 +388,110 @@ class GmailReader(object):
                     default to just the inbox
 
         """
-        store = file.Storage('token{suffix}.json'
-                             .format(suffix=self._tag))
-        creds = store.get()
-        if not creds or creds.invalid:
-            flow = client.flow_from_clientsecrets(self._file, self._scopes)
-            creds = tools.run_flow(flow, store)
-        service = build('gmail', 'v1', http=creds.authorize(Http()))
-        data_line = []
-        request = (service
-                   .users()
-                   .messages()
-                   .list(userId=user, labelIds=labels))
-
-        # For each page of emails, download the email IDs for use later
-        # Google returns the lists in pre-selected batches of up to 100 items
+        service = self._connect()
+        self._user = user
+        key = (self._tag, user, tuple(labels))
+        with GmailReader._mailboxes_lock:
+            self._mailbox = GmailReader._mailboxes.setdefault(
+                key, _GmailMailbox())
+        new_ids = None
+        if self._mailbox.history:
+            new_ids = self._history_ids(service, user, labels)
+        if new_ids is None:
+            new_ids = self._listed_ids(service, user, labels)
+
+        # download the new messages as concurrent batches to minimize the
+        # number of HTTP requests
+        batches = [new_ids[start:start + self.BATCH_SIZE]
+                   for start in range(0, len(new_ids), self.BATCH_SIZE)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=self.WORKERS,
+                                    thread_name_prefix='gmail') as pool:
+                for download in [pool.submit(self._download, service, batch)
+                                 for batch in batches]:
+                    download.result()
+        self._sorted = None
+        return self
+
+    def _connect(self):
+        """Return the Gmail API service."""
+        if self._service is None:
+            store = file.Storage('token{suffix}.json'
+                                 .format(suffix=self._tag))
+            creds = store.get()
+            if not creds or creds.invalid:
+                flow = client.flow_from_clientsecrets(self._file,
+                                                      self._scopes)
+                creds = tools.run_flow(flow, store)
+            self._credentials = creds
+            self._service = build('gmail', 'v1',
+                                  http=creds.authorize(Http()))
+        return self._service
+
+    def _history_ids(self, service, user, labels):
+        """Return the IDs added since the last read or None if unknown."""
+        history = service.users().history()
+        request = history.list(userId=user,
+                               startHistoryId=self._mailbox.history,
+                               labelId=labels[0] if labels else None,
+                               historyTypes=['messageAdded'])
+        new_ids = []
+        try:
+            while request is not None:
+                data = request.execute()
+                for record in data.get('history', []):
+                    for added in record.get('messagesAdded', []):
+                        message = added.get('message', {})
+                        if (set(labels) <= set(message.get('labelIds', []))
+                                and message.get('id') not in
+                                self._mailbox.seen):
+                            new_ids.append(message.get('id'))
+                request = history.list_next(request, data)
+        except HttpError:
+            # the history ID expired so fall back to listing the messages
+            return None
+        return list(dict.fromkeys(new_ids))
+
+    def _listed_ids(self, service, user, labels):
+        """Return the listed message IDs newer than the last seen message."""
+        messages = service.users().messages()
+        request = messages.list(userId=user, labelIds=labels)
+        new_ids = []
+
+        # Google returns the lists newest first in pages of up to 100 items
         while request is not None:
             data = request.execute()
-            data_line.append(data.get('messages'))
-            request = (service
-                       .users()
-                       .messages()
-                       .list_next(request, data))
-
-        # For each list of email IDs, download the emails as batches to
-        # minimize the number of HTTP requests
-        for batch in data_line:
-            request = service.new_batch_http_request()
-            for email in batch:
-                request.add(
-                    service
-                    .users()
-                    .messages()
-                    .get(userId='me', id=email.get('id')),
-                    callback=self.add_email
-                )
-            request.execute()
-        return self
+            for message in data.get('messages') or []:
+                if message.get('id') in self._mailbox.seen:
+                    return new_ids
+                new_ids.append(message.get('id'))
+            request = messages.list_next(request, data)
+        return new_ids
+
+    def _download(self, service, batch):
+        """Download the metadata for a batch of messages."""
+        request = service.new_batch_http_request()
+        for message_id in batch:
+            request.add(
+                service
+                .users()
+                .messages()
+                .get(userId=self._user, id=message_id, format='metadata',
+                     metadataHeaders=self.METADATA_HEADERS),
+                callback=self.add_email
+            )
+        # httplib2 connections are not thread safe
+        http = (self._credentials.authorize(Http())
+                if self._credentials else None)
+        request.execute(http=http)
+
+    def _loader(self, message_id):
+        """Download a full message."""
+        return (self._service
+                .users()
+                .messages()
+                .get(userId=self._user, id=message_id, format='full')
+                .execute())
 
     def sort_mail(self, newest_first=True):
         """Sort the inbox.
@@ -273,13 +501,15 @@ class GmailReader(object):
                           most recent mail first
 
         """
-        self._inbox.sort(reverse=newest_first)
+        if newest_first != self._newest_first:
+            self._newest_first = newest_first
+            self._sorted = None
         return self
 
     @property
     def size(self):
         """Return the number of messages in the inbox."""
-        return len(self._inbox)
+        return len(self._mailbox.heap)
 
     def get(self, key):
         """Return the email at the key's location."""
@@ -288,22 +518,36 @@ class GmailReader(object):
     @property
     def latest(self):
         """Return the most recent email."""
-        return self.get(0)
+        if not self._mailbox.heap:
+            raise EmptyInboxError('Inbox is empty')
+        return self._mailbox.heap[0][2]
 
     def __getitem__(self, key):
         """Enable the bracket operator for the inbox list."""
-        if not self._inbox:
+        if not self._mailbox.heap:
             raise EmptyInboxError('Inbox is empty')
         return self._inbox[key]
 
-    class Email(object):
-        """A Gmail email from an API call."""
+    class Email(_Message):
+        """A Gmail email from an API call.
+
+        The headers are read and the body downloaded and decoded only when
+        first used.
+        """
+
+        __slots__ = ('_id', '_thread', '_labels', '_excerpt', '_history',
+                     '_since_epoch', '_payload', '_loader', '_body',
+                     '_headers', '_size', '_raw')
 
-        def __init__(self, email):
+        def __init__(self, email, loader=None):
             """Construct a new email.
 
             Args:
-                email: a Gmail message dictionary
+                email: a Gmail message dictionary in the ``full`` or
+                       ``metadata`` format
+                loader: (optional) a function returning the ``full`` format
+                        message for a message ID, used to read the body of
+                        a ``metadata`` message
 
             """
             self._id = email.get('id', '')
@@ -311,37 +555,39 @@ class GmailReader(object):
             self._labels = email.get('labelIds', [])
             self._excerpt = email.get('snippet', '')
             self._history = email.get('historyId')
-            epoch = int(email.get('internalDate'))
-            self._created_at = datetime.fromtimestamp(
-                epoch / 1000,
-                timezone.utc
-            )
-            self._since_epoch = epoch
+            self._since_epoch = int(email.get('internalDate'))
             self._payload = email.get('payload')
-            self._body = ''
-            self._recipients = ''
-            self._sender = ''
-            self._subject = ''
-            for part in self._payload.get('parts'):
+            self._loader = loader
+            self._body = None
+            self._headers = None
+            self._tokens = None
+            self._size = int(email.get('sizeEstimate'))
+            self._raw = email.get('raw')
+
+        def _header(self, name):
+            """Return a message header value."""
+            if self._headers is None:
+                self._headers = {
+                    header.get('name'): header.get('value')
+                    for header in self._payload.get('headers') or []}
+            return self._headers.get(name, '')
+
+        def _token_text(self):
+            """Search the Gmail snippet."""
+            return self._excerpt
+
+        def _read_body(self, payload):
+            """Decode the base64 body part of a full message payload."""
+            for part in payload.get('parts') or []:
                 for header in part.get('headers'):
                     name = header.get('name')
                     value = header.get('value')
                     if (name == 'Content-Transfer-Encoding'
                             and value == 'base64'):
-                        self._body = (base64.urlsafe_b64decode(
+                        return (base64.urlsafe_b64decode(
                             bytes(part.get('body').get('data'), 'UTF-8'))
                         ).decode('UTF-8')
-                        break
-            for header in self._payload.get('headers'):
-                name = header.get('name')
-                if name == 'To':
-                    self._recipients = header.get('value')
-                elif name == 'From':
-                    self._sender = header.get('value')
-                elif name == 'Subject':
-                    self._subject = header.get('value')
-            self._size = int(email.get('sizeEstimate'))
-            self._raw = email.get('raw')
+            return ''
 
         def __lt__(self, rhs):
             """Override less than for sorting the inbox."""
@@ -362,11 +608,42 @@ class GmailReader(object):
                 'Excerpt: {excerpt}\n'
                 'Body:\n{body}\n'
             ).format(
-                sender=self._sender if self._sender else '',
-                recipients=self._recipients if self._recipients else '',
-                subject=self._subject if self._subject else '',
+                sender=self.sender,
+                recipients=self.recipients,
+                subject=self.subject,
                 excerpt=self._excerpt if self._excerpt else '',
-                body=self._body if self._body else '')
+                body=self.body if self.body else '')
+
+        @property
+        def id(self):
+            """Return the Gmail message ID."""
+            return self._id
+
+        @property
+        def history(self):
+            """Return the Gmail history ID."""
+            return self._history
+
+        @property
+        def created_at(self):
+            """Return the UTC time Gmail received the message."""
+            return datetime.fromtimestamp(self._since_epoch / 1000,
+                                          timezone.utc)
+
+        @property
+        def sender(self):
+            """Return the From header."""
+            return self._header('From')
+
+        @property
+        def recipients(self):
+            """Return the To header."""
+            return self._header('To')
+
+        @property
+        def subject(self):
+            """Return the Subject header."""
+            return self._header('Subject')
 
         @property
         def epoch(self):
@@ -383,15 +660,23 @@ class GmailReader(object):
 
         @property
         def body(self):
-            """Return the body text as displayed by selecting the email."""
+            """Return the body text as displayed by selecting the email.
+
+            A ``metadata`` message downloads the full message the first time
+            the body is requested.
+
+            """
+            if self._body is None:
+                payload = self._payload
+                if not payload.get('parts') and self._loader:
+                    payload = self._loader(self._id).get('payload', {})
+                self._body = self._read_body(payload)
             return self._body
 
         @property
         def get_pin(self):
             """Return the numeric pin."""
-            match = PIN_MATCHER.search(self.excerpt)
-            if match:
-                return (match.group())[-6:]
+            return self.tokens.pin
 
 
 class EmptyInboxError(IndexError):
@@ -601,14 +886,217 @@ class Compose(GuerrillaMail):
         return GuerrillaMail(self.selenium)
 
 
+def _message_key(package):
+    """Return a key identifying a RestMail message."""
+    return (package.get('messageId'), package.get('receivedAt'))
+
+
+class MailDelivery(NamedTuple):
+    """The time taken for a waited-on message to arrive."""
+
+    address: str
+    waited: float
+    polls: int
+    messages: int
+
+
+class _MailWaiter(object):
+    """A pending request for new messages in a single mailbox."""
+
+    __slots__ = ('username', 'seen', 'future', 'started', 'deadline',
+                 'delay', 'next_poll', 'polls')
+
+    def __init__(self, username, seen, timeout, poll):
+        self.username = username
+        self.seen = seen
+        self.future = Future()
+        self.started = monotonic()
+        self.deadline = self.started + timeout
+        self.delay = poll
+        self.next_poll = self.started
+        self.polls = 0
+
+
+class MailPoller(object):
+    """Poll RestMail inboxes for every waiting test from one thread.
+
+    Waiters are grouped by mailbox so each inbox is requested once per
+    cycle, whatever the number of tests waiting on it. Each mailbox is
+    polled with an exponential backoff between ``MIN_POLL`` and
+    ``MAX_POLL`` seconds over a pooled, keep-alive session.
+
+    """
+
+    MIN_POLL = 0.25
+    MAX_POLL = 2.0
+    BACKOFF = 1.5
+    TIMEOUT = 10.0
+    WORKERS = 4
+    HISTORY_SIZE = 1000
+
+    _shared: Dict[str, 'MailPoller'] = {}
+    _shared_lock = Lock()
+
+    def __init__(self, url: str, session: requests.Session = None) -> None:
+        """Set up the pooled session.
+
+        :param str url: the mailbox URL template with a ``{username}`` field
+        :param session: (optional) a session to use instead of a new one
+        :type session: :py:class:`requests.Session`
+        :return: None
+
+        """
+        self.url = url
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.WORKERS,
+                                  pool_maxsize=self.WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.deliveries = deque(maxlen=self.HISTORY_SIZE)
+        self._waiters: List[_MailWaiter] = []
+        self._condition = Condition()
+        self._pool = ThreadPoolExecutor(max_workers=self.WORKERS,
+                                        thread_name_prefix='restmail')
+        self._thread = None
+
+    @classmethod
+    def shared(cls, url: str) -> 'MailPoller':
+        """Return the process-wide poller for a mailbox URL template.
+
+        :param str url: the mailbox URL template
+        :return: the shared poller
+        :rtype: :py:class:`MailPoller`
+
+        """
+        with cls._shared_lock:
+            if url not in cls._shared:
+                cls._shared[url] = cls(url)
+            return cls._shared[url]
+
+    def fetch(self, username: str) -> List[dict]:
+        """Return the raw messages in a mailbox.
+
+        :param str username: the mailbox user
+        :return: the JSON message packages
+        :rtype: list(dict)
+
+        """
+        return self.session.get(self.url.format(username=username),
+                                timeout=self.TIMEOUT).json()
+
+    def delete(self, username: str) -> None:
+        """Delete every message in a mailbox.
+
+        :param str username: the mailbox user
+        :return: None
+
+        """
+        self.session.delete(self.url.format(username=username),
+                            timeout=self.TIMEOUT)
+
+    def watch(self, username: str, seen=frozenset(), timeout: float = 60.0,
+              poll: float = None) -> Future:
+        """Wait in the background for a message not already seen.
+
+        :param str username: the mailbox user
+        :param seen: (optional) the keys of messages already received
+        :type seen: set
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param float poll: (optional) the first polling interval in seconds
+        :return: a future resolving to the raw mailbox messages or raising
+            :py:class:`~requests.exceptions.Timeout`
+        :rtype: :py:class:`~concurrent.futures.Future`
+
+        """
+        waiter = _MailWaiter(username, frozenset(seen), timeout,
+                             poll or self.MIN_POLL)
+        with self._condition:
+            self._waiters.append(waiter)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='restmail-poller',
+                                      daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return waiter.future
+
+    def stats(self) -> Dict[str, float]:
+        """Return the time-to-delivery summary.
+
+        :return: the number of deliveries and the mean and longest waits
+        :rtype: dict
+
+        """
+        waits = [delivery.waited for delivery in self.deliveries]
+        return {
+            'count': len(waits),
+            'mean': sum(waits) / len(waits) if waits else 0.0,
+            'max': max(waits, default=0.0),
+        }
+
+    def _fetch_quietly(self, username):
+        """Return the mailbox messages or None if the request failed."""
+        try:
+            return self.fetch(username)
+        except (requests.RequestException, ValueError):
+            return None
+
+    def _run(self):
+        """Poll the mailboxes with pending waiters."""
+        while True:
+            with self._condition:
+                self._waiters = [waiter for waiter in self._waiters
+                                 if not waiter.future.done()]
+                if not self._waiters:
+                    self._condition.wait()
+                    continue
+                now = monotonic()
+                due = [waiter for waiter in self._waiters
+                       if waiter.next_poll <= now]
+                if not due:
+                    self._condition.wait(
+                        min(waiter.next_poll for waiter in self._waiters) -
+                        now)
+                    continue
+            usernames = list({waiter.username for waiter in due})
+            inboxes = dict(zip(usernames,
+                               self._pool.map(self._fetch_quietly, usernames)))
+            now = monotonic()
+            with self._condition:
+                for waiter in due:
+                    self._update(waiter, inboxes[waiter.username], now)
+
+    def _update(self, waiter, packages, now):
+        """Resolve, expire or reschedule a waiter after a poll."""
+        waiter.polls += 1
+        if packages and any(_message_key(package) not in waiter.seen
+                            for package in packages):
+            self.deliveries.append(MailDelivery(
+                address=waiter.username,
+                waited=now - waiter.started,
+                polls=waiter.polls,
+                messages=len(packages)))
+            waiter.future.set_result(packages)
+        elif now >= waiter.deadline:
+            waiter.future.set_exception(Timeout(
+                'Mail not received in {time} seconds'
+                .format(time=round(waiter.deadline - waiter.started, 2))))
+        else:
+            waiter.next_poll = min(now + waiter.delay, waiter.deadline)
+            waiter.delay = min(waiter.delay * self.BACKOFF, self.MAX_POLL)
+
+
 class RestMail(object):
     """RestMail API for non-interactive e-mail testing."""
 
-    MAIL_URL = 'http://restmail.net/mail/{username}'
+    # point at a local mail sink with RESTMAIL_URL or configure()
+    MAIL_URL = os.getenv('RESTMAIL_URL', 'http://restmail.net/mail/{username}')
 
     def __init__(self, username):
         """Initialize a mailbox."""
         self._inbox = []
+        self._seen = set()
         self._username = username
         self._address = username + '@restmail.net'
 
@@ -634,23 +1122,85 @@ class RestMail(object):
         """
         return self._inbox
 
+    @classmethod
+    def configure(cls, url=None):
+        """Set the mailbox URL template used by every RestMail inbox.
+
+        Args:
+            url: a URL with a ``{username}`` field, such as a local
+                :py:class:`~utils.mailsink.MailSink` URL; the public
+                restmail.net service is used when empty
+
+        """
+        cls.MAIL_URL = url or 'http://restmail.net/mail/{username}'
+
+    @property
+    def poller(self):
+        """Return the mailbox poller.
+
+        A mail sink running in this process is waited on directly.
+        """
+        from utils.mailsink import MailSink
+        return (MailSink.running(self.MAIL_URL) or
+                MailPoller.shared(self.MAIL_URL))
+
     def get_mail(self):
         """Get email for a dynamic user.
 
+        Only messages not already in the inbox are parsed.
+
         Returns:
             A list of Emails received for a particular user
 
         """
-        messages = requests.get(self.MAIL_URL.format(username=self._username))
-        self._inbox = [self.Email(message) for message in messages.json()]
-        return self._inbox
+        return self._merge(self.poller.fetch(self._username))
+
+    def mail_future(self, max_time=60.0, pause_time=0.25, new=False):
+        """Wait for mail in the background.
+
+        Args:
+            max_time: maximum time to wait for emails
+            pause_time: the initial time between polling requests
+            new: wait for a message not already in the inbox instead of
+                any message
+
+        Returns:
+            A future resolving to the list of Emails received for the user
+
+        """
+        result = Future()
+
+        def deliver(polled):
+            try:
+                result.set_result(self._merge(polled.result()))
+            except Exception as ex:
+                result.set_exception(ex)
 
-    def wait_for_mail(self, max_time=60.0, pause_time=0.25):
+        self.poller.watch(self._username,
+                          seen=self._seen if new else (),
+                          timeout=max_time,
+                          poll=pause_time).add_done_callback(deliver)
+        return result
+
+    async def wait_for_mail_async(self, max_time=60.0, pause_time=0.25,
+                                  new=False):
+        """Await mail from an asyncio event loop.
+
+        Returns:
+            A list of Emails received for a particular user
+
+        """
+        return await asyncio.wrap_future(
+            self.mail_future(max_time, pause_time, new))
+
+    def wait_for_mail(self, max_time=60.0, pause_time=0.25, new=False):
         """Poll until mail is received but doesn't exceed max_time seconds.
 
         Args:
             max_time: maximum time to wait for emails
-            pause_time: time between polling requests
+            pause_time: the initial time between polling requests
+            new: wait for a message not already in the inbox instead of
+                any message
 
         Returns:
             A list of Emails received for a particular user
@@ -659,27 +1209,29 @@ class RestMail(object):
             Timeout: after waiting the max time, no emails were received
 
         """
-        timer = 0.0
-        while timer <= (max_time / pause_time):
-            self.get_mail()
-            if self._inbox:
-                return self._inbox
-            timer = timer + pause_time
-            sleep(pause_time)
-        from requests.exceptions import Timeout
-        raise Timeout('Mail not received in {time} seconds'
-                      .format(time=max_time))
+        return self.mail_future(max_time, pause_time, new).result()
 
     @property
     def size(self):
         """Return the number of messages in the inbox."""
-        return self._inbox.__len__
+        return len(self._inbox)
 
     def empty(self):
         """Delete all message in the inbox."""
-        requests.delete(self.MAIL_URL.format(username=self._username))
+        self.poller.delete(self._username)
+        self._inbox = []
+        self._seen = set()
+
+    def _merge(self, packages):
+        """Add the messages not already in the inbox."""
+        for package in packages:
+            key = _message_key(package)
+            if key not in self._seen:
+                self._seen.add(key)
+                self._inbox.append(self.Email(package))
+        return self._inbox
 
-    class Email(object):
+    class Email(_Message):
         """E-mail message structure.
 
         Attributes:
@@ -700,6 +1252,10 @@ class RestMail(object):
 
         """
 
+        __slots__ = ('_html', '_text', '_headers', '_subject', '_references',
+                     '_id', '_reply', '_priority', '_from', '_to', '_date',
+                     '_received', '_received_at', '_excerpt')
+
         def __init__(self, package):
             """Read possible RestMail fields."""
             self._html = self._pull_data('html', package, '')
@@ -720,6 +1276,11 @@ class RestMail(object):
                     self._subject
                 )
             )
+            self._tokens = None
+
+        def _token_text(self):
+            """Search the body excerpt."""
+            return self._excerpt
 
         def _pull_data(self, field, package, default):
             """Pull data from the JSON package."""
@@ -785,30 +1346,6 @@ class RestMail(object):
             """Return the message receive time."""
             return self._received_at
 
-        @property
-        def has_pin(self):
-            """Return True if a pin string is in the body excerpt."""
-            return bool(PIN_MATCHER.search(self._excerpt))
-
-        @property
-        def pin(self):
-            """Return the numeric pin."""
-            if self.has_pin:
-                return (PIN_MATCHER.search(self._excerpt).group())[-6:]
-            raise EmailVerificationError('No pin found')
-
-        @property
-        def has_link(self):
-            """Return True if a confirmation URL is in the excerpt."""
-            return bool(URL_MATCHER.search(self._excerpt))
-
-        @property
-        def confirmation_link(self):
-            """Access the confirmation URL link."""
-            if self.has_link:
-                return URL_MATCHER.search(self._excerpt).group()
-            raise EmailVerificationError('No confirmation link found')
-
         def confirm_email(self):
             """Access the confirmation link."""
             send = requests.get(self.confirmation_link)
@@ -816,18 +1353,6 @@ class RestMail(object):
                 raise EmailVerificationError(
                     f'Email not confirmed. ({send.status_code})')
 
-        @property
-        def has_reset(self):
-            """Return True if a password reset URL is in the excerpt."""
-            return bool(RESET_MATCHER.search(self._excerpt))
-
-        @property
-        def reset_link(self):
-            """Access the password reset URL link."""
-            if self.has_reset:
-                return RESET_MATCHER.search(self._excerpt).group()
-            raise EmailVerificationError('No password reset link found')
-
         def submit_reset(self):
             """Access the reset link."""
             send = requests.get(self.reset_link)
@@ -837,40 +1362,178 @@ class RestMail(object):
                     .format(code=send.status_code))
 
 
+class SendTiming(NamedTuple):
+    """The time taken to send one message."""
+
+    recipients: str
+    subject: str
+    seconds: float
+
+
+class _Connection(object):
+    """An authenticated SMTP connection shared by the senders in a process."""
+
+    __slots__ = ('smtp', 'lock', 'last_used', 'opened')
+
+    def __init__(self):
+        self.smtp = None
+        self.lock = Lock()
+        self.last_used = 0.0
+        self.opened = 0
+
+
 class SendMail(object):
-    """Send an email through Gmail."""
+    """Send email through an SMTP relay such as Gmail.
+
+    Senders for the same relay and account share one authenticated
+    connection per process. The connection is reopened when it has been
+    idle for more than ``IDLE_TIMEOUT`` seconds or the server closed it.
 
-    def __init__(self, username, password, host, port, timeout=10):
+    """
+
+    IDLE_TIMEOUT = 60.0
+    HELO_NAME = 'automated-qa.openstax.org'
+    HISTORY_SIZE = 1000
+
+    _connections: Dict[tuple, _Connection] = {}
+    _connections_lock = Lock()
+
+    def __init__(self, username, password, host, port, timeout=10,
+                 debug=False):
         """Initialize an email sender."""
         self.username = username
         self.password = password
         self.host = host
         self.port = port
         self.timeout = timeout
+        self.debug = debug
+        self.timings = deque(maxlen=self.HISTORY_SIZE)
 
-    @contextmanager
-    def _sender(self):
-        """Start a relay for Gmail."""
-        smtp_server = smtplib.SMTP(self.host, self.port, self.timeout)
-        smtp_server.set_debuglevel(True)
-        try:
-            smtp_server.ehlo_or_helo_if_needed()
+    @property
+    def connection(self):
+        """Return the process-wide connection record for this relay."""
+        key = (self.host, self.port, self.username)
+        with self._connections_lock:
+            if key not in self._connections:
+                self._connections[key] = _Connection()
+            return self._connections[key]
+
+    def _connect(self):
+        """Open and authenticate a new relay connection."""
+        smtp_server = smtplib.SMTP(self.host, self.port,
+                                   self.HELO_NAME, self.timeout)
+        smtp_server.set_debuglevel(self.debug)
+        smtp_server.ehlo_or_helo_if_needed()
+        if smtp_server.has_extn('starttls'):
             smtp_server.starttls()
-            smtp_server.ehlo(name='automated-qa.openstax.org')
+            smtp_server.ehlo(name=self.HELO_NAME)
+        if self.username and smtp_server.has_extn('auth'):
             smtp_server.login(self.username, self.password)
-            yield smtp_server
-        finally:
-            smtp_server.quit()
-        sleep(3.0)
+        return smtp_server
+
+    @contextmanager
+    def _sender(self, reconnect=False):
+        """Hold the shared relay connection, opening it if needed."""
+        connection = self.connection
+        with connection.lock:
+            idle = monotonic() - connection.last_used
+            if connection.smtp is not None and \
+                    (reconnect or idle > self.IDLE_TIMEOUT):
+                self._close(connection)
+            if connection.smtp is None:
+                connection.smtp = self._connect()
+                connection.opened += 1
+            try:
+                yield connection.smtp
+            finally:
+                connection.last_used = monotonic()
+
+    @staticmethod
+    def _close(connection):
+        """Quit a relay connection, ignoring a server that already left."""
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.smtp.close()
+        connection.smtp = None
+
+    @staticmethod
+    def message(recipients, sender, subject, message):
+        """Build a plain text message.
+
+        Args:
+            recipients: the (name, address) pair for the recipient
+            sender: the (name, address) pair for the sender
+            subject: the message subject
+            message: the plain text body
+
+        """
+        msg = MIMEText(message)
+        msg['From'] = format_address(sender)
+        msg['To'] = format_address(recipients)
+        msg['Subject'] = subject
+        return msg
+
+    def send_batch(self, messages):
+        """Send several messages over the shared connection.
+
+        The messages are sent back to back without a new handshake; if the
+        relay dropped an idle connection it is reopened once.
+
+        Args:
+            messages: the email.message.Message objects to send
+
+        Returns:
+            A SendTiming for each message
+
+        """
+        timings = []
+        pending = list(messages)
+        reconnect = False
+        while pending:
+            try:
+                with self._sender(reconnect) as smtp:
+                    while pending:
+                        start = monotonic()
+                        smtp.send_message(msg=pending[0])
+                        msg = pending.pop(0)
+                        timings.append(SendTiming(
+                            recipients=msg['To'], subject=msg['Subject'],
+                            seconds=monotonic() - start))
+            except smtplib.SMTPServerDisconnected:
+                if reconnect:
+                    raise
+                reconnect = True
+        self.timings.extend(timings)
+        return timings
 
     def send_mail(self, recipients, sender, subject, message):
-        """Send an email through Gmail."""
-        with self._sender() as smtp:
-            msg = MIMEText(message)
-            msg['From'] = format_address(sender)
-            msg['To'] = format_address(recipients)
-            msg['Subject'] = subject
-            smtp.send_message(msg=msg)
+        """Send an email through the relay."""
+        return self.send_batch(
+            [self.message(recipients, sender, subject, message)])[0]
+
+    def stats(self):
+        """Return the per-message send time summary."""
+        times = [timing.seconds for timing in self.timings]
+        return {
+            'count': len(times),
+            'mean': sum(times) / len(times) if times else 0.0,
+            'max': max(times, default=0.0),
+            'connections': self.connection.opened,
+        }
+
+    @classmethod
+    def close_all(cls):
+        """Quit every open relay connection."""
+        with cls._connections_lock:
+            connections = list(cls._connections.values())
+        for connection in connections:
+            with connection.lock:
+                if connection.smtp is not None:
+                    cls._close(connection)
+
+
+atexit.register(SendMail.close_all)
 
 
 class EmailVerificationError(Exception):
@@ -0,0 +1,244 @@
+"""Element visibility, viewport and image geometry read in one script call.
+
+Page objects frequently check that a group of elements is on screen or that
+their images have loaded. Reading each bounding box, scroll offset and
+window size separately costs several WebDriver round trips per element, so
+:py:class:`Geometry` measures a whole list of elements and locators with a
+single script and returns an :py:class:`ElementGeometry` for each element.
+
+"""
+
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+Locator = Tuple[str, str]
+Target = Union[WebElement, Locator]
+
+# Javascript page requests
+# measure a list of elements and CSS selectors against the current viewport
+MEASURE = '''
+var targets = arguments[0];
+var root = document.documentElement;
+var view = [window.pageXOffset, window.pageYOffset,
+            window.pageXOffset + root.clientWidth,
+            window.pageYOffset + root.clientHeight];
+var elements = [];
+targets.forEach(function(target) {
+  if (typeof target === 'string') {
+    document.querySelectorAll(target).forEach(function(element) {
+      elements.push(element);
+    });
+  } else {
+    elements.push(target);
+  }
+});
+return elements.map(function(element) {
+  var rect = element.getBoundingClientRect();
+  var style = window.getComputedStyle(element);
+  var image = element.tagName === 'IMG';
+  return {
+    element: element,
+    box: [rect.left + view[0], rect.top + view[1],
+          rect.right + view[0], rect.bottom + view[1]],
+    view: view,
+    displayed: (rect.width > 0 && rect.height > 0 &&
+                style.visibility !== 'hidden' && style.display !== 'none'),
+    sized: style.height !== 'auto',
+    image: image,
+    complete: image ? element.complete : null,
+    natural: image ? (typeof element.naturalWidth) !== 'undefined' : null
+  };
+});
+'''
+
+
+class ElementGeometry(NamedTuple):
+    """The page position and display state of an element."""
+
+    element: WebElement
+    box: Tuple[float, float, float, float]
+    view: Tuple[float, float, float, float]
+    displayed: bool
+    sized: bool
+    image: bool
+    complete: Optional[bool]
+    natural: Optional[bool]
+
+    LEFT, TOP, RIGHT, BOTTOM = range(4)
+
+    def in_viewport(self, ignore_bottom: bool = False) -> bool:
+        """Return True if the element box lies completely within the window.
+
+        :param bool ignore_bottom: (optional) skip the check that the element
+            is above the bottom of the browser window
+        :return: ``True`` if the element box is within the browser window
+        :rtype: bool
+
+        """
+        return (
+            self.box[self.LEFT] >= self.view[self.LEFT] and
+            self.box[self.TOP] >= self.view[self.TOP] and
+            self.box[self.RIGHT] <= self.view[self.RIGHT] and
+            (self.box[self.BOTTOM] <= self.view[self.BOTTOM] or
+             ignore_bottom))
+
+    def image_loaded(self, internet_explorer: bool = False) -> bool:
+        """Return True if an image is rendered.
+
+        Non-image elements are always considered loaded.
+
+        :param bool internet_explorer: (optional) use the image ``complete``
+            state used by Internet Explorer
+        :return: ``True`` if the image is rendered
+        :rtype: bool
+
+        """
+        if not self.image:
+            return True
+        return bool(self.complete if internet_explorer else self.natural)
+
+    def describe(self, ignore_bottom: bool = False) -> str:
+        """Return the element and window boxes with each boundary check.
+
+        :param bool ignore_bottom: (optional) skip the bottom boundary check
+        :return: the boundary comparisons
+        :rtype: str
+
+        """
+        checks = (
+            ('Left', '>=', self.box[self.LEFT] >= self.view[self.LEFT]),
+            ('Top', '>=', self.box[self.TOP] >= self.view[self.TOP]),
+            ('Right', '<=', self.box[self.RIGHT] <= self.view[self.RIGHT]),
+            ('Bottom', '<=', (self.box[self.BOTTOM] <= self.view[self.BOTTOM]
+                              or ignore_bottom)))
+        return '; '.join(
+            f'{side} {result} - Element ({self.box[index]}) {sign} '
+            f'Page ({self.view[index]})'
+            for index, (side, sign, result) in enumerate(checks))
+
+
+class Geometry(object):
+    """Measure groups of elements with one script call."""
+
+    @classmethod
+    def measure(cls, driver: WebDriver, targets: Sequence[Target]) \
+            -> List[ElementGeometry]:
+        """Return the geometry for elements and every match of locators.
+
+        CSS selector locators are resolved inside the script; other locators
+        are found first with a single ``find_elements`` call each.
+
+        :param driver: a selenium webdriver
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param targets: web elements and element selector tuples
+        :type targets: list(WebElement or tuple(str, str))
+        :return: the geometry of each element in target order
+        :rtype: list(:py:class:`ElementGeometry`)
+
+        """
+        arguments = []
+        for target in targets:
+            if isinstance(target, tuple):
+                strategy, selector = target
+                if strategy == By.CSS_SELECTOR:
+                    arguments.append(selector)
+                else:
+                    arguments.extend(driver.find_elements(strategy, selector))
+            else:
+                arguments.append(target)
+        if not arguments:
+            return []
+        results = driver.execute_script(MEASURE, arguments)
+        return [ElementGeometry(element=result.get('element'),
+                                box=tuple(result.get('box')),
+                                view=tuple(result.get('view')),
+                                displayed=result.get('displayed'),
+                                sized=result.get('sized'),
+                                image=result.get('image'),
+                                complete=result.get('complete'),
+                                natural=result.get('natural'))
+                for result in results]
+
+    @classmethod
+    def in_viewport(cls, driver: WebDriver, targets: Sequence[Target],
+                    ignore_bottom: bool = False) -> bool:
+        """Return True if every element lies completely in the window.
+
+        :param driver: a selenium webdriver
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param targets: web elements and element selector tuples
+        :param bool ignore_bottom: (optional) skip the check that the
+            elements are above the bottom of the browser window
+        :return: ``True`` if every element box is within the browser window
+        :rtype: bool
+
+        """
+        return all(geometry.in_viewport(ignore_bottom)
+                   for geometry in cls.measure(driver, targets))
+
+    @classmethod
+    def images_loaded(cls, driver: WebDriver, targets: Sequence[Target],
+                      skip_unsized: bool = False) -> bool:
+        """Return True if every image is rendered.
+
+        :param driver: a selenium webdriver
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param targets: image elements and image selector tuples
+        :param bool skip_unsized: (optional) ignore images whose computed
+            height is still ``auto``
+        :return: ``True`` if every image is rendered
+        :rtype: bool
+
+        """
+        explorer = cls.is_internet_explorer(driver)
+        return all(geometry.image_loaded(explorer)
+                   for geometry in cls.measure(driver, targets)
+                   if geometry.sized or not skip_unsized)
+
+    @classmethod
+    def assert_visible(cls, driver: WebDriver, targets: Sequence[Target],
+                       in_viewport: bool = False, ignore_bottom: bool = False,
+                       images: bool = True) -> List[ElementGeometry]:
+        """Assert that every element is displayed and its image is rendered.
+
+        :param driver: a selenium webdriver
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param targets: web elements and element selector tuples
+        :param bool in_viewport: (optional) also require each element to lie
+            completely within the browser window
+        :param bool ignore_bottom: (optional) skip the bottom window check
+        :param bool images: (optional) require images to be rendered
+        :return: the geometry of each element
+        :rtype: list(:py:class:`ElementGeometry`)
+        :raises AssertionError: listing each element failing a check
+
+        """
+        explorer = cls.is_internet_explorer(driver)
+        results = cls.measure(driver, targets)
+        failures = []
+        for index, geometry in enumerate(results):
+            if not geometry.displayed:
+                failures.append(f'Element {index} is not displayed')
+            elif images and not geometry.image_loaded(explorer):
+                failures.append(f'Element {index} image is not rendered')
+            elif in_viewport and not geometry.in_viewport(ignore_bottom):
+                failures.append(f'Element {index} is not in the window: '
+                                f'{geometry.describe(ignore_bottom)}')
+        assert not failures, '\n'.join(failures)
+        return results
+
+    @staticmethod
+    def is_internet_explorer(driver: WebDriver) -> bool:
+        """Return True if the driver is running Internet Explorer."""
+        from selenium.webdriver import Ie
+        return (isinstance(driver, Ie) or
+                driver.capabilities.get('browserName') == 'internet explorer')
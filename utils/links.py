@@ -0,0 +1,258 @@
+"""A pooled, concurrent link checker.
+
+Link sweeps (footer, press, bookstore and book links) used to open a new
+connection for every request and retry CloudFront errors serially with a
+fixed pause. :py:class:`LinkChecker` shares one pooled ``requests`` session,
+checks batches of links on a thread pool while limiting the number of
+simultaneous requests sent to any one host, backs off with jitter and
+caches each result for the rest of the test session.
+
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.client import responses
+from random import uniform
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CLOUDFRONT_ERROR = 'Error from cloudfront'
+
+# browser user agents used for GET requests so sites that reject unknown
+# clients respond the way they would to the test browser
+USER_AGENTS = {
+    'chrome': {
+        'User-Agent': (
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_6)'
+            ' AppleWebKit/537.36 (KHTML, like Gecko)'
+            ' Chrome/77.0.3865.90 Safari/537.36'), },
+    'firefox': {
+        'User-Agent': (
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14;'
+            ' rv:69.0) Gecko/20100101 Firefox/69.0'), },
+    'safari': {
+        'User-Agent': (
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_6)'
+            ' AppleWebKit/605.1.15 (KHTML, like Gecko)'
+            ' Version/13.0.1 Safari/605.1.15'), },
+    '': {},
+}
+
+
+class LinkResult(NamedTuple):
+    """The outcome of checking a single link."""
+
+    url: str
+    status: int
+    method: str
+    latency: float
+    attempts: int
+    cloudfront_error: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the link returned a success or redirect code."""
+        return 0 < self.status < 400
+
+    @property
+    def passed(self) -> bool:
+        """Return True if the link should not fail a test.
+
+        CloudFront errors are reported but not treated as failures.
+
+        """
+        return self.ok or self.cloudfront_error
+
+    @property
+    def reason(self) -> str:
+        """Return the status code and reason phrase."""
+        if self.error:
+            return f'<{self.error}>'
+        return f'<{self.status} {responses.get(self.status)}>'
+
+
+class LinkChecker(object):
+    """Check links using a shared session and a worker pool."""
+
+    WORKERS = 8
+    PER_HOST = 4
+    RETRIES = 6
+    BACKOFF = 0.5
+    MAX_BACKOFF = 8.0
+    TIMEOUT = 30.0
+
+    _shared: Dict[str, LinkChecker] = {}
+    _shared_lock = Lock()
+
+    def __init__(self, browser: str = '', workers: int = None,
+                 per_host: int = None, retries: int = None,
+                 backoff: float = None, max_backoff: float = None,
+                 timeout: float = None,
+                 session: requests.Session = None) -> None:
+        """Set up the pooled session and the concurrency limits.
+
+        :param str browser: (optional) the browser name used to select the
+            ``User-Agent`` for GET requests
+        :param int workers: (optional) the number of worker threads
+        :param int per_host: (optional) the maximum number of simultaneous
+            requests sent to a single host
+        :param int retries: (optional) the number of retries for a 503 or
+            CloudFront error
+        :param float backoff: (optional) the base backoff in seconds
+        :param float max_backoff: (optional) the largest backoff in seconds
+        :param float timeout: (optional) the request timeout in seconds
+        :param session: (optional) a session to use instead of a new one
+        :type session: :py:class:`requests.Session`
+        :return: None
+
+        """
+        self.browser = browser.lower()
+        self.workers = workers or self.WORKERS
+        self.per_host = per_host or self.PER_HOST
+        self.retries = self.RETRIES if retries is None else retries
+        self.backoff = self.BACKOFF if backoff is None else backoff
+        self.max_backoff = max_backoff or self.MAX_BACKOFF
+        self.timeout = timeout or self.TIMEOUT
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.workers,
+                                  pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                        thread_name_prefix='link-checker')
+        self._hosts: Dict[str, BoundedSemaphore] = {}
+        self._results: Dict[Tuple[str, bool], Future] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def shared(cls, browser: str = '') -> LinkChecker:
+        """Return the session-wide checker for a browser.
+
+        :param str browser: (optional) the browser name
+        :return: the shared link checker
+        :rtype: :py:class:`LinkChecker`
+
+        """
+        browser = browser.lower()
+        with cls._shared_lock:
+            if browser not in cls._shared:
+                cls._shared[browser] = cls(browser=browser)
+            return cls._shared[browser]
+
+    def check(self, url: str, head: bool = True) -> LinkResult:
+        """Check a single link.
+
+        :param str url: the link to check
+        :param bool head: (optional) start with a HEAD request instead of GET
+        :return: the link status, latency and number of attempts
+        :rtype: :py:class:`LinkResult`
+
+        """
+        return self._submit(url, head).result()
+
+    def check_all(self, urls: Iterable[str],
+                  head: bool = True) -> List[LinkResult]:
+        """Check a batch of links concurrently.
+
+        :param urls: the links to check
+        :type urls: iterable(str)
+        :param bool head: (optional) start with a HEAD request instead of GET
+        :return: the results in the same order as ``urls``
+        :rtype: list(:py:class:`LinkResult`)
+
+        """
+        futures = [self._submit(url, head) for url in urls]
+        return [future.result() for future in futures]
+
+    def clear(self) -> None:
+        """Forget the cached results.
+
+        :return: None
+
+        """
+        with self._lock:
+            self._results.clear()
+
+    def close(self) -> None:
+        """Stop the worker pool and close the session.
+
+        :return: None
+
+        """
+        self._pool.shutdown(wait=True)
+        self.session.close()
+
+    def _submit(self, url: str, head: bool) -> Future:
+        """Return the cached or in-flight result for a link."""
+        key = (url, head)
+        with self._lock:
+            future = self._results.get(key)
+            if future is None:
+                future = self._pool.submit(self._check, url, head)
+                self._results[key] = future
+            return future
+
+    def _host(self, url: str) -> BoundedSemaphore:
+        """Return the concurrency limit for the link's host."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _request(self, url: str, head: bool) -> requests.Response:
+        """Send a single HEAD or GET request."""
+        if head:
+            return self.session.head(url, timeout=self.timeout)
+        return self.session.get(url, timeout=self.timeout,
+                                headers=USER_AGENTS.get(self.browser, {}))
+
+    def _delay(self, attempt: int) -> float:
+        """Return a full-jitter exponential backoff delay."""
+        return uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _check(self, url: str, head: bool) -> LinkResult:
+        """Query a link, falling back to GET and retrying server errors."""
+        start = monotonic()
+        attempts = 0
+        status = 0
+        cloudfront = False
+        error = None
+        limit = self._host(url)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                sleep(self._delay(attempt))
+            attempts += 1
+            try:
+                with limit:
+                    response = self._request(url, head)
+                    if response.status_code == 403 and head:
+                        # some hosts reject HEAD requests
+                        head = False
+                        attempts += 1
+                        response = self._request(url, head)
+            except requests.RequestException as ex:
+                status, cloudfront, error = 0, False, type(ex).__name__
+                continue
+            status = response.status_code
+            cloudfront = (
+                CLOUDFRONT_ERROR in response.headers.get('X-Cache', ''))
+            error = None
+            if status != 503 and not (cloudfront and status >= 500):
+                break
+        return LinkResult(url=url,
+                          status=status,
+                          method='HEAD' if head else 'GET',
+                          latency=monotonic() - start,
+                          attempts=attempts,
+                          cloudfront_error=cloudfront,
+                          error=error)
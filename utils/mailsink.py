@@ -0,0 +1,441 @@
+"""A local mail sink speaking SMTP and the RestMail JSON API.
+
+Messages sent to the sink's SMTP port are parsed once, stored in memory
+and indexed by the recipient's mailbox name. The HTTP endpoint answers
+``GET`` and ``DELETE`` on ``/mail/{username}`` with the same JSON as
+restmail.net, so :py:class:`~utils.email.RestMail` can be pointed at it by
+URL. Inside the test process the sink also stands in for the RestMail
+poller: waiters block on a condition until a message arrives instead of
+polling.
+
+Run a stand-alone sink with ``python -m utils.mailsink``.
+
+"""
+
+import json
+import socketserver
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email import policy
+from email.parser import BytesParser
+from email.utils import getaddresses, make_msgid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from requests.exceptions import Timeout
+
+from utils.email import MailDelivery, _message_key
+
+
+def mailbox(address: str) -> str:
+    """Return the mailbox name for an email address.
+
+    :param str address: a full email address or a mailbox name
+    :return: the lower case local part of the address
+    :rtype: str
+
+    """
+    return address.strip().strip('<>').split('@')[0].lower()
+
+
+def to_package(data: bytes, envelope: List[str] = None) -> dict:
+    """Convert a raw message into a RestMail JSON package.
+
+    :param bytes data: the RFC 5322 message
+    :param envelope: (optional) the SMTP ``RCPT TO`` addresses used when the
+        message headers do not name the recipients
+    :type envelope: list(str)
+    :return: the message in the restmail.net JSON shape
+    :rtype: dict
+
+    """
+    message = BytesParser(policy=policy.default).parsebytes(data)
+    text = message.get_body(preferencelist=('plain',))
+    html = message.get_body(preferencelist=('html',))
+    recipients = getaddresses(message.get_all('to', []) +
+                              message.get_all('cc', []))
+    if not recipients:
+        recipients = [('', address) for address in envelope or []]
+    received = datetime.now(timezone.utc)
+    stamp = received.strftime('%Y-%m-%dT%H:%M:%S.') + \
+        f'{received.microsecond // 1000:03}Z'
+    return {
+        'html': html.get_content() if html else '',
+        'text': text.get_content() if text else '',
+        'headers': {key.lower(): str(value)
+                    for key, value in message.items()},
+        'subject': str(message.get('subject', '')),
+        'messageId': str(message.get('message-id') or make_msgid()).strip(
+            '<>'),
+        'priority': str(message.get('x-priority', 'normal')),
+        'from': [{'address': address, 'name': name}
+                 for name, address in getaddresses(message.get_all('from',
+                                                                   []))],
+        'to': [{'address': address, 'name': name}
+               for name, address in recipients],
+        'date': str(message.get('date', stamp)),
+        'receivedDate': stamp,
+        'receivedAt': stamp,
+    }
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """A minimal SMTP conversation storing each message in the sink."""
+
+    def handle(self):
+        """Answer SMTP commands until the client quits."""
+        sink = self.server.sink
+        sender, recipients = None, []
+        self._reply('220 {host} os-automation mail sink'
+                    .format(host=sink.host))
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, argument = (line.decode('utf-8', 'replace')
+                                    .rstrip('\r\n').partition(' '))
+            command = command.upper()
+            if command == 'EHLO':
+                self._reply('250-{host}'.format(host=sink.host),
+                            '250-8BITMIME',
+                            '250-AUTH PLAIN LOGIN',
+                            '250 SIZE {size}'.format(size=sink.MAX_SIZE))
+            elif command == 'HELO':
+                self._reply(f'250 {sink.host}')
+            elif command == 'AUTH':
+                # accept any credentials; LOGIN asks for two more lines
+                if argument.upper().startswith('LOGIN'):
+                    prompts = 1 if ' ' in argument.strip() else 2
+                    for _ in range(prompts):
+                        self._reply('334 ')
+                        self.rfile.readline()
+                self._reply('235 Authentication successful')
+            elif command == 'MAIL':
+                sender, recipients = argument.partition(':')[2].strip(), []
+                self._reply('250 OK')
+            elif command == 'RCPT':
+                recipients.append(
+                    argument.partition(':')[2].split()[0].strip('<>'))
+                self._reply('250 OK')
+            elif command == 'DATA':
+                if sender is None or not recipients:
+                    self._reply('503 Need MAIL and RCPT first')
+                    continue
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                sink.receive(self._read_data(), recipients)
+                sender, recipients = None, []
+                self._reply('250 OK: queued')
+            elif command == 'RSET':
+                sender, recipients = None, []
+                self._reply('250 OK')
+            elif command == 'NOOP':
+                self._reply('250 OK')
+            elif command == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+    def _read_data(self):
+        """Read the message body up to the terminating dot."""
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b'.\r\n', b'.\n'):
+                return b''.join(lines)
+            # undo the SMTP dot stuffing
+            lines.append(line[1:] if line.startswith(b'..') else line)
+
+    def _reply(self, *lines):
+        """Send one or more reply lines."""
+        self.wfile.write(''.join(f'{line}\r\n' for line in lines)
+                         .encode('utf-8'))
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    """The SMTP listener."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """Answer the restmail.net mailbox requests."""
+
+    def do_GET(self):
+        """Return the JSON messages for a mailbox."""
+        self._respond(json.dumps(self.server.sink.fetch(self._user)))
+
+    def do_DELETE(self):
+        """Empty a mailbox."""
+        self.server.sink.delete(self._user)
+        self._respond('')
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+    @property
+    def _user(self):
+        """Return the mailbox named by the request path."""
+        return unquote(urlparse(self.path).path.rstrip('/').rsplit('/', 1)[-1])
+
+    def _respond(self, body):
+        """Send a JSON response."""
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MailSink(object):
+    """Receive mail locally and serve it in the RestMail JSON shape.
+
+    The sink exposes the same ``fetch``, ``delete``, ``watch``, ``stats``
+    and ``deliveries`` members as :py:class:`~utils.email.MailPoller`, so a
+    :py:class:`~utils.email.RestMail` pointed at a running sink waits on it
+    directly.
+
+    """
+
+    HOST = '127.0.0.1'
+    MAX_SIZE = 10 * 1024 * 1024
+    HISTORY_SIZE = 1000
+    # seconds between listener shutdown checks
+    SHUTDOWN_POLL = 0.05
+
+    _running: Dict[str, 'MailSink'] = {}
+    _running_lock = Lock()
+
+    def __init__(self, host: str = HOST, smtp_port: int = 0,
+                 http_port: int = 0) -> None:
+        """Set up an empty sink; nothing listens until :py:meth:`start`.
+
+        :param str host: (optional) the interface to listen on
+        :param int smtp_port: (optional) the SMTP port; ``0`` picks a free
+            port
+        :param int http_port: (optional) the HTTP port; ``0`` picks a free
+            port
+        :return: None
+
+        """
+        self.host = host
+        self.smtp_port = smtp_port
+        self.http_port = http_port
+        self.deliveries = deque(maxlen=self.HISTORY_SIZE)
+        self._boxes: Dict[str, List[dict]] = {}
+        self._condition = Condition()
+        self._servers = []
+
+    def __enter__(self):
+        """Start the sink."""
+        return self.start()
+
+    def __exit__(self, *exc):
+        """Stop the sink."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the mailbox URL template for :py:class:`RestMail`.
+
+        :return: the HTTP mailbox URL with a ``{username}`` field
+        :rtype: str
+
+        """
+        return f'http://{self.host}:{self.http_port}/mail/{{username}}'
+
+    @classmethod
+    def running(cls, url: str) -> Optional['MailSink']:
+        """Return the sink in this process serving a mailbox URL.
+
+        :param str url: the mailbox URL template
+        :return: the running sink or ``None``
+        :rtype: :py:class:`MailSink` or None
+
+        """
+        return cls._running.get(url)
+
+    def start(self) -> 'MailSink':
+        """Start the SMTP and HTTP listeners.
+
+        :return: the running sink
+        :rtype: :py:class:`MailSink`
+
+        """
+        smtp = _SMTPServer((self.host, self.smtp_port), _SMTPHandler)
+        http = ThreadingHTTPServer((self.host, self.http_port), _HTTPHandler)
+        http.daemon_threads = True
+        for server in (smtp, http):
+            server.sink = self
+            Thread(target=server.serve_forever, args=(self.SHUTDOWN_POLL,),
+                   name='mail-sink', daemon=True).start()
+        self._servers = [smtp, http]
+        self.smtp_port = smtp.server_address[1]
+        self.http_port = http.server_address[1]
+        with self._running_lock:
+            self._running[self.url] = self
+        return self
+
+    def stop(self) -> None:
+        """Stop the listeners.
+
+        :return: None
+
+        """
+        with self._running_lock:
+            self._running.pop(self.url, None)
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+
+    def receive(self, data: bytes, recipients: List[str] = None) -> dict:
+        """Store a raw message for each of its recipients.
+
+        :param bytes data: the RFC 5322 message
+        :param recipients: (optional) the SMTP envelope recipients; the
+            message is filed under these mailboxes when given
+        :type recipients: list(str)
+        :return: the stored JSON package
+        :rtype: dict
+
+        """
+        package = to_package(data, recipients)
+        boxes = ({mailbox(address) for address in recipients}
+                 if recipients else
+                 {mailbox(entry['address']) for entry in package['to']})
+        with self._condition:
+            for box in boxes:
+                self._boxes.setdefault(box, []).append(package)
+            self._condition.notify_all()
+        return package
+
+    def deliver(self, message) -> dict:
+        """Store an :py:class:`email.message.EmailMessage` directly.
+
+        :param message: the message to file under its ``To`` recipients
+        :type message: :py:class:`email.message.Message`
+        :return: the stored JSON package
+        :rtype: dict
+
+        """
+        return self.receive(message.as_bytes())
+
+    def fetch(self, username: str) -> List[dict]:
+        """Return the messages in a mailbox.
+
+        :param str username: the mailbox user
+        :return: the JSON message packages, oldest first
+        :rtype: list(dict)
+
+        """
+        with self._condition:
+            return list(self._boxes.get(mailbox(username), []))
+
+    def delete(self, username: str) -> None:
+        """Delete every message in a mailbox.
+
+        :param str username: the mailbox user
+        :return: None
+
+        """
+        with self._condition:
+            self._boxes.pop(mailbox(username), None)
+
+    def wait(self, username: str, seen=frozenset(),
+             timeout: float = 60.0) -> List[dict]:
+        """Block until the mailbox holds a message not already seen.
+
+        :param str username: the mailbox user
+        :param seen: (optional) the keys of messages already received
+        :type seen: set
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :return: the JSON message packages
+        :rtype: list(dict)
+        :raises: :py:class:`~requests.exceptions.Timeout` if no new message
+            arrives in time
+
+        """
+        started = monotonic()
+        box = mailbox(username)
+
+        def arrived():
+            return any(_message_key(package) not in seen
+                       for package in self._boxes.get(box, []))
+
+        with self._condition:
+            if not self._condition.wait_for(arrived, timeout):
+                raise Timeout('Mail not received in {time} seconds'
+                              .format(time=round(timeout, 2)))
+            packages = list(self._boxes[box])
+        self.deliveries.append(MailDelivery(
+            address=username, waited=monotonic() - started, polls=0,
+            messages=len(packages)))
+        return packages
+
+    def watch(self, username: str, seen=frozenset(), timeout: float = 60.0,
+              poll: float = None) -> Future:
+        """Wait in the background for a message not already seen.
+
+        :param str username: the mailbox user
+        :param seen: (optional) the keys of messages already received
+        :type seen: set
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param float poll: (optional) ignored; waiters are woken on arrival
+        :return: a future resolving to the raw mailbox messages or raising
+            :py:class:`~requests.exceptions.Timeout`
+        :rtype: :py:class:`~concurrent.futures.Future`
+
+        """
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self.wait(username, frozenset(seen),
+                                            timeout))
+            except Timeout as ex:
+                future.set_exception(ex)
+
+        Thread(target=run, name='mail-sink-waiter', daemon=True).start()
+        return future
+
+    def stats(self) -> Dict[str, float]:
+        """Return the time-to-delivery summary.
+
+        :return: the number of deliveries and the mean and longest waits
+        :rtype: dict
+
+        """
+        waits = [delivery.waited for delivery in self.deliveries]
+        return {
+            'count': len(waits),
+            'mean': sum(waits) / len(waits) if waits else 0.0,
+            'max': max(waits, default=0.0),
+        }
+
+
+def main():
+    """Run a mail sink until interrupted."""
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--host', default=MailSink.HOST)
+    parser.add_argument('--smtp-port', type=int, default=2525)
+    parser.add_argument('--http-port', type=int, default=8025)
+    args = parser.parse_args()
+    sink = MailSink(args.host, args.smtp_port, args.http_port).start()
+    print(f'SMTP on {sink.host}:{sink.smtp_port}; '
+          f'set RESTMAIL_URL={sink.url}')
+    try:
+        Event().wait()
+    except KeyboardInterrupt:
+        sink.stop()
+
+
+if __name__ == '__main__':
+    main()
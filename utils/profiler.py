@@ -0,0 +1,344 @@
+"""Profile the WebDriver commands and sleeps issued by the page objects.
+
+While installed, every WebDriver command and every ``sleep`` is timed and
+charged to the page object method that issued it: the innermost frame from
+the ``pages`` or ``regions`` packages on the call stack. Counts and wall time
+are kept per page object method and command for each test and for the whole
+session, along with the full page object call stack so the time can be drawn
+as a flame graph. Reports are JSON files and folded-stack files accepted by
+``flamegraph.pl`` and speedscope.
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+# the packages holding the page objects calls are charged to
+PACKAGES = ('pages', 'regions')
+# the modules whose imported ``sleep`` is timed
+SLEEP_MODULES = PACKAGES + ('utils',)
+
+SLEEP = 'sleep'
+UNOWNED = '(test)'
+
+
+class Profile(object):
+    """Command counts and wall time for a test or a session."""
+
+    def __init__(self) -> None:
+        """Start an empty profile.
+
+        :return: None
+
+        """
+        self.calls: Dict[Tuple[str, str], List[float]] = {}
+        self.stacks: Dict[str, float] = {}
+
+    def add(self, stack: Tuple[str, ...], command: str,
+            seconds: float) -> None:
+        """Record one command.
+
+        :param tuple stack: the test and page object frames, outermost
+            first
+        :param str command: the WebDriver command or ``sleep``
+        :param float seconds: the command wall time
+        :return: None
+
+        """
+        owner = stack[-1] if len(stack) > 1 else UNOWNED
+        entry = self.calls.setdefault((owner, command), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        folded = ';'.join(_frame(frame) for frame in stack + (command,))
+        self.stacks[folded] = self.stacks.get(folded, 0.0) + seconds
+
+    def merge(self, other: Dict) -> None:
+        """Add a profile sent as :py:meth:`to_dict` output.
+
+        :param dict other: the profile values to add
+        :return: None
+
+        """
+        for owner, command, count, seconds in other.get('calls', []):
+            entry = self.calls.setdefault((owner, command), [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+        for stack, seconds in other.get('stacks', {}).items():
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + seconds
+
+    def to_dict(self) -> Dict:
+        """Return the raw profile values.
+
+        :return: the calls and stacks in a JSON serializable form
+        :rtype: dict
+
+        """
+        return {'calls': [[owner, command, count, seconds]
+                          for (owner, command), (count, seconds)
+                          in self.calls.items()],
+                'stacks': dict(self.stacks)}
+
+    def report(self) -> Dict:
+        """Return the profile summary, slowest first.
+
+        :return: the totals, the time per page object method and the time
+            per method and command
+        :rtype: dict
+
+        """
+        methods: Dict[str, List[float]] = {}
+        commands: Dict[str, List[float]] = {}
+        for (owner, command), (count, seconds) in self.calls.items():
+            for key, table in ((owner, methods), (command, commands)):
+                entry = table.setdefault(key, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+
+        def rows(table, name):
+            return [{name: key, 'count': count, 'seconds': round(seconds, 6)}
+                    for key, (count, seconds)
+                    in sorted(table.items(), key=lambda item: -item[1][1])]
+
+        return {
+            'count': sum(count for count, _ in self.calls.values()),
+            'seconds': round(sum(seconds
+                                 for _, seconds in self.calls.values()), 6),
+            'commands': rows(commands, 'command'),
+            'methods': rows(methods, 'method'),
+            'calls': [{'method': owner, 'command': command, 'count': count,
+                       'seconds': round(seconds, 6)}
+                      for (owner, command), (count, seconds)
+                      in sorted(self.calls.items(),
+                                key=lambda item: -item[1][1])], }
+
+    def folded(self) -> str:
+        """Return the stacks in the folded flame graph format.
+
+        :return: one ``frame;frame;command microseconds`` line per stack
+        :rtype: str
+
+        """
+        return ''.join(f'{stack} {round(seconds * 1e6)}\n'
+                       for stack, seconds in sorted(self.stacks.items()))
+
+    def write(self, path: str) -> None:
+        """Write the JSON report and the folded stacks.
+
+        :param str path: the report path without an extension
+        :return: None
+
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(f'{path}.json', 'w') as report:
+            json.dump(self.report(), report, indent=2)
+        with open(f'{path}.folded', 'w') as folded:
+            folded.write(self.folded())
+
+
+class WebDriverProfiler(object):
+    """Time the WebDriver commands and sleeps of the running test."""
+
+    # the most frames searched for page object callers
+    MAX_DEPTH = 60
+
+    active: Optional[WebDriverProfiler] = None
+
+    def __init__(self, root: str = ROOT) -> None:
+        """Set the directory the page object packages are found in.
+
+        :param str root: (optional) the repository root
+        :return: None
+
+        """
+        self.prefixes = tuple(os.path.join(root, package) + os.sep
+                              for package in PACKAGES)
+        self.session = Profile()
+        self.test: Optional[str] = None
+        self.current: Optional[Profile] = None
+        self._execute = None
+        self._sleep = None
+        self._profiled_sleep = None
+        self._patched: List[str] = []
+        self._previous: Optional[WebDriverProfiler] = None
+
+    def install(self) -> WebDriverProfiler:
+        """Wrap the WebDriver command method and the sleep functions.
+
+        :return: the installed profiler
+        :rtype: :py:class:`WebDriverProfiler`
+
+        """
+        if self._execute is not None:
+            return self
+        profiler = self
+        execute = self._execute = WebDriver.execute
+        sleep = self._sleep = time.sleep
+
+        def profiled_execute(driver, driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver, driver_command, params)
+            finally:
+                profiler.record(driver_command, time.perf_counter() - start)
+
+        def profiled_sleep(seconds):
+            start = time.perf_counter()
+            try:
+                sleep(seconds)
+            finally:
+                profiler.record(SLEEP, time.perf_counter() - start)
+
+        self._profiled_sleep = profiled_sleep
+        WebDriver.execute = profiled_execute
+        time.sleep = profiled_sleep
+        self.patch_modules()
+        self._previous = WebDriverProfiler.active
+        WebDriverProfiler.active = self
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the WebDriver command method and the sleep functions.
+
+        :return: None
+
+        """
+        if self._execute is None:
+            return
+        WebDriver.execute = self._execute
+        time.sleep = self._sleep
+        for name in self._patched:
+            module = sys.modules.get(name)
+            if module is not None:
+                module.sleep = self._sleep
+        self._patched = []
+        self._execute = None
+        self._sleep = None
+        self._profiled_sleep = None
+        if WebDriverProfiler.active is self:
+            WebDriverProfiler.active = self._previous
+        self._previous = None
+
+    def patch_modules(self) -> None:
+        """Time the ``sleep`` imported by the page object and utility modules.
+
+        Modules imported after the profiler was installed are patched the
+        next time this runs.
+
+        :return: None
+
+        """
+        for name, module in list(sys.modules.items()):
+            if (name.split('.')[0] in SLEEP_MODULES and
+                    getattr(module, 'sleep', None) is self._sleep):
+                module.sleep = self._profiled_sleep
+                self._patched.append(name)
+
+    def start(self, nodeid: str) -> None:
+        """Start charging commands to a test.
+
+        :param str nodeid: the test node ID
+        :return: None
+
+        """
+        self.patch_modules()
+        self.test = nodeid
+        self.current = Profile()
+
+    def finish(self) -> Optional[Profile]:
+        """Stop charging commands to the current test.
+
+        :return: the test's profile
+        :rtype: :py:class:`Profile`
+
+        """
+        profile = self.current
+        self.test = None
+        self.current = None
+        return profile
+
+    def record(self, command: str, seconds: float) -> None:
+        """Charge a command to the current test and its page object caller.
+
+        Commands outside a test or from another thread are not recorded.
+
+        :param str command: the WebDriver command or ``sleep``
+        :param float seconds: the command wall time
+        :return: None
+
+        """
+        if self.current is None or \
+                threading.current_thread() is not threading.main_thread():
+            return
+        stack = (self.test,) + self.callers(sys._getframe(2))
+        self.current.add(stack, command, seconds)
+        self.session.add(stack, command, seconds)
+
+    def callers(self, frame) -> Tuple[str, ...]:
+        """Return the page object methods on the call stack.
+
+        :param frame: the innermost frame to search from
+        :return: the page object methods, outermost first
+        :rtype: tuple(str)
+
+        """
+        methods = []
+        depth = 0
+        while frame is not None and depth < self.MAX_DEPTH:
+            if frame.f_code.co_filename.startswith(self.prefixes):
+                method = _method(frame)
+                if not methods or methods[-1] != method:
+                    methods.append(method)
+            frame = frame.f_back
+            depth += 1
+        return tuple(reversed(methods))
+
+
+def _method(frame) -> str:
+    """Return the qualified page object method name for a frame.
+
+    ``co_qualname`` is only available from Python 3.11, so the class is taken
+    from the ``self`` or ``cls`` argument: the class in its MRO defining the
+    running code or, failing that, the argument's own class.
+
+    """
+    code = frame.f_code
+    module = frame.f_globals.get('__name__', '')
+    if not code.co_argcount or code.co_varnames[0] not in ('self', 'cls'):
+        return f'{module}.{code.co_name}'
+    owner = frame.f_locals.get(code.co_varnames[0])
+    owner = owner if isinstance(owner, type) else type(owner)
+    for cls in owner.__mro__:
+        function = cls.__dict__.get(code.co_name)
+        function = getattr(function, 'fget', function)
+        function = getattr(function, '__func__', function)
+        if getattr(function, '__code__', None) is code:
+            return f'{cls.__module__}.{cls.__qualname__}.{code.co_name}'
+    return f'{module}.{owner.__qualname__}.{code.co_name}'
+
+
+def _frame(name: str) -> str:
+    """Return a frame name safe for the folded stack format."""
+    return re.sub(r'[;\s]', '_', name)
+
+
+def report_path(directory: str, nodeid: str) -> str:
+    """Return the report path for a test.
+
+    :param str directory: the report directory
+    :param str nodeid: the test node ID
+    :return: the report path without an extension
+    :rtype: str
+
+    """
+    return os.path.join(directory, 'tests',
+                        re.sub(r'[^\w.-]+', '_', nodeid).strip('_'))
@@ -0,0 +1,281 @@
+"""A cache of logged in browser sessions shared by every test worker.
+
+Logging in through the Accounts pages costs several page loads. When the
+cache is active (``--cache-logins``) the first UI log in for a user and site
+stores the session cookies and local storage; later log ins for the same
+user, password and site inject them into the browser instead. A stored
+session expires after its time to live, and a session the site rejects is
+discarded and replaced by a fresh UI log in. Snapshots are JSON files
+guarded by a file lock so parallel workers share them safely.
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from hashlib import sha256
+from time import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from filelock import FileLock
+from pypom import Page
+from selenium.common.exceptions import (TimeoutException,  # NOQA
+                                        WebDriverException)  # NOQA
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# return a copy of the local storage for the current origin
+GET_STORAGE = 'return Object.assign({}, window.localStorage);'
+# add values to the local storage for the current origin
+SET_STORAGE = '''
+var values = arguments[0];
+for (var key in values) { window.localStorage.setItem(key, values[key]); }
+'''
+
+# the Chrome DevTools cookie fields accepted by Network.setCookies
+CDP_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly',
+                     'sameSite', 'expires')
+
+
+class SessionSnapshot(NamedTuple):
+    """The cookies and local storage of a logged in browser."""
+
+    url: str
+    created: float
+    cookies: List[dict]
+    devtools: bool
+    storage: Dict[str, str]
+
+
+class SessionCache(object):
+    """Store and restore logged in sessions."""
+
+    TTL = 1800.0
+    LOCK_TIMEOUT = 300.0
+
+    active: Optional[SessionCache] = None
+
+    def __init__(self, directory: str, ttl: float = None) -> None:
+        """Set the snapshot directory and lifetime.
+
+        :param str directory: the directory shared by the test workers
+        :param float ttl: (optional) the number of seconds a stored session
+            is reused
+        :return: None
+
+        """
+        self.directory = str(directory)
+        self.ttl = self.TTL if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.busy = False
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def resume_or_log_in(cls, driver: WebDriver, user: str, password: str,
+                         base_url: str, log_in: Callable[[], Page],
+                         resume: Callable[[], Page]) -> Page:
+        """Log in through the active cache, or the UI if it is not active.
+
+        :param driver: the browser to log in
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param str user: the username
+        :param str password: the user's password
+        :param str base_url: the base URL of the site being logged into
+        :param log_in: a callable logging in through the UI
+        :param resume: a callable opening the logged in destination page
+        :return: the destination page
+        :rtype: :py:class:`~pypom.Page`
+
+        """
+        cache = cls.active
+        if cache is None or cache.busy or not base_url:
+            return log_in()
+        return cache.log_in(driver, user, password, base_url, log_in, resume)
+
+    def log_in(self, driver: WebDriver, user: str, password: str,
+               base_url: str, log_in: Callable[[], Page],
+               resume: Callable[[], Page]) -> Page:
+        """Restore a stored session or log in and store the new session.
+
+        :param driver: the browser to log in
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param str user: the username
+        :param str password: the user's password
+        :param str base_url: the base URL of the site being logged into
+        :param log_in: a callable logging in through the UI
+        :param resume: a callable opening the logged in destination page
+        :return: the destination page
+        :rtype: :py:class:`~pypom.Page`
+
+        """
+        key = self._key(user, password, base_url)
+        self.busy = True
+        try:
+            with FileLock(self._path(key, '.lock'),
+                          timeout=self.LOCK_TIMEOUT):
+                snapshot = self.load(key)
+                if snapshot:
+                    self.restore(driver, snapshot)
+                    try:
+                        page = resume()
+                    except TimeoutException:
+                        page = None
+                    if page and not self.is_rejected(driver):
+                        self.hits += 1
+                        return page
+                    self.rejected += 1
+                    self.invalidate(key)
+                    driver.delete_all_cookies()
+                page = log_in()
+                self.save(key, self.capture(driver))
+                self.misses += 1
+                return page
+        finally:
+            self.busy = False
+
+    def load(self, key: str) -> Optional[SessionSnapshot]:
+        """Return a stored session that has not expired.
+
+        :param str key: the session key
+        :return: the stored session or ``None``
+        :rtype: :py:class:`SessionSnapshot`
+
+        """
+        try:
+            with open(self._path(key, '.json')) as snapshot_file:
+                snapshot = SessionSnapshot(**json.load(snapshot_file))
+        except (OSError, ValueError, TypeError):
+            return None
+        if time() - snapshot.created > self.ttl:
+            return None
+        return snapshot
+
+    def save(self, key: str, snapshot: SessionSnapshot) -> None:
+        """Store a session.
+
+        :param str key: the session key
+        :param snapshot: the session to store
+        :type snapshot: :py:class:`SessionSnapshot`
+        :return: None
+
+        """
+        path = self._path(key, '.json')
+        temporary = f'{path}.{os.getpid()}'
+        with open(temporary, 'w') as snapshot_file:
+            json.dump(snapshot._asdict(), snapshot_file)
+        os.replace(temporary, path)
+
+    def invalidate(self, key: str) -> None:
+        """Delete a stored session.
+
+        :param str key: the session key
+        :return: None
+
+        """
+        try:
+            os.remove(self._path(key, '.json'))
+        except OSError:
+            pass
+
+    @staticmethod
+    def capture(driver: WebDriver) -> SessionSnapshot:
+        """Read the session from a logged in browser.
+
+        Chrome returns the cookies for every domain through the DevTools
+        protocol; other browsers only return the current domain's cookies.
+
+        :param driver: the logged in browser
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :return: the session cookies and local storage
+        :rtype: :py:class:`SessionSnapshot`
+
+        """
+        devtools = False
+        cookies = None
+        if hasattr(driver, 'execute_cdp_cmd'):
+            try:
+                cookies = (driver.execute_cdp_cmd('Network.getAllCookies', {})
+                           .get('cookies'))
+                devtools = True
+            except WebDriverException:
+                pass
+        if cookies is None:
+            cookies = driver.get_cookies()
+        return SessionSnapshot(
+            url=driver.current_url,
+            created=time(),
+            cookies=cookies,
+            devtools=devtools,
+            storage=driver.execute_script(GET_STORAGE) or {})
+
+    @staticmethod
+    def restore(driver: WebDriver, snapshot: SessionSnapshot) -> None:
+        """Inject a stored session into a browser.
+
+        :param driver: the browser to log in
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :param snapshot: the stored session
+        :type snapshot: :py:class:`SessionSnapshot`
+        :return: None
+
+        """
+        if snapshot.devtools:
+            cookies = [{field: cookie[field] for field in CDP_COOKIE_FIELDS
+                        if field in cookie}
+                       for cookie in snapshot.cookies]
+            for cookie in cookies:
+                if cookie.get('expires', 0) < 0:
+                    cookie.pop('expires')
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+        if not snapshot.devtools or snapshot.storage:
+            # cookies and local storage may only be set for the current site
+            url = urlsplit(snapshot.url)
+            driver.get(f'{url.scheme}://{url.netloc}/')
+            for cookie in snapshot.cookies if not snapshot.devtools else ():
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    # the cookie belongs to another domain
+                    pass
+            driver.execute_script(SET_STORAGE, snapshot.storage)
+        driver.get(snapshot.url)
+
+    @staticmethod
+    def is_rejected(driver: WebDriver) -> bool:
+        """Return True if the site sent the browser back to a log in page.
+
+        :param driver: the browser using a restored session
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :return: ``True`` if the restored session was not accepted
+        :rtype: bool
+
+        """
+        return '/login' in urlsplit(driver.current_url).path
+
+    def summary(self) -> Dict[str, int]:
+        """Return the cache hit, miss and rejection counts.
+
+        :return: the cache usage counts
+        :rtype: dict
+
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'rejected': self.rejected}
+
+    def _key(self, user, password, base_url):
+        """Return the snapshot key for a user, password and site."""
+        site = urlsplit(base_url).netloc or base_url
+        return sha256(f'{user}\n{password}\n{site}'.encode('utf-8')) \
+            .hexdigest()[:32]
+
+    def _path(self, key, extension):
+        """Return a snapshot file path."""
+        return os.path.join(self.directory, f'{key}{extension}')
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Tuple, Union
+from typing import Dict, NamedTuple, Tuple, Union
 
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
@@ -284,6 +284,79 @@ class TutorException(WebDriverException):
     pass
 
 
+class AssignmentTimes(NamedTuple):
+    """The open and due dates and times for an assignment section.
+
+    The values are the ``MM/DD/YYYY`` dates and ``hh:mm:xm`` times used by
+    the keystroke field setter; :py:meth:`inputs` converts them to the values
+    an input element renders.
+
+    """
+
+    open_on: str
+    open_at: str
+    due_on: str
+    due_at: str
+
+    # the order the assignment form fields are set
+    FIELDS = ('due_date', 'due_time', 'open_date', 'open_time')
+
+    def field(self, name: str) -> str:
+        """Return the keystroke value for a form field.
+
+        :param str name: the form field (``open_date``, ``open_time``,
+            ``due_date`` or ``due_time``)
+        :return: the date or time value; times may be empty
+        :rtype: str
+
+        """
+        return {'open_date': self.open_on, 'open_time': self.open_at,
+                'due_date': self.due_on, 'due_time': self.due_at}[name]
+
+    def inputs(self) -> Dict[str, Tuple[str, str]]:
+        """Return the rendered input values for each set field.
+
+        Time inputs use a 24-hour value in browsers supporting native time
+        inputs and a 12-hour value in text inputs (Safari).
+
+        :return: the field names mapped to the native and the text input
+            values; fields without a value are left out
+        :rtype: dict(str, tuple(str, str))
+
+        """
+        values = {}
+        for name in self.FIELDS:
+            value = self.field(name)
+            if not value:
+                continue
+            if 'time' in name:
+                time = datetime.strptime(value, '%I:%M:%p')
+                values[name] = (time.strftime('%H:%M'),
+                                time.strftime('%I:%M %p'))
+            else:
+                values[name] = (value, value)
+        return values
+
+    @staticmethod
+    def rendered(name: str, value: str) -> Union[datetime, None]:
+        """Parse the value shown by a date or time input.
+
+        :param str name: the form field
+        :param str value: the input's current value
+        :return: the parsed date or time or ``None`` if it can't be read
+        :rtype: :py:class:`~datetime.datetime` or None
+
+        """
+        formats = (('%H:%M', '%I:%M %p', '%I:%M:%p') if 'time' in name
+                   else ('%m/%d/%Y',))
+        for form in formats:
+            try:
+                return datetime.strptime(value or '', form)
+            except ValueError:
+                continue
+        return None
+
+
 def to_date_time_string(to_format: Union[str, DateFormat]) -> Tuple[str, str]:
     """Split the date and time.
 
@@ -322,7 +395,7 @@ def to_date_time_string(to_format: Union[str, DateFormat]) -> Tuple[str, str]:
 
 def get_date_times(driver: Webdriver,
                    option: Union[str, DateFormat, FullDateTime]) \
-        -> Tuple[str]:
+        -> AssignmentTimes:
     """Return Tutor-ready date and time strings.
 
     Take various formats of dates and times for assignment open/due
@@ -335,9 +408,9 @@ def get_date_times(driver: Webdriver,
         tuple(tuple(str, str), tuple(str, str)) or
         datetime or
         tuple(datetime, datetime)
-    :return: the list of values (open date, open time, due date, due time); if
-        a time is not needed the time field will be an empty string
-    :rtype: tuple(str)
+    :return: the values (open date, open time, due date, due time); if a
+        time is not needed the time field will be an empty string
+    :rtype: :py:class:`~utils.tutor.AssignmentTimes`
 
     """
     # Handle a random date in the future or today
@@ -368,4 +441,4 @@ def get_date_times(driver: Webdriver,
     open_on, open_at = to_date_time_string(open_on)
     due_on, due_at = to_date_time_string(due_on)
 
-    return (open_on, open_at, due_on, due_at)
+    return AssignmentTimes(open_on, open_at, due_on, due_at)
@@ -0,0 +1,726 @@
+"""Create Tutor courses, periods, enrollments and assignments over HTTP.
+
+Building a scenario through the course wizard, the roster and the assignment
+pages costs minutes of browser time before a test asserts anything. The
+:py:class:`TutorFactory` creates the same records through the Tutor API with
+an authenticated session and keeps each seeded course for its Tutor
+instance, so the tests sharing a seed only pay for it once.
+
+Requests go through a transport. :py:class:`HTTPTransport` wraps a requests
+session, usually copied from a logged in browser, and :py:class:`FakeTutor`
+is a local server answering the same routes so the factory can be exercised
+without a Tutor deployment. Run a stand-alone fake with
+``python -m utils.tutorapi``.
+
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from utils.tutor import Tutor, TutorException
+
+# return the Rails CSRF token for the current page
+CSRF_TOKEN = ('var meta = document.querySelector("meta[name=csrf-token]");'
+              'return meta ? meta.getAttribute("content") : null;')
+
+
+class Period(NamedTuple):
+    """A course section."""
+
+    id: str
+    course_id: str
+    name: str
+    enrollment_code: str
+
+    @classmethod
+    def from_json(cls, course_id: str, data: Dict) -> Period:
+        """Return a period from its API representation."""
+        return cls(id=str(data.get('id')), course_id=str(course_id),
+                   name=data.get('name', ''),
+                   enrollment_code=data.get('enrollment_code', ''))
+
+
+class Plan(NamedTuple):
+    """An assignment plan and the periods it is assigned to."""
+
+    id: str
+    course_id: str
+    title: str
+    type: str
+    is_published: bool
+    opens_at: str
+    due_at: str
+    period_ids: Tuple[str, ...]
+
+    @classmethod
+    def from_json(cls, course_id: str, data: Dict) -> Plan:
+        """Return a plan from its API representation."""
+        taskings = data.get('tasking_plans') or [{}]
+        return cls(id=str(data.get('id')), course_id=str(course_id),
+                   title=data.get('title', ''),
+                   type=data.get('type', ''),
+                   is_published=bool(data.get('is_published') or
+                                     data.get('is_publish_requested')),
+                   opens_at=taskings[0].get('opens_at', ''),
+                   due_at=taskings[0].get('due_at', ''),
+                   period_ids=tuple(str(tasking.get('target_id'))
+                                    for tasking in taskings
+                                    if tasking.get('target_id')))
+
+
+class Course(NamedTuple):
+    """A Tutor course with its periods and published plans."""
+
+    id: str
+    name: str
+    offering_id: str
+    term: str
+    year: int
+    periods: Tuple[Period, ...] = ()
+    plans: Tuple[Plan, ...] = ()
+
+    @classmethod
+    def from_json(cls, data: Dict, plans: List[Dict] = ()) -> Course:
+        """Return a course from its API representation."""
+        course_id = str(data.get('id'))
+        return cls(id=course_id, name=data.get('name', ''),
+                   offering_id=str(data.get('offering_id', '')),
+                   term=data.get('term', ''),
+                   year=int(data.get('year') or 0),
+                   periods=tuple(Period.from_json(course_id, period)
+                                 for period in data.get('periods', [])),
+                   plans=tuple(Plan.from_json(course_id, plan)
+                               for plan in plans))
+
+    @property
+    def path(self) -> str:
+        """Return the course route below the Tutor base URL.
+
+        :return: the course calendar or dashboard route
+        :rtype: str
+
+        """
+        return f'/course/{self.id}'
+
+    def plan(self, title: str) -> Plan:
+        """Return a plan by its title.
+
+        :param str title: the assignment title
+        :return: the plan
+        :rtype: :py:class:`~utils.tutorapi.Plan`
+
+        :raises :py:class:`~utils.tutor.TutorException`: if no plan matches
+            ``title``
+
+        """
+        for plan in self.plans:
+            if plan.title == title:
+                return plan
+        raise TutorException(f'No plan found matching "{title}"')
+
+
+class Enrollment(NamedTuple):
+    """A student's approved enrollment in a period."""
+
+    id: str
+    period_id: str
+    student_identifier: str
+    status: str
+
+
+class Transport(object):
+    """Send JSON requests to a Tutor server."""
+
+    def request(self, method: str, path: str, payload: Dict = None) -> Any:
+        """Send a request and return the decoded response.
+
+        :param str method: the HTTP method
+        :param str path: the API route below the Tutor base URL
+        :param dict payload: (optional) the JSON request body
+        :return: the decoded JSON response or ``None`` for an empty body
+        :rtype: Any
+
+        :raises :py:class:`~utils.tutor.TutorException`: if the server
+            rejects the request
+
+        """
+        raise NotImplementedError
+
+
+class HTTPTransport(Transport):
+    """Send the requests with a requests session."""
+
+    TIMEOUT = 30.0
+
+    def __init__(self, base_url: str, session: requests.Session = None,
+                 csrf_token: str = None, timeout: float = None) -> None:
+        """Set the server and the session used for each request.
+
+        :param str base_url: the Tutor base URL
+        :param session: (optional) an authenticated session
+        :param str csrf_token: (optional) the Rails CSRF token sent with
+            each request
+        :param float timeout: (optional) the seconds to wait for a response
+        :type session: :py:class:`~requests.Session`
+        :return: None
+
+        """
+        self.base_url = base_url.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        if csrf_token:
+            self.session.headers['X-CSRF-Token'] = csrf_token
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+
+    @classmethod
+    def from_driver(cls, driver, base_url: str) -> HTTPTransport:
+        """Return a transport sharing a logged in browser's session.
+
+        :param driver: a browser logged into Tutor
+        :param str base_url: the Tutor base URL
+        :type driver:
+            :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+        :return: the transport
+        :rtype: :py:class:`~utils.tutorapi.HTTPTransport`
+
+        """
+        session = requests.Session()
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', ''),
+                                path=cookie.get('path', '/'))
+        session.headers['User-Agent'] = driver.execute_script(
+            'return navigator.userAgent;')
+        return cls(base_url, session, driver.execute_script(CSRF_TOKEN))
+
+    def request(self, method: str, path: str, payload: Dict = None) -> Any:
+        """Send a request and return the decoded response."""
+        response = self.session.request(
+            method, f'{self.base_url}{path}', json=payload,
+            timeout=self.timeout)
+        if response.status_code >= 400:
+            raise TutorException(
+                f'{method} {path} returned {response.status_code}: '
+                f'{response.text[:200]}')
+        return response.json() if response.content else None
+
+
+class TutorFactory(object):
+    """Create Tutor records through the API."""
+
+    COURSES = '/api/courses'
+    COURSE = '/api/courses/{course}'
+    PERIODS = '/api/courses/{course}/periods'
+    PLANS = '/api/courses/{course}/plans'
+    OFFERINGS = '/api/offerings'
+    ENROLLMENT = '/api/enrollment'
+    APPROVE = '/api/enrollment/{enrollment}/approve'
+
+    # the default assignment window, in days from now
+    OPENS_IN = 0
+    DUE_IN = 7
+    # the assignments published in the default seed; readings and homeworks
+    # need book pages and exercises from the course ecosystem
+    SEED_ASSIGNMENTS = (Tutor.EVENT, Tutor.EXTERNAL)
+    SEED_EXTERNAL_URL = 'https://openstax.org/'
+
+    # the seeded courses for each Tutor instance
+    _seeds: Dict[Tuple[str, str], Course] = {}
+    _seeds_lock = Lock()
+
+    def __init__(self, transport: Transport, instance: str = '',
+                 cache=None) -> None:
+        """Set the transport and where the seeded courses are kept.
+
+        :param transport: the request transport
+        :param str instance: (optional) the Tutor instance seeds belong to
+        :param cache: (optional) the pytest cache keeping the seeded course
+            IDs between runs
+        :type transport: :py:class:`~utils.tutorapi.Transport`
+        :type cache: :py:class:`~_pytest.cacheprovider.Cache`
+        :return: None
+
+        """
+        self.transport = transport
+        self.instance = instance
+        self.cache = cache
+        self._offerings: Optional[List[Dict]] = None
+
+    # ---------------------------------------------------- #
+    # Records
+    # ---------------------------------------------------- #
+
+    def offering(self, title: str = Tutor.BIOLOGY) -> Dict:
+        """Return the catalog offering for a book.
+
+        :param str title: (optional) the book title
+        :return: the catalog offering
+        :rtype: dict
+
+        :raises :py:class:`~utils.tutor.TutorException`: if no offering
+            matches ``title``
+
+        """
+        if self._offerings is None:
+            self._offerings = self._request('GET', self.OFFERINGS) or []
+            if isinstance(self._offerings, dict):
+                self._offerings = self._offerings.get('items', [])
+        for offering in self._offerings:
+            if title in offering.get('title', ''):
+                return offering
+        raise TutorException(f'No course offering found for "{title}"')
+
+    def create_course(self, name: str, book: str = Tutor.BIOLOGY,
+                      term: str = None, year: int = None,
+                      sections: int = 1, students: int = 10,
+                      preview: bool = False,
+                      time_zone: str = Tutor.CENTRAL_TIME) -> Course:
+        """Create a course.
+
+        :param str name: the course name
+        :param str book: (optional) the course book title
+        :param str term: (optional) the course term, defaults to the current
+            term
+        :param int year: (optional) the course year, defaults to this year
+        :param int sections: (optional) the number of periods to create
+        :param int students: (optional) the estimated number of students
+        :param bool preview: (optional) create a preview course
+        :param str time_zone: (optional) the course time zone
+        :return: the new course and its periods
+        :rtype: :py:class:`~utils.tutorapi.Course`
+
+        """
+        today = datetime.now()
+        data = self._request('POST', self.COURSES, {
+            'name': name,
+            'catalog_offering_id': self.offering(book).get('id'),
+            'term': (term or (Tutor.SPRING if today.month < 6 else
+                              Tutor.SUMMER if today.month < 8 else
+                              Tutor.FALL)).lower(),
+            'year': year or today.year,
+            'num_sections': sections,
+            'estimated_student_count': students,
+            'is_preview': preview,
+            'time_zone': time_zone, })
+        return Course.from_json(data)
+
+    def course(self, course_id: str) -> Course:
+        """Read a course with its periods and plans.
+
+        :param str course_id: the course ID
+        :return: the course
+        :rtype: :py:class:`~utils.tutorapi.Course`
+
+        """
+        data = self._request('GET', self.COURSE.format(course=course_id))
+        plans = self._request('GET', self.PLANS.format(course=course_id))
+        if isinstance(plans, dict):
+            plans = plans.get('items', [])
+        return Course.from_json(data, plans or [])
+
+    def add_period(self, course: Course, name: str) -> Period:
+        """Add a period to a course.
+
+        :param course: the course
+        :param str name: the period name
+        :type course: :py:class:`~utils.tutorapi.Course`
+        :return: the new period
+        :rtype: :py:class:`~utils.tutorapi.Period`
+
+        """
+        data = self._request('POST', self.PERIODS.format(course=course.id),
+                             {'name': name})
+        return Period.from_json(course.id, data)
+
+    def publish(self, course: Course, title: str,
+                assignment: str = Tutor.EXTERNAL,
+                periods: List[Period] = None,
+                opens_at: datetime = None, due_at: datetime = None,
+                settings: Dict = None, description: str = '') -> Plan:
+        """Publish an assignment to a course's periods.
+
+        :param course: the course
+        :param str title: the assignment title
+        :param str assignment: (optional) the assignment type
+        :param periods: (optional) the periods to assign, defaults to every
+            course period
+        :param opens_at: (optional) when the assignment opens, defaults to
+            now
+        :param due_at: (optional) when the assignment is due, defaults to
+            one week from now
+        :param dict settings: (optional) the assignment settings; readings
+            need ``page_ids`` and homeworks need ``exercise_ids``
+        :param str description: (optional) the assignment description
+        :type course: :py:class:`~utils.tutorapi.Course`
+        :type periods: list(:py:class:`~utils.tutorapi.Period`)
+        :type opens_at: :py:class:`~datetime.datetime`
+        :type due_at: :py:class:`~datetime.datetime`
+        :return: the published plan
+        :rtype: :py:class:`~utils.tutorapi.Plan`
+
+        :raises :py:class:`~utils.tutor.TutorException`: if the assignment
+            type is not a known type
+
+        """
+        if assignment not in Tutor.ASSIGNMENTS:
+            raise TutorException(
+                f'"{assignment}" is not a known assignment type.')
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        opens_at = opens_at or now + timedelta(days=self.OPENS_IN)
+        due_at = due_at or now + timedelta(days=self.DUE_IN)
+        if settings is None and assignment == Tutor.EXTERNAL:
+            settings = {'external_url': self.SEED_EXTERNAL_URL}
+        data = self._request('POST', self.PLANS.format(course=course.id), {
+            'title': title,
+            'type': assignment,
+            'description': description,
+            'is_publish_requested': True,
+            'settings': settings or {},
+            'tasking_plans': [{'target_id': period.id,
+                               'target_type': 'period',
+                               'opens_at': opens_at.isoformat(),
+                               'due_at': due_at.isoformat(), }
+                              for period in (periods or course.periods)], })
+        return Plan.from_json(course.id, data)
+
+    def enroll(self, period: Period, student: Transport,
+               student_identifier: str = '') -> Enrollment:
+        """Enroll a student in a period using the student's session.
+
+        :param period: the period to join
+        :param student: a transport authenticated as the student
+        :param str student_identifier: (optional) the school issued student
+            ID
+        :type period: :py:class:`~utils.tutorapi.Period`
+        :type student: :py:class:`~utils.tutorapi.Transport`
+        :return: the approved enrollment
+        :rtype: :py:class:`~utils.tutorapi.Enrollment`
+
+        """
+        change = student.request('POST', self.ENROLLMENT,
+                                 {'enrollment_code': period.enrollment_code})
+        approved = student.request(
+            'PUT', self.APPROVE.format(enrollment=change.get('id')),
+            {'student_identifier': student_identifier})
+        return Enrollment(id=str(change.get('id')), period_id=period.id,
+                          student_identifier=student_identifier,
+                          status=(approved or {}).get('status', 'approved'))
+
+    # ---------------------------------------------------- #
+    # Seeded courses
+    # ---------------------------------------------------- #
+
+    def seed(self, name: str = 'default',
+             build: Callable[[TutorFactory, str], Course] = None) -> Course:
+        """Return a seeded course, creating it the first time it is needed.
+
+        Seeds are kept for each Tutor instance for the rest of the session
+        and, with a cache, their course IDs are reused by later runs as long
+        as the course can still be read.
+
+        :param str name: (optional) the seed name
+        :param build: (optional) a callable taking the factory and the course
+            name and returning the finished course; the default publishes
+            one of each :py:attr:`SEED_ASSIGNMENTS` type to a two period
+            course
+        :return: the seeded course
+        :rtype: :py:class:`~utils.tutorapi.Course`
+
+        """
+        key = (self.instance, name)
+        with self._seeds_lock:
+            course = self._seeds.get(key)
+            if course is None:
+                course = self._cached_seed(name)
+            if course is None:
+                course = (build or self.build_seed)(
+                    self, f'Seeded {name.title()} Course')
+                self._store_seed(name, course)
+            self._seeds[key] = course
+        return course
+
+    @staticmethod
+    def build_seed(factory: TutorFactory, name: str) -> Course:
+        """Create the default seeded course.
+
+        :param factory: the factory creating the records
+        :param str name: the course name
+        :type factory: :py:class:`~utils.tutorapi.TutorFactory`
+        :return: the finished course
+        :rtype: :py:class:`~utils.tutorapi.Course`
+
+        """
+        course = factory.create_course(name, sections=2)
+        plans = tuple(factory.publish(course, f'Seeded {assignment.title()}',
+                                      assignment)
+                      for assignment in factory.SEED_ASSIGNMENTS)
+        return course._replace(plans=plans)
+
+    @classmethod
+    def forget_seeds(cls) -> None:
+        """Discard the seeded courses kept for this session.
+
+        :return: None
+
+        """
+        with cls._seeds_lock:
+            cls._seeds.clear()
+
+    def _cached_seed(self, name: str) -> Optional[Course]:
+        """Return a seed stored by an earlier run if it still exists."""
+        if self.cache is None:
+            return None
+        course_id = self.cache.get(self._cache_key(name), None)
+        if not course_id:
+            return None
+        try:
+            return self.course(course_id)
+        except (TutorException, requests.RequestException):
+            return None
+
+    def _store_seed(self, name: str, course: Course) -> None:
+        """Keep a seed's course ID for later runs."""
+        if self.cache is not None:
+            self.cache.set(self._cache_key(name), course.id)
+
+    def _cache_key(self, name: str) -> str:
+        """Return the pytest cache key for a seed."""
+        return f'os-automation/tutor-seeds/{self.instance or "unique"}/{name}'
+
+    def _request(self, method: str, path: str, payload: Dict = None) -> Any:
+        """Send a request through the factory transport."""
+        return self.transport.request(method, path, payload)
+
+
+# ---------------------------------------------------- #
+# Local fake Tutor server
+# ---------------------------------------------------- #
+
+class _FakeTutorHandler(BaseHTTPRequestHandler):
+    """Answer the factory's API routes from memory."""
+
+    def do_GET(self):
+        """Read a record."""
+        self._dispatch('GET')
+
+    def do_POST(self):
+        """Create a record."""
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        """Update a record."""
+        self._dispatch('PUT')
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+    def _dispatch(self, method):
+        """Route a request to the fake server."""
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b'null')
+        status, body = self.server.fake.handle(
+            method, urlparse(self.path).path, payload)
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeTutor(object):
+    """A local server answering the Tutor API routes used by the factory."""
+
+    HOST = '127.0.0.1'
+    # seconds between listener shutdown checks
+    SHUTDOWN_POLL = 0.05
+
+    def __init__(self, host: str = HOST, port: int = 0) -> None:
+        """Set up an empty server; nothing listens until :py:meth:`start`.
+
+        :param str host: (optional) the interface to listen on
+        :param int port: (optional) the HTTP port; ``0`` picks a free port
+        :return: None
+
+        """
+        self.host = host
+        self.port = port
+        self.requests: List[Tuple[str, str]] = []
+        self.offerings = [{'id': str(number), 'title': title}
+                          for number, title in enumerate(Tutor.BOOKS, 1)]
+        self.courses: Dict[str, Dict] = {}
+        self.plans: Dict[str, List[Dict]] = {}
+        self.enrollments: Dict[str, Dict] = {}
+        self._ids = count(1)
+        self._lock = Lock()
+        self._server = None
+        self._routes = [
+            ('GET', r'/api/offerings', self._offerings),
+            ('POST', r'/api/courses', self._create_course),
+            ('GET', r'/api/courses/(\w+)', self._course),
+            ('POST', r'/api/courses/(\w+)/periods', self._create_period),
+            ('GET', r'/api/courses/(\w+)/plans', self._plans),
+            ('POST', r'/api/courses/(\w+)/plans', self._create_plan),
+            ('POST', r'/api/enrollment', self._create_enrollment),
+            ('PUT', r'/api/enrollment/(\w+)/approve', self._approve), ]
+
+    def __enter__(self):
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc):
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the server's base URL.
+
+        :return: the base URL to give an :py:class:`HTTPTransport`
+        :rtype: str
+
+        """
+        return f'http://{self.host}:{self.port}'
+
+    def start(self) -> FakeTutor:
+        """Start the HTTP listener.
+
+        :return: the running server
+        :rtype: :py:class:`~utils.tutorapi.FakeTutor`
+
+        """
+        server = ThreadingHTTPServer((self.host, self.port), _FakeTutorHandler)
+        server.daemon_threads = True
+        server.fake = self
+        Thread(target=server.serve_forever, args=(self.SHUTDOWN_POLL,),
+               name='fake-tutor', daemon=True).start()
+        self._server = server
+        self.port = server.server_address[1]
+        return self
+
+    def stop(self) -> None:
+        """Stop the HTTP listener.
+
+        :return: None
+
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, method: str, path: str,
+               payload: Any) -> Tuple[int, Any]:
+        """Answer one API request.
+
+        :param str method: the HTTP method
+        :param str path: the request path
+        :param payload: the decoded JSON body
+        :return: the response status and JSON body
+        :rtype: tuple(int, Any)
+
+        """
+        with self._lock:
+            self.requests.append((method, path))
+            for verb, pattern, route in self._routes:
+                match = re.fullmatch(pattern, path.rstrip('/'))
+                if verb == method and match:
+                    try:
+                        return route(payload or {}, *match.groups())
+                    except KeyError as error:
+                        return 404, {'errors': [{'code': 'not_found',
+                                                 'data': str(error)}]}
+        return 404, {'errors': [{'code': 'no_route', 'data': path}]}
+
+    def _next_id(self):
+        """Return a new record ID."""
+        return str(next(self._ids))
+
+    def _offerings(self, payload):
+        return 200, {'items': self.offerings}
+
+    def _create_course(self, payload):
+        course_id = self._next_id()
+        course = {'id': course_id,
+                  'name': payload.get('name', ''),
+                  'offering_id': payload.get('catalog_offering_id'),
+                  'term': payload.get('term', ''),
+                  'year': payload.get('year', 0),
+                  'is_preview': payload.get('is_preview', False),
+                  'periods': []}
+        self.courses[course_id] = course
+        self.plans[course_id] = []
+        for number in range(int(payload.get('num_sections') or 0)):
+            self._create_period({'name': f'Period {number + 1}'}, course_id)
+        return 201, course
+
+    def _course(self, payload, course_id):
+        return 200, self.courses[course_id]
+
+    def _create_period(self, payload, course_id):
+        period_id = self._next_id()
+        period = {'id': period_id, 'name': payload.get('name', ''),
+                  'enrollment_code': f'code-{period_id}'}
+        self.courses[course_id]['periods'].append(period)
+        return 201, period
+
+    def _plans(self, payload, course_id):
+        return 200, {'items': self.plans[course_id]}
+
+    def _create_plan(self, payload, course_id):
+        periods = {period['id']
+                   for period in self.courses[course_id]['periods']}
+        for tasking in payload.get('tasking_plans', []):
+            if tasking.get('target_id') not in periods:
+                return 422, {'errors': [{'code': 'invalid_period'}]}
+        plan = dict(payload, id=self._next_id(),
+                    is_published=bool(payload.get('is_publish_requested')))
+        self.plans[course_id].append(plan)
+        return 201, plan
+
+    def _create_enrollment(self, payload):
+        code = payload.get('enrollment_code')
+        for course in self.courses.values():
+            for period in course['periods']:
+                if period['enrollment_code'] == code:
+                    change_id = self._next_id()
+                    self.enrollments[change_id] = {
+                        'id': change_id, 'period_id': period['id'],
+                        'status': 'pending'}
+                    return 201, self.enrollments[change_id]
+        return 422, {'errors': [{'code': 'invalid_enrollment_code'}]}
+
+    def _approve(self, payload, change_id):
+        change = self.enrollments[change_id]
+        change.update(status='approved',
+                      student_identifier=payload.get('student_identifier'))
+        return 200, change
+
+
+def main():
+    """Run a fake Tutor API server until interrupted."""
+    import argparse
+    parser = argparse.ArgumentParser(description='A fake Tutor API server.')
+    parser.add_argument('--host', default=FakeTutor.HOST)
+    parser.add_argument('--port', type=int, default=8030)
+    args = parser.parse_args()
+    fake = FakeTutor(args.host, args.port).start()
+    print(f'Tutor API on {fake.url}')
+    try:
+        Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,15 @@
 """Helper functions for OpenStax Pages."""
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from http.client import responses
 from platform import system
 from random import randint, sample
 from time import sleep
-from typing import Tuple, Union
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple, Union)
 from warnings import warn
 
-import requests
 from faker import Faker
 from pypom import Page, Region
 from selenium.common.exceptions import (  # NOQA
@@ -20,11 +21,15 @@ from selenium.common.exceptions import (  # NOQA
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as expect
 from selenium.webdriver.support.color import Color
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import Select
 from simple_salesforce import Salesforce as SF
 
+from utils.cards import Card, CardCatalog, Status, cvv  # NOQA
+from utils.geometry import Geometry
+from utils.links import LinkChecker, LinkResult
+from utils.wait import Wait
+
 JAVASCRIPT_CLICK = 'arguments[0].click()'
 OPEN_TAB = 'window.open();'
 SCROLL_INTO_VIEW = 'arguments[0].scrollIntoView();'
@@ -107,7 +112,9 @@ class Utility:
         """Standardize element clicks to avoid cross-browser issues."""
         element = element if element else driver.find_element(*locator)
         cls.scroll_to(driver=driver, element=element, shift=-80)
-        sleep(0.5)
+        # let any smooth scrolling finish; never longer than the old pause
+        Wait.for_stable(driver, locator=locator, element=element,
+                        timeout=0.5, required=False)
         try:
             if force_js_click or \
                     driver.capabilities.get('browserName').lower() == 'safari':
@@ -200,14 +207,16 @@ class Utility:
         :param status: a credit card status
         :returns: a tuple of the credit card number and the CVV number
         """
-        braintree = Card()
         _card = card if card else Status.VISA
         _status = status if status else Status.VALID
-        test_cards = braintree.get_by(Status.STATUS, _status)
-        test_cards = braintree.get_by(Status.TYPE, _card, test_cards)
-        select = randint(0, len(test_cards) - 1)
-        use_card = test_cards[select]
-        return (use_card['number'], use_card['cvv'])
+        # the declined and failed states are verification responses
+        field = (Status.STATUS if isinstance(_status, int)
+                 else Status.RESPONSE)
+        use_card = CardCatalog.shared().random(
+            **{field: _status, Status.TYPE: _card})
+        if use_card is None:
+            raise ValueError(f'No {_card} test card has a {_status} status')
+        return (use_card['number'], cvv(use_card))
 
     @classmethod
     def has_children(cls, element: WebElement) -> bool:
@@ -236,7 +245,7 @@ class Utility:
 
     @classmethod
     def in_viewport(cls, driver, locator=None, element=None,
-                    ignore_bottom=False, display_marks=True):
+                    ignore_bottom=False, display_marks=False):
         """Return True if the element boundry completely lies in view.
 
         :param driver: a selenium webdriver
@@ -248,82 +257,23 @@ class Utility:
             stdout
         :returns: True if the element box is within the browser window
         """
-        LEFT, TOP, RIGHT, BOTTOM = range(4)
         target = element if element else driver.find_element(*locator)
-        rect = driver.execute_script(
-            'return arguments[0].getBoundingClientRect();', target)
-        if display_marks:
-            print('Rectangle: {0}'.format(rect))
-        page_x_offset = driver.execute_script('return window.pageXOffset;')
-        page_y_offset = driver.execute_script('return window.pageYOffset;')
-        target_boundry = (
-            rect.get('left') + page_x_offset,
-            rect.get('top') + page_y_offset,
-            rect.get('right') + page_x_offset,
-            rect.get('bottom') + page_y_offset)
-        window_width = driver.execute_script(
-            'return document.documentElement.clientWidth;')
-        window_height = driver.execute_script(
-            'return document.documentElement.clientHeight;')
-        page_boundry = (
-            page_x_offset,
-            page_y_offset,
-            page_x_offset + window_width,
-            page_y_offset + window_height)
+        geometry = Geometry.measure(driver, [target])[0]
         if display_marks:
-            base = '{side} {result} - Element ({element}) {sign} Page ({page})'
-            bottom = (
-                'Bottom {result} - [Element ({element}) {sign} '
-                'Page ({page})] or [Skip Bottom ({skip})]')
-            print(base.format(
-                side='Left', sign='>=', page=page_boundry[LEFT],
-                result=target_boundry[LEFT] >= page_boundry[LEFT],
-                element=target_boundry[LEFT]))
-            print(base.format(
-                side='Top', sign='>=', page=page_boundry[TOP],
-                result=target_boundry[TOP] >= page_boundry[TOP],
-                element=target_boundry[TOP]))
-            print(base.format(
-                side='Right', sign='<=', page=page_boundry[RIGHT],
-                result=target_boundry[RIGHT] <= page_boundry[RIGHT],
-                element=target_boundry[RIGHT]))
-            print(bottom.format(
-                sign='<=', page=page_boundry[BOTTOM],
-                result=(
-                    target_boundry[BOTTOM] <= page_boundry[BOTTOM] or
-                    ignore_bottom),
-                element=target_boundry[BOTTOM], skip=ignore_bottom))
-        return (
-            target_boundry[LEFT] >= page_boundry[LEFT] and
-            target_boundry[TOP] >= page_boundry[TOP] and
-            target_boundry[RIGHT] <= page_boundry[RIGHT] and
-            (target_boundry[BOTTOM] <= page_boundry[BOTTOM] or
-             ignore_bottom))
+            print(geometry.describe(ignore_bottom))
+        return geometry.in_viewport(ignore_bottom)
 
     @classmethod
     def is_image_visible(cls, driver, image=None, locator=None):
-        """Return True if an image is rendered."""
+        """Return True if an image is rendered.
+
+        Images found by a locator are skipped until their height is set.
+
+        """
         if image:
-            image_group = image if isinstance(image, list) else [image]
-        else:
-            image_group = driver.find_elements(*locator)
-            auto = ('return window.getComputedStyle('
-                    'arguments[0]).height!="auto"')
-            image_group = list(filter(
-                lambda img: driver.execute_script(auto, img),
-                image_group))
-        ie = 'internet explorer'
-        from selenium.webdriver import Ie
-        if (isinstance(driver, Ie) or
-                driver.capabilities.get('browserName') == ie):
-            script = 'return arguments[0].complete'
-        else:
-            script = (
-                'return ((typeof arguments[0].naturalWidth)!="undefined")')
-        from functools import reduce
-        map_list = (list(map(
-            lambda img: driver.execute_script(script, img), image_group)))
-        return reduce(lambda img, group: img and group, map_list, True)
+            images = image if isinstance(image, list) else [image]
+            return Geometry.images_loaded(driver, images)
+        return Geometry.images_loaded(driver, [locator], skip_unsized=True)
 
     @classmethod
     def is_browser(cls, driver, browser='safari') -> bool:
@@ -587,156 +537,89 @@ class Utility:
     @classmethod
     def test_url_and_warn(cls, _head=True, code=None, url=None, link=None,
                           message='', driver=None):
-        """Query a URL and return a warning if the code is not a success."""
-        if driver:
-            browser = driver.capabilities.get('browserName', '').lower()
-        agent = {
-            'chrome': {
-                'User-Agent': (
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_6)'
-                    ' AppleWebKit/537.36 (KHTML, like Gecko)'
-                    ' Chrome/77.0.3865.90 Safari/537.36'), },
-            'firefox': {
-                'User-Agent': (
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14;'
-                    ' rv:69.0) Gecko/20100101 Firefox/69.0'), },
-            'safari': {
-                'User-Agent': (
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_6)'
-                    ' AppleWebKit/605.1.15 (KHTML, like Gecko)'
-                    ' Version/13.0.1 Safari/605.1.15'), },
-            '': {},
-        }
+        """Query a URL and return a warning if the code is not a success.
+
+        Links are checked by the shared, pooled
+        :py:class:`~utils.links.LinkChecker` so a URL is only requested
+        once per session.
+
+        """
         if link:
             url = link.get_attribute('href')
-        test = requests.head(url) if _head \
-            else requests.get(url, headers=agent.get(browser))
-        code = test.status_code
-        if code == 403 and _head:
-            _head = False
-            test = requests.get(url, headers=agent.get(browser))
-            code = test.status_code
-        if code == 503 or \
-                'Error from cloudfront' in test.headers.get('X-Cache', ''):
-            for _ in range(20):
-                sleep(3)
-                test = requests.head(url) if _head \
-                    else requests.get(url, headers=agent.get(browser))
-                code = test.status_code
-                if code != 503:
-                    break
-        if code >= 400:
-            # the test ran into a problem with the URL query
-            status = ('<{code} {reason}>'
-                      .format(code=code, reason=responses.get(code)))
+        if not url:
+            # only a response code is available
+            if code < 400:
+                return True
             warn(UserWarning(
                 '"{article}" returned a {status}'
-                .format(article=message, status=status)))
-            if 'Error from cloudfront' in test.headers.get('X-Cache', ''):
-                return True
+                .format(article=message,
+                        status='<{code} {reason}>'.format(
+                            code=code, reason=responses.get(code)))))
             return False
-        return True
-
-    @classmethod
-    def wait_for_overlay(cls, driver, locator):
-        """Wait for an overlay to clear making the target available."""
-        WebDriverWait(driver, 15).until(
-            expect.element_to_be_clickable(locator))
-        sleep(1.0)
+        return cls.test_urls_and_warn(
+            [url], _head=_head, messages=[message], driver=driver)[0].passed
 
     @classmethod
-    def wait_for_overlay_then(cls, target, time=10.0, interval=0.5):
-        """Wait for an overlay to clear then performing the target action."""
-        for _ in range(int(time / interval)):
-            try:
-                target()
-                break
-            except WebDriverException:
-                sleep(interval)
-        sleep(1.0)
-
-
-class Card:
-    """Fake card objects."""
-
-    def __init__(self):
-        """Retrieve card numbers from BTP."""
-        import requests
-        from bs4 import BeautifulSoup
-
-        braintree = (
-            'https://developers.braintreepayments.com/'
-            'reference/general/testing/python'
-        )
-        section_list_selector = 'table:nth-of-type({position}) tbody tr'
-        response = requests.get(braintree)
-        if response.status_code != requests.codes.ok:
-            response.raise_for_status()
-        resp = BeautifulSoup(response.text, 'html.parser')
-        self.options = []
-
-        for card_status in range(Status.VALID, Status.OTHER + 1):
-            for card in resp.select(
-                    section_list_selector.format(position=card_status)):
-                fields = card.select('td')
-                card_processor = (Status.VISA
-                                  if fields[0].text[0] == '4'
-                                  else fields[1].text)
-                if card_processor == Status.AMEX:
-                    cvv = '{:04}'.format(randint(0, 9999))
-                else:
-                    cvv = '{:03}'.format(randint(0, 999))
-                rest = fields[2].text if len(fields) > 2 else ''
-                data = fields[1].text if card_status == Status.OTHER or  \
-                    card_status == Status.TYPED else ''
-                self.options.append({
-                    'number': fields[0].text,
-                    'cvv': cvv,
-                    'type': card_processor,
-                    'status': card_status,
-                    'response': rest,
-                    'data': data,
-                })
-
-    def get_by(self, field=None, state=None, use_list=None):
-        """Return a subset of test cards with a specific type."""
-        _field = field if field else Status.STATUS
-        _state = state if state else Status.VALID
-        _use_list = use_list if use_list else self.options
-        return list(
-            filter(
-                lambda card: card[_field] == _state,
-                _use_list
-            )
-        )
+    def test_urls_and_warn(cls, urls: List[str], _head: bool = True,
+                           messages: List[str] = None,
+                           driver=None) -> List[LinkResult]:
+        """Query a group of URLs concurrently and warn for any failures.
+
+        :param urls: the URLs to check
+        :type urls: list(str)
+        :param bool _head: (optional) start with HEAD requests instead of GET
+        :param messages: (optional) the link descriptions used in warnings;
+            defaults to the URLs
+        :type messages: list(str)
+        :param driver: (optional) the selenium webdriver used to select the
+            request ``User-Agent``
+        :return: the status, latency and attempt count for each URL
+        :rtype: list(:py:class:`~utils.links.LinkResult`)
 
-    def generic(self):
-        """Return a random, valid test card."""
-        cards = self.get_by()
-        return cards[randint(0, len(cards) - 1)]
-
-
-class Status:
-    """Card states."""
+        """
+        browser = (driver.capabilities.get('browserName', '')
+                   if driver else '')
+        results = LinkChecker.shared(browser).check_all(urls, head=_head)
+        for result, message in zip(results, messages or urls):
+            if not result.ok:
+                warn(UserWarning(
+                    '"{article}" returned a {status}'
+                    .format(article=message, status=result.reason)))
+        return results
 
-    STATUS = 'status'
-    VALID = 2
-    NO_VERIFY = 3
-    TYPED = 4
-    OTHER = 5
+    @classmethod
+    def wait_for_overlay(cls, driver, locator, timeout=15.0):
+        """Wait for an overlay to clear making the target available.
 
-    TYPE = 'type'
-    AMEX = 'American Express'
-    DINERS = 'Diners Club'
-    DISCOVER = 'Discover'
-    JCB = 'JCB'
-    MAESTRO = 'Maestro'
-    MC = 'Mastercard'
-    VISA = 'Visa'
+        :param driver: a selenium webdriver
+        :param locator: the target element selector tuple (str, str)
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :returns: the clickable target element
+        :raises TimeoutException: if the target is still covered, hidden,
+            disabled or moving after ``timeout`` seconds
+        """
+        return Wait.for_clickable(driver, locator=locator, timeout=timeout)
 
-    RESPONSE = 'response'
-    DECLINED = 'processor declined'
-    FAILED = 'failed (3000)'
+    @classmethod
+    def wait_for_overlay_then(cls, target, time=10.0, interval=0.5,
+                              driver=None):
+        """Wait for an overlay to clear then performing the target action.
+
+        :param target: a callable action to retry until it succeeds
+        :param float time: (optional) the maximum number of seconds to retry
+        :param float interval: (optional) the initial retry interval
+        :param driver: (optional) a selenium webdriver; when provided, wait
+            for the page to settle after the action succeeds
+        :returns: the target action result
+        """
+        try:
+            result = Wait.for_action(target, timeout=time, poll=interval,
+                                     name='overlay')
+        except TimeoutException:
+            return None
+        if driver:
+            Wait.for_settled(driver)
+        return result
 
 
 def go_to_(destination):
@@ -833,14 +716,93 @@ class Actions(ActionChains):
         return self
 
 
+def _mailing_address(address: dict) -> Tuple[str, ...]:
+    """Return a Salesforce compound address as a tuple."""
+    return (
+        address['street'],
+        address['city'],
+        address.get('stateCode', '') or address['state'],
+        address['postalCode'],
+        address.get('countryCode', '') or address['country'])
+
+
 class Record:
-    """A Salesforce API result record."""
+    """A compact Salesforce API result record.
+
+    Subclasses map each attribute to its Salesforce column (or columns) and
+    an optional converter in ``FIELDS`` and declare matching ``__slots__``.
+    Attributes for columns left out of a projected query are None, except
+    flags converted by ``bool``, which are False.
+
+    """
+
+    __slots__ = ('url', 'id')
+
+    OBJECT = ''
+    CONDITION = ''
+    ORDER = ''
+    FIELDS: Dict[str, Tuple[Union[str, Tuple[str, ...]],
+                            Optional[Callable]]] = {}
 
-    def __init__(self, record: OrderedDict, **kwargs):
-        """Initialize a Salesforce record."""
+    def __init__(self, record: OrderedDict):
+        """Initialize a Salesforce record.
+
+        :param record: a Salesforce API result row
+        :type record: :py:class:`collections.OrderedDict`
+
+        """
         self.url = record['attributes']['url']
-        self.id = record['Account_ID__c']
-        super().__init__(**kwargs)
+        self.id = record.get('Id')
+        for attribute, (column, convert) in self.FIELDS.items():
+            if not isinstance(column, tuple):
+                value = record.get(column)
+            elif any(part in record for part in column):
+                value = tuple(record.get(part) for part in column)
+            else:
+                value = None
+            if convert is bool or (convert and value is not None):
+                value = convert(value)
+            setattr(self, attribute, value)
+
+    @classmethod
+    def columns(cls, fields: Iterable[str] = None) -> List[str]:
+        """Return the Salesforce columns for a set of attributes.
+
+        :param fields: (optional) the record attributes to select; defaults to
+            every attribute
+        :type fields: iterable(str)
+        :return: the column names in query order
+        :rtype: list(str)
+
+        """
+        selected = ['Id']
+        for attribute in fields or cls.FIELDS:
+            column = cls.FIELDS[attribute][0]
+            for part in (column if isinstance(column, tuple) else (column,)):
+                if part not in selected:
+                    selected.append(part)
+        return selected
+
+    @classmethod
+    def soql(cls, fields: Iterable[str] = None) -> str:
+        """Return the SOQL request for the record type.
+
+        :param fields: (optional) the record attributes to select
+        :type fields: iterable(str)
+        :return: the SOQL request
+        :rtype: str
+
+        """
+        query = f'SELECT {",".join(cls.columns(fields))} FROM {cls.OBJECT}'
+        if cls.CONDITION:
+            query = f'{query} WHERE {cls.CONDITION}'
+        if cls.ORDER:
+            query = f'{query} ORDER BY {cls.ORDER}'
+        return query
+
+    def __repr__(self) -> str:
+        """Return the record type and ID."""
+        return f'<{type(self).__name__} {self.id}>'
 
 
 class Salesforce:
@@ -905,123 +867,185 @@ class Salesforce:
 
         """
         self._sf = SF(username=username, password=password, domain=domain)
+        self._size = 0
+        self._records = []
+        self.records = []
         if query:
             self.query(query)
-        else:
-            self._size = 0
-            self._records = []
-            self.records = []
 
-    def query(self, query: str, record_type: Record = None):
-        """Send an SOQL request to Salesforce.
-
-        :param str query: the SOQL request
+    def query(self, query: str = None, record_type: Record = None,
+              fields: Iterable[str] = None):
+        """Send an SOQL request to Salesforce and collect every page.
+
+        :param str query: (optional) the SOQL request; defaults to the record
+            type request
+        :param record_type: (optional) the record class for each result row
+        :type record_type: :py:class:`Record`
+        :param fields: (optional) the record attributes to select when the
+            request is built from the record type
+        :type fields: iterable(str)
         :return: None
 
         """
-        results = self._sf.query(query)
-        self._size = results.get('totalSize', 0)
-        self._records = results.get('records', [])
+        self._records = []
         self.records = []
-        additional_records = results.get('nextRecordUrl', '').split('/')[-1]
-        while additional_records:
-            results = self._sf.query_more(additional_records)
-            self._records = self._records + results.get('records', [])
-            additional_records = (
-                results.get('nextRecordUrl', '').split('/')[-1])
-        if record_type:
-            for record in self._records:
-                self.records.append(record_type(record))
+        for rows, records in self._pages(query, record_type, fields):
+            self._records.extend(rows)
+            self.records.extend(records)
+
+    def pages(self, query: str = None, record_type: Record = None,
+              fields: Iterable[str] = None) -> Iterator[List[Record]]:
+        """Yield the records one page at a time as each page arrives.
+
+        The next page is requested on a background thread while the current
+        page is being consumed.
+
+        :param str query: (optional) the SOQL request; defaults to the record
+            type request
+        :param record_type: (optional) the record class for each result row
+        :type record_type: :py:class:`Record`
+        :param fields: (optional) the record attributes to select when the
+            request is built from the record type
+        :type fields: iterable(str)
+        :return: a generator of record (or raw row) lists
+        :rtype: generator
+
+        """
+        for rows, records in self._pages(query, record_type, fields):
+            yield records if record_type else rows
+
+    def stream(self, query: str = None, record_type: Record = None,
+               fields: Iterable[str] = None) -> Iterator[Record]:
+        """Yield the records one at a time, prefetching the next page.
+
+        :param str query: (optional) the SOQL request; defaults to the record
+            type request
+        :param record_type: (optional) the record class for each result row
+        :type record_type: :py:class:`Record`
+        :param fields: (optional) the record attributes to select when the
+            request is built from the record type
+        :type fields: iterable(str)
+        :return: a generator of records (or raw rows)
+        :rtype: generator
+
+        """
+        for page in self.pages(query, record_type, fields):
+            yield from page
+
+    @property
+    def size(self) -> int:
+        """Return the total number of rows matching the last request."""
+        return self._size
+
+    def _pages(self, query, record_type, fields):
+        """Yield the raw rows and typed records for each result page."""
+        if not query:
+            query = record_type.soql(fields)
+        with ThreadPoolExecutor(max_workers=1,
+                                thread_name_prefix='salesforce') as prefetch:
+            results = self._sf.query(query)
+            self._size = results.get('totalSize', 0)
+            while results:
+                upcoming = None
+                next_page = (results.get('nextRecordsUrl') or
+                             results.get('nextRecordUrl') or
+                             '').split('/')[-1]
+                if next_page and not results.get('done', False):
+                    upcoming = prefetch.submit(self._sf.query_more, next_page)
+                rows = results.get('records', [])
+                records = ([record_type(row) for row in rows]
+                           if record_type else [])
+                yield rows, records
+                results = upcoming.result() if upcoming else None
 
     class Contact(Record):
         """A Salesforce contact."""
 
-        def __init__(self, record: OrderedDict, **kwargs):
-            """Initialize a Salesforce contact record."""
-            super(Record, self).__init__(record=record, **kwargs)
-            self.email_verified = record['Account_Email_verified__c']
-            self.all_emails = record['All_Emails__c']
-            self.books_adopted = record['Books_Adopted__c']
-            self.confirmed_emails = record['Confirmed_Emails__c']
-            self.created_on = record['CreatedDate']
-            self.domain = record['Domain__c']
-            self.donations = record['Donations__c']
-            self.email = record['Email']
-            self.faculty_verified = record['Faculty_Verified__c']
-            self.first_name = record['FirstName']
-            self.from_lead = record['From_Lead__c']
-            self.opt_out = record['HasOptedOutOfEmail']
-            self.adoption_form = record['Has_filled_out_Adoption_Form__c']
-            self.contact_id = record['Id']
-            self.rover_interest = record['Interested_in_Rover__c']
-            self.last_name = record['LastName']
-            self.lead_source = record['LeadSource']
-            address = record['MailingAddress']
-            self.address = (
-                address['street'],
-                address['city'],
-                address.get('stateCode', '') or address['state'],
-                address['postalCode'],
-                address.get('countryCode', '') or address['country'])
-            self.name = record['Name']
-            self.newsletter = record['Newsletter_Opt_Out__c']
-            self.phone = record['Phone']
-            self.position = record['Position__c']
-            self.salutation = record['Salutation']
-            self.school_type = record['School_Type__c']
-            self.school = record['Search_Box__c']
-            self.subjects = record['Subject__c']
-            self.theme = record['Theme__c']
+        OBJECT = 'Contact'
+        CONDITION = "Search_Box__c = 'Automation'"
+        ORDER = 'LastName,FirstName ASC NULLS FIRST'
+        FIELDS = {
+            'email_verified': ('Account_Email_verified__c', None),
+            'all_emails': ('All_Emails__c', None),
+            'books_adopted': ('Books_Adopted__c', None),
+            'confirmed_emails': ('Confirmed_Emails__c', None),
+            'created_on': ('CreatedDate', None),
+            'domain': ('Domain__c', None),
+            'donations': ('Donations__c', None),
+            'email': ('Email', None),
+            'faculty_verified': ('Faculty_Verified__c', None),
+            'first_name': ('FirstName', None),
+            'from_lead': ('From_Lead__c', None),
+            'opt_out': ('HasOptedOutOfEmail', None),
+            'adoption_form': ('Has_filled_out_Adoption_Form__c', None),
+            'contact_id': ('Id', None),
+            'rover_interest': ('Interested_in_Rover__c', None),
+            'last_name': ('LastName', None),
+            'lead_source': ('LeadSource', None),
+            'address': ('MailingAddress', _mailing_address),
+            'name': ('Name', None),
+            'newsletter': ('Newsletter_Opt_Out__c', None),
+            'phone': ('Phone', None),
+            'position': ('Position__c', None),
+            'salutation': ('Salutation', None),
+            'school_type': ('School_Type__c', None),
+            'school': ('Search_Box__c', None),
+            'subjects': ('Subject__c', None),
+            'theme': ('Theme__c', None),
+        }
+        __slots__ = tuple(FIELDS)
 
     class Lead(Record):
         """A Salesforce lead."""
 
-        def __init__(self, record: OrderedDict, **kwargs):
-            """Initialize a Salesforce lead record."""
-            super(Record, self).__init__(record=record, **kwargs)
-            self.adoption_status = record['Adoption_Status__c']
-            self.books = record['Book__c']
-            self.confirmed = bool(record['Complete__c'])
-            self.confirmed_date = record['Confirmed_Date__c']
-            self.created_on = record['CreatedDate']
-            self.email = record['Email']
-            self.faculty_website = record['Faculty_Website__c']
-            self.first_name = record['FirstName']
-            self.opt_out = record['HasOptedOutOfEmail']
-            self.how_did_you_hear = record['How_did_you_Hear__c']
-            self.lead_id = record['Id']
-            self.last_name = record['LastName']
-            self.lead_source = record['LeadSource']
-            self.name = record['Name']
-            self.newsletter = record['Newsletter_Opt_In__c']
-            self.students = int(record['Number_of_Students__c'])
-            self.partner_interest = (str(
-                record['Partner_Category_Interest__c']).split(';'))
-            self.other_partner_interest = record['Partner_Interest_Other__c']
-            self.phone = record['Phone']
-            self.reject_reason = record['Reject_Reason__c']
-            self.role = record['Role__c']
-            self.school = record['School__c']
-            self.lead_status = record['Status']
-            self.subjects = record['Subject__c']
-            self.website = record['Website']
+        OBJECT = 'Lead'
+        CONDITION = "Company='Automation'"
+        ORDER = 'LastName,FirstName ASC NULLS FIRST'
+        FIELDS = {
+            'adoption_status': ('Adoption_Status__c', None),
+            'books': ('Book__c', None),
+            'confirmed': ('Complete__c', bool),
+            'confirmed_date': ('Confirmed_Date__c', None),
+            'created_on': ('CreatedDate', None),
+            'email': ('Email', None),
+            'faculty_website': ('Faculty_Website__c', None),
+            'first_name': ('FirstName', None),
+            'opt_out': ('HasOptedOutOfEmail', None),
+            'how_did_you_hear': ('How_did_you_Hear__c', None),
+            'lead_id': ('Id', None),
+            'last_name': ('LastName', None),
+            'lead_source': ('LeadSource', None),
+            'name': ('Name', None),
+            'newsletter': ('Newsletter_Opt_In__c', None),
+            'students': ('Number_of_Students__c', int),
+            'partner_interest': ('Partner_Category_Interest__c',
+                                 lambda interest: str(interest).split(';')),
+            'other_partner_interest': ('Partner_Interest_Other__c', None),
+            'phone': ('Phone', None),
+            'reject_reason': ('Reject_Reason__c', None),
+            'role': ('Role__c', None),
+            'school': ('School__c', None),
+            'lead_status': ('Status', None),
+            'subjects': ('Subject__c', None),
+            'website': ('Website', None),
+        }
+        __slots__ = tuple(FIELDS)
 
     class Organization(Record):
         """A Salesforce organization."""
 
-        def __init__(self, record: OrderedDict, **kwargs):
-            """Initialize a Salesforce organization record."""
-            super(Record, self).__init__(record=record, **kwargs)
-            self.address = (record['BillingStreet'],
-                            record['BillingCity'],
-                            record['BillingStateCode'],
-                            record['BillingPostalCode'])
-            self.adoptions = record['Number_of_Adoptions__c']
-            self.created = record['CreatedDate']
-            self.description = record['Description']
-            self.html_name = record['HTML_Name__c']
-            self.modified = record['LastModifiedDate']
-            self.name = record['Name']
-            self.phone = record['Phone']
-            self.type = record['Type']
-            self.website = record['Website']
+        OBJECT = 'Account'
+        FIELDS = {
+            'address': (('BillingStreet', 'BillingCity', 'BillingStateCode',
+                         'BillingPostalCode'), None),
+            'adoptions': ('Number_of_Adoptions__c', None),
+            'created': ('CreatedDate', None),
+            'description': ('Description', None),
+            'html_name': ('HTML_Name__c', None),
+            'modified': ('LastModifiedDate', None),
+            'name': ('Name', None),
+            'phone': ('Phone', None),
+            'type': ('Type', None),
+            'website': ('Website', None),
+        }
+        __slots__ = tuple(FIELDS)
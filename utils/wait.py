@@ -0,0 +1,470 @@
+"""An adaptive, condition-based wait engine for page objects.
+
+Page objects historically paused for a fixed number of seconds after most
+interactions. :py:class:`Wait` replaces those pauses with polling against a
+condition (DOM quiescence, network idle, a stable or clickable element, or
+any callable) and returns as soon as the condition holds. Every wait is
+timed and kept in :py:attr:`Wait.history` so slow page objects are easy to
+find.
+
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Union
+from warnings import warn
+
+from selenium.common.exceptions import (StaleElementReferenceException,  # NOQA
+                                        TimeoutException,  # NOQA
+                                        WebDriverException)  # NOQA
+from selenium.webdriver.remote.webelement import WebElement
+
+Selector = Tuple[str, str]
+
+# -------------------------------------------------------- #
+# Javascript page requests
+# -------------------------------------------------------- #
+
+# install a mutation observer and an XMLHttpRequest/fetch counter (once per
+# document) and return the ready state, the current time, the last DOM
+# mutation time, the number of pending requests and the last request time
+ACTIVITY = '''
+var state = window.__osWait;
+if (!state) {
+  state = window.__osWait = {
+    mutation: performance.now(), pending: 0, request: performance.now()};
+  new MutationObserver(function() { state.mutation = performance.now(); })
+    .observe(document.documentElement, {
+      attributes: true, characterData: true, childList: true, subtree: true});
+  var done = function() {
+    state.pending = Math.max(0, state.pending - 1);
+    state.request = performance.now(); };
+  var start = function() {
+    state.pending++;
+    state.request = performance.now(); };
+  var send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function() {
+    start();
+    this.addEventListener('loadend', done);
+    return send.apply(this, arguments); };
+  if (window.fetch) {
+    var fetch = window.fetch;
+    window.fetch = function() {
+      start();
+      return fetch.apply(this, arguments).then(
+        function(response) { done(); return response; },
+        function(error) { done(); throw error; }); };
+  }
+}
+return [document.readyState, performance.now(), state.mutation,
+        state.pending, state.request];
+'''
+
+# return the element box and whether the element center is covered by
+# another element (an overlay, modal backdrop or loading screen)
+GEOMETRY = '''
+var element = arguments[0];
+if (!element || !element.isConnected) { return null; }
+var box = element.getBoundingClientRect();
+var x = box.left + box.width / 2;
+var y = box.top + box.height / 2;
+var covered = false;
+if (x >= 0 && y >= 0 &&
+    x <= document.documentElement.clientWidth &&
+    y <= document.documentElement.clientHeight) {
+  var top = document.elementFromPoint(x, y);
+  covered = !!top && top !== element && !element.contains(top);
+}
+return [box.left, box.top, box.width, box.height, covered,
+        !element.disabled];
+'''
+
+
+class WaitRecord(NamedTuple):
+    """A single completed wait."""
+
+    name: str
+    caller: str
+    elapsed: float
+    satisfied: bool
+
+
+class Wait:
+    """Condition-based waits that return as soon as the condition holds."""
+
+    # the default upper limit, in seconds, for a single wait
+    TIMEOUT = 15.0
+    # the default upper limit for required DOM and network activity waits;
+    # pages with animations or polling never go fully quiet so give up sooner
+    SETTLE_TIMEOUT = 5.0
+    # the default upper limit for optional activity waits, no longer than the
+    # longest fixed pause they replaced
+    QUIET_TIMEOUT = 1.0
+    # the first and largest polling intervals, in seconds
+    POLL = 0.05
+    MAX_POLL = 0.5
+    # the polling interval growth rate between unsuccessful checks
+    BACKOFF = 1.5
+
+    # the number of completed waits retained for reporting
+    HISTORY_SIZE = 5000
+    history = deque(maxlen=HISTORY_SIZE)
+
+    IGNORED = (StaleElementReferenceException, WebDriverException)
+
+    @classmethod
+    def until(cls, condition: Callable[[], Any],
+              timeout: float = None,
+              poll: float = None,
+              name: str = None,
+              ignored: Tuple[Exception] = None,
+              required: bool = True,
+              message: str = '') -> Any:
+        """Poll a condition until it returns a truthy value.
+
+        The polling interval starts at ``poll`` and grows by
+        :py:attr:`BACKOFF` after each unsuccessful check up to
+        :py:attr:`MAX_POLL`, so short waits stay fast and long waits don't
+        flood the driver.
+
+        :param condition: a callable taking no arguments
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param float poll: (optional) the initial polling interval in seconds
+        :param str name: (optional) the wait name used in the history
+        :param ignored: (optional) exceptions treated as an unsatisfied check
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            condition is never met, otherwise return the last value
+        :param str message: (optional) a timeout exception message
+        :return: the first truthy value returned by the condition
+        :rtype: Any
+        :raises: :py:class:`~selenium.common.exceptions.TimeoutException` if
+            ``required`` and the condition is not met within ``timeout``
+
+        """
+        timeout = cls.TIMEOUT if timeout is None else timeout
+        interval = cls.POLL if poll is None else poll
+        ignored = cls.IGNORED if ignored is None else ignored
+        name = name or getattr(condition, '__name__', 'condition')
+        start = monotonic()
+        end = start + timeout
+        value = None
+        while True:
+            try:
+                value = condition()
+                if value:
+                    cls._record(name, start, True)
+                    return value
+            except ignored:
+                pass
+            remaining = end - monotonic()
+            if remaining <= 0:
+                break
+            sleep(min(interval, remaining))
+            interval = min(interval * cls.BACKOFF, cls.MAX_POLL)
+        cls._record(name, start, False)
+        if required:
+            raise TimeoutException(
+                message or f'{name} not met after {timeout} seconds')
+        return value
+
+    @classmethod
+    def for_action(cls, action: Callable[[], Any],
+                   timeout: float = None,
+                   poll: float = None,
+                   name: str = None) -> Any:
+        """Retry an action until it no longer raises a WebDriver error.
+
+        :param action: a callable taking no arguments
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param float poll: (optional) the initial polling interval in seconds
+        :param str name: (optional) the wait name used in the history
+        :return: the action result
+        :rtype: Any
+        :raises: :py:class:`~selenium.common.exceptions.TimeoutException` if
+            the action fails for the entire ``timeout``
+
+        """
+        result = []
+
+        def attempt():
+            result.append(action())
+            return True
+
+        cls.until(attempt, timeout=timeout, poll=poll,
+                  name=name or getattr(action, '__name__', 'action'))
+        return result[-1]
+
+    @classmethod
+    def for_ready(cls, driver, timeout: float = None) -> bool:
+        """Wait for the document to finish loading.
+
+        :param driver: a selenium webdriver
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :return: ``True`` when the document ready state is ``complete``
+        :rtype: bool
+
+        """
+        return cls.until(
+            lambda: driver.execute_script(
+                'return document.readyState;') == 'complete',
+            timeout=timeout, name='ready')
+
+    @classmethod
+    def for_dom_quiet(cls, driver, quiet: float = 0.25,
+                      timeout: float = None, required: bool = False) -> bool:
+        """Wait until the DOM stops changing.
+
+        Quiet time is measured from the start of the wait so a render
+        triggered by the previous action is never missed.
+
+        :param driver: a selenium webdriver
+        :param float quiet: (optional) the number of seconds without a DOM
+            mutation that counts as quiet
+        :param float timeout: (optional) the maximum number of seconds to
+            wait; defaults to :py:attr:`QUIET_TIMEOUT`, or
+            :py:attr:`SETTLE_TIMEOUT` when required
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            DOM never settles; busy pages (animations, tickers) never go
+            quiet so the default is to warn and continue after the timeout
+        :return: ``True`` if the DOM went quiet within the timeout
+        :rtype: bool
+
+        """
+        return cls._activity_wait(driver, quiet, timeout, required,
+                                  dom=True, network=False)
+
+    @classmethod
+    def for_network_idle(cls, driver, idle: float = 0.5,
+                         timeout: float = None,
+                         required: bool = False) -> bool:
+        """Wait until there are no pending XHR or fetch requests.
+
+        The request hook is installed on the first call for each document so
+        requests started before then are not counted.
+
+        :param driver: a selenium webdriver
+        :param float idle: (optional) the number of seconds without request
+            activity that counts as idle
+        :param float timeout: (optional) the maximum number of seconds to
+            wait; defaults to :py:attr:`QUIET_TIMEOUT`, or
+            :py:attr:`SETTLE_TIMEOUT` when required
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            network never goes idle
+        :return: ``True`` if the network went idle within the timeout
+        :rtype: bool
+
+        """
+        return cls._activity_wait(driver, idle, timeout, required,
+                                  dom=False, network=True)
+
+    @classmethod
+    def for_settled(cls, driver, quiet: float = 0.25,
+                    timeout: float = None, required: bool = False) -> bool:
+        """Wait for both the network and the DOM to settle.
+
+        Use after an action that triggers a request and a re-render, the
+        usual reason page objects slept for a second.
+
+        :param driver: a selenium webdriver
+        :param float quiet: (optional) the number of seconds of inactivity
+            that counts as settled
+        :param float timeout: (optional) the maximum number of seconds to
+            wait; defaults to :py:attr:`QUIET_TIMEOUT`, or
+            :py:attr:`SETTLE_TIMEOUT` when required
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            page never settles
+        :return: ``True`` if the page settled within the timeout
+        :rtype: bool
+
+        """
+        return cls._activity_wait(driver, quiet, timeout, required,
+                                  dom=True, network=True)
+
+    @classmethod
+    def for_stable(cls, driver, locator: Selector = None,
+                   element: WebElement = None, timeout: float = None,
+                   required: bool = True) -> WebElement:
+        """Wait for an element to stop moving or resizing.
+
+        :param driver: a selenium webdriver
+        :param locator: (optional) an element selector tuple
+        :param element: (optional) a webelement
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            element never settles
+        :return: the stable element
+        :rtype: :py:class:`~selenium.webdriver.remote.webelement.WebElement`
+
+        """
+        return cls._geometry_wait(driver, locator, element, timeout,
+                                  clickable=False, required=required)
+
+    @classmethod
+    def for_clickable(cls, driver, locator: Selector = None,
+                      element: WebElement = None, timeout: float = None,
+                      required: bool = True) -> WebElement:
+        """Wait for an element to be displayed, enabled, stable and uncovered.
+
+        :param driver: a selenium webdriver
+        :param locator: (optional) an element selector tuple
+        :param element: (optional) a webelement
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            element never becomes clickable
+        :return: the clickable element
+        :rtype: :py:class:`~selenium.webdriver.remote.webelement.WebElement`
+
+        """
+        return cls._geometry_wait(driver, locator, element, timeout,
+                                  clickable=True, required=required)
+
+    @classmethod
+    def for_gone(cls, driver, selector: str, timeout: float = None,
+                 required: bool = True) -> bool:
+        """Wait for every element matching a CSS selector to be removed.
+
+        :param driver: a selenium webdriver
+        :param str selector: a CSS selector (loading animations, overlays)
+        :param float timeout: (optional) the maximum number of seconds to wait
+        :param bool required: (optional) raise a ``TimeoutException`` if the
+            element is still found after the timeout
+        :return: ``True`` when the element is not found
+        :rtype: bool
+
+        """
+        script = f'return document.querySelector("{selector}") == null;'
+        return bool(cls.until(lambda: driver.execute_script(script),
+                              timeout=timeout, required=required,
+                              name=f'gone {selector}'))
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Aggregate the wait history by wait name.
+
+        :return: the count, total, maximum and timeout count per wait name
+        :rtype: dict(str, dict(str, int or float))
+
+        """
+        totals = {}
+        for record in cls.history:
+            entry = totals.setdefault(
+                record.name,
+                {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['total'] += record.elapsed
+            entry['max'] = max(entry['max'], record.elapsed)
+            entry['timeouts'] += 0 if record.satisfied else 1
+        return totals
+
+    @classmethod
+    def slowest(cls, count: int = 10) -> List[WaitRecord]:
+        """Return the longest waits in the history.
+
+        :param int count: (optional) the number of records to return
+        :return: the slowest waits, longest first
+        :rtype: list(:py:class:`WaitRecord`)
+
+        """
+        return sorted(cls.history, key=lambda record: record.elapsed,
+                      reverse=True)[:count]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clear the wait history.
+
+        :return: None
+
+        """
+        cls.history.clear()
+
+    @classmethod
+    def _activity_wait(cls, driver, quiet, timeout, required, dom, network):
+        """Poll the page activity hooks until the page has been quiet."""
+        threshold = quiet * 1000
+        if timeout is None:
+            timeout = cls.SETTLE_TIMEOUT if required else cls.QUIET_TIMEOUT
+        begin = []
+
+        def quiet_page():
+            ready, now, mutation, pending, request = \
+                driver.execute_script(ACTIVITY)
+            if not begin:
+                begin.append(now)
+            if ready != 'complete' or (network and pending):
+                return False
+            last = begin[0]
+            if dom:
+                last = max(last, mutation)
+            if network:
+                last = max(last, request)
+            return now - last >= threshold
+
+        name = ('settled' if dom and network else
+                'dom quiet' if dom else 'network idle')
+        settled = bool(cls.until(quiet_page, timeout=timeout,
+                                 required=required,
+                                 poll=min(quiet, cls.POLL), name=name))
+        if not settled:
+            warn(UserWarning(f'{name} not reached after {timeout} seconds '
+                             f'in {cls._caller()}; continuing'))
+        return settled
+
+    @classmethod
+    def _geometry_wait(cls, driver, locator, element, timeout,
+                       clickable, required):
+        """Poll an element box until it holds still between two checks."""
+        if locator is None and element is None:
+            raise ValueError('A locator or an element is required')
+        previous = []
+        found = [element]
+
+        def settled():
+            target = found[0]
+            if target is None:
+                target = found[0] = driver.find_element(*locator)
+            try:
+                geometry = driver.execute_script(GEOMETRY, target)
+            except StaleElementReferenceException:
+                if not locator:
+                    raise
+                found[0] = None
+                return False
+            if not geometry:
+                return False
+            box, covered, enabled = geometry[:4], geometry[4], geometry[5]
+            moved = box != (previous[0] if previous else None)
+            previous[:] = [box]
+            if moved or not box[2] or not box[3]:
+                return False
+            if clickable and (covered or not enabled):
+                return False
+            return target
+
+        name = 'clickable' if clickable else 'stable'
+        if locator:
+            name = f'{name} {locator[1]}'
+        return cls.until(settled, timeout=timeout, required=required,
+                         name=name)
+
+    @classmethod
+    def _record(cls, name: str, start: float, satisfied: bool) -> None:
+        """Append a completed wait to the history."""
+        cls.history.append(WaitRecord(
+            name, cls._caller(), monotonic() - start, satisfied))
+
+    @classmethod
+    def _caller(cls) -> str:
+        """Return the first calling function outside of the wait engine."""
+        frame = sys._getframe(1)
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if not frame:
+            return ''
+        owner = frame.f_locals.get('self', frame.f_locals.get('cls'))
+        if owner is not None:
+            owner = owner if isinstance(owner, type) else type(owner)
+            return f'{owner.__qualname__}.{frame.f_code.co_name}'
+        return frame.f_code.co_name
@@ -1,6 +1,7 @@
 """OpenStax Web globals."""
 
 import re
+from types import MappingProxyType
 
 from selenium.common.exceptions import WebDriverException
 
@@ -735,9 +736,22 @@ class Library():
 
     OLD_EDITIONS = []
 
+    _index = None
+
     def __init__(self):
-        """Initialize the library."""
-        self._books = {
+        """Initialize the library from the shared book index.
+
+        The book records and lookup indexes are built once, on first use,
+        and shared (read-only) by every ``Library`` instance.
+
+        """
+        if Library._index is None:
+            Library._index = _LibraryIndex(self, self._catalog())
+        self._books = Library._index.books
+
+    def _catalog(self):
+        """Return the raw book records."""
+        return {
 
             # Business
             self.ACCOUNTING_1: {
@@ -1660,8 +1674,7 @@ class Library():
     @property
     def ap(self):
         """Return the AP books."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.IS_AP)]
+        return self._records(self._index.flag(self.IS_AP))
 
     @property
     def available(self):
@@ -1670,17 +1683,12 @@ class Library():
         Not pre-release
 
         """
-        return [(book, self.get(book))
-                for book
-                in self.books
-                if (not self.get(book, self.PRE_RELEASE) and
-                    self.get(book, self.LANGUAGE) == self.ENGLISH)]
+        return self._records(self._index.available)
 
     @property
     def bookshare(self):
         """Return the books available through Bookshare."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.BOOKSHARE)]
+        return self._records(self._index.flag(self.BOOKSHARE))
 
     @property
     def business(self):
@@ -1690,8 +1698,7 @@ class Library():
     @property
     def chegg(self):
         """Return the books available through Chegg."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.CHEGG)]
+        return self._records(self._index.flag(self.CHEGG))
 
     @property
     def college_success(self):
@@ -1701,26 +1708,28 @@ class Library():
     @property
     def coming_soon(self):
         """Return the pre-release books."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.PRE_RELEASE)]
+        return self._records(self._index.flag(self.PRE_RELEASE))
 
     @property
     def comp_copy(self):
         """Return books with available complimentary copies."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.COMP_COPY)]
+        return self._records(self._index.flag(self.COMP_COPY))
 
     @property
     def current(self):
         """Return the current edition of each book."""
-        return [(book, self.get(book)) for book in self.books
-                if book not in self.OLD_EDITIONS]
+        return self._records(self._index.current)
 
     @property
     def essentials(self):
         """Return the essentials books."""
         return self.get_by_category(self.ESSENTIALS)
 
+    @property
+    def high_school(self):
+        """Return the high school books."""
+        return self.get_by_category(self.HIGH_SCHOOL)
+
     @property
     def humanities(self):
         """Return the humanities books."""
@@ -1729,32 +1738,27 @@ class Library():
     @property
     def itunes(self):
         """Return the books available through iTunes."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.ITUNES)]
+        return self._records(self._index.flag(self.ITUNES))
 
     @property
     def katalyst(self):
         """Return the Katalyst-modified books."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.LANGUAGE) == self.POLISH]
+        return self._records(self._index.language(self.POLISH))
 
     @property
     def kindle(self):
         """Return the books available through Amazon ebooks."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.KINDLE)]
+        return self._records(self._index.flag(self.KINDLE))
 
     @property
     def locked_instructor(self):
         """Return the books with locked instructor resources."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.HAS_I_LOCK)]
+        return self._records(self._index.flag(self.HAS_I_LOCK))
 
     @property
     def locked_student(self):
         """Return the books with locked student resources."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.HAS_S_LOCK)]
+        return self._records(self._index.flag(self.HAS_S_LOCK))
 
     @property
     def math(self):
@@ -1764,14 +1768,12 @@ class Library():
     @property
     def openstax(self):
         """Return the OpenStax books."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.LANGUAGE) == self.ENGLISH]
+        return self._records(self._index.language(self.ENGLISH))
 
     @property
     def print(self):
         """Return the books offering a print edition."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.PRINT_COPY)]
+        return self._records(self._index.flag(self.PRINT_COPY))
 
     @property
     def science(self):
@@ -1781,8 +1783,7 @@ class Library():
     @property
     def short_names(self):
         """Return a unique list of short names in use."""
-        return list(set([self.get(book, self.SHORT_NAME) for book in self.books
-                        if self.get(book, self.SHORT_NAME)]))
+        return list(self._index.short_names)
 
     @property
     def social_sciences(self):
@@ -1792,56 +1793,46 @@ class Library():
     @property
     def superseded(self):
         """Return older books with a newer version available."""
-        return [(book, self.get(book)) for book in self.books
-                if book in self.OLD_EDITIONS]
+        return self._records(self._index.superseded)
 
     @property
     def unlocked_instructor(self):
         """Return the books with unlocked instructor resources."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.HAS_I_UNLOCK)]
+        return self._records(self._index.flag(self.HAS_I_UNLOCK))
 
     @property
     def unlocked_student(self):
         """Return the books with unlocked student resources."""
-        return [(book, self.get(book)) for book in self.books
-                if self.get(book, self.HAS_S_UNLOCK)]
+        return self._records(self._index.flag(self.HAS_S_UNLOCK))
 
     def book_passthrough(self, using):
         """Return the Subjects book name and form append for a book set."""
         return [(book, self.get(book, self.INTEREST)) for book in using]
 
     def get(self, book, field=None):
-        """Return the field or fields for a specific book."""
-        alts = {self.ANATOMY_PHYS_ALT: self.ANATOMY_PHYS,
-                self.AP_PHYS_ALT: self.AP_PHYS,
-                self.AP_PHYS_ALT_2: self.AP_PHYS,
-                self.AP_BIO_ALT: self.AP_BIO,
-                self.ACCOUNTING_1_ALT: self.ACCOUNTING_1,
-                self.ACCOUNTING_2_ALT: self.ACCOUNTING_2,
-                self.MANAGEMENT_ALT: self.MANAGEMENT,
-                self.U_PHYS_ALT: self.U_PHYS_1, }
-
-        if book in alts:  # Is the book using an altered title?
-            return_book = self.books.get(alts[book])
-        else:  # Try to get the book information
-            return_book = self.books.get(book)
-        if return_book is None:  # Retrieval failed; is it a second edition?
-            return_book = self.books.get(book + ' 2e')
-        if return_book is None:  # Drop the registered trademark?
-            return_book = self.books.get(book.replace('®', ''))
-        if return_book is None:  # Retrieval failed; not a second edition...
+        """Return the field or fields for a specific book.
+
+        Altered titles (``_ALT``), titles missing a ' 2e' edition suffix and
+        titles with or without the registered trademark resolve to the
+        library book.
+
+        """
+        title = self._index.title(book)
+        if title is None:
             raise WebException(f'{book} not found in the library')
 
         # Book found...
         if field:  # return the requested field value.
-            return return_book.get(field)
-        return return_book  # return all of the book's field values.
+            return self._books[title].get(field)
+        return self._books[title]  # return all of the book's field values.
 
     def get_by_category(self, category):
         """Return the books within a specific category."""
-        return [(book, self.get(book)) for book in self.books
-                if category in self.get(book, self.CATEGORY)]
+        return self._records(self._index.category(category))
+
+    def get_by_short_name(self, short_name):
+        """Return the books using a specific short name."""
+        return self._records(self._index.short_name(short_name))
 
     def get_name_set(self, book=None):
         """Return the name set for a book.
@@ -1850,10 +1841,11 @@ class Library():
             (book record, book short name, book full name, book details append)
 
         """
-        using = (self.get(book) if book else
-                 self.random_book(short_name=False))
-        if isinstance(using, list):
-            using = using[0][1]
+        if book:
+            using = self.get(book)
+        else:
+            book = Utility.random_set(self._index.available, 1)[0]
+            using = self._books[book]
         return (using,
                 using.get(self.SHORT_NAME),
                 book,
@@ -1869,13 +1861,128 @@ class Library():
         if short_name and not full_name:
             return Utility.random_set(self.short_names, number)
         if full_name:
-            group = Utility.random_set(self.openstax, number)
-            names = []
-            for book in group:
-                names.append(book[0])
+            names = Utility.random_set(
+                list(self._index.language(self.ENGLISH)), number)
             return names[0] if len(names) == 1 else names
         return Utility.random_set(self.available, number)
 
+    def _records(self, titles):
+        """Return (title, book record) pairs for a group of titles."""
+        return [(title, self._books[title]) for title in titles]
+
+
+class _LibraryIndex(object):
+    """Immutable lookup tables for the library books.
+
+    Built once from the raw book records: the records themselves become
+    read-only mappings, each category, boolean flag, language and short name
+    maps to a tuple of titles, and every accepted spelling of a title maps
+    to the library title.
+
+    """
+
+    __slots__ = ('books', 'available', 'current', 'superseded', 'short_names',
+                 '_aliases', '_categories', '_flags', '_languages',
+                 '_short_names')
+
+    def __init__(self, library, catalog):
+        """Build the indexes.
+
+        :param library: a library, used for its field and title constants
+        :type library: :py:class:`Library`
+        :param dict catalog: the raw book records keyed by title
+        :return: None
+
+        """
+        books = {}
+        categories = {}
+        flags = {}
+        languages = {}
+        short_names = {}
+        for title, record in catalog.items():
+            record = dict(record)
+            record[library.CATEGORY] = tuple(record.get(library.CATEGORY, ()))
+            books[title] = MappingProxyType(record)
+            for category in record[library.CATEGORY]:
+                categories.setdefault(category, []).append(title)
+            for field, value in record.items():
+                if value is True:
+                    flags.setdefault(field, []).append(title)
+            languages.setdefault(
+                record.get(library.LANGUAGE), []).append(title)
+            if record.get(library.SHORT_NAME):
+                short_names.setdefault(
+                    record.get(library.SHORT_NAME), []).append(title)
+
+        def freeze(index):
+            return MappingProxyType(
+                {key: tuple(titles) for key, titles in index.items()})
+
+        self.books = MappingProxyType(books)
+        self._categories = freeze(categories)
+        self._flags = freeze(flags)
+        self._languages = freeze(languages)
+        self._short_names = freeze(short_names)
+        self.short_names = tuple(sorted(short_names))
+        self.available = tuple(
+            title for title in self._languages.get(library.ENGLISH, ())
+            if not books[title].get(library.PRE_RELEASE))
+        self.current = tuple(title for title in books
+                             if title not in library.OLD_EDITIONS)
+        self.superseded = tuple(title for title in books
+                                if title in library.OLD_EDITIONS)
+
+        # the lookup order matches the original title resolution: the exact
+        # title, then a second edition, then the title without the ®, with
+        # the altered titles taking precedence over all of them
+        aliases = {}
+        for title in books:
+            aliases[title] = title
+        for title in books:
+            if title.endswith(' 2e'):
+                aliases.setdefault(title[:-3], title)
+        for title in books:
+            aliases.setdefault(_normalize_title(title), title)
+        alternates = {
+            library.ANATOMY_PHYS_ALT: library.ANATOMY_PHYS,
+            library.AP_PHYS_ALT: library.AP_PHYS,
+            library.AP_PHYS_ALT_2: library.AP_PHYS,
+            library.AP_BIO_ALT: library.AP_BIO,
+            library.ACCOUNTING_1_ALT: library.ACCOUNTING_1,
+            library.ACCOUNTING_2_ALT: library.ACCOUNTING_2,
+            library.MANAGEMENT_ALT: library.MANAGEMENT,
+            library.U_PHYS_ALT: library.U_PHYS_1, }
+        aliases.update(alternates)
+        self._aliases = MappingProxyType(aliases)
+
+    def title(self, book):
+        """Return the library title for a book name or None."""
+        title = self._aliases.get(book)
+        if title is None:
+            title = self._aliases.get(_normalize_title(book))
+        return title
+
+    def category(self, category):
+        """Return the titles within a category."""
+        return self._categories.get(category, ())
+
+    def flag(self, field):
+        """Return the titles with a true boolean field."""
+        return self._flags.get(field, ())
+
+    def language(self, language):
+        """Return the titles written in a language."""
+        return self._languages.get(language, ())
+
+    def short_name(self, short_name):
+        """Return the titles using a short name."""
+        return self._short_names.get(short_name, ())
+
+
+def _normalize_title(title):
+    """Return a book title without the registered trademark symbol."""
+    return title.replace('®', '')
+
 
 class WebException(WebDriverException):
     """A generic exception for the OpenStax website."""